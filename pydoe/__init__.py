@@ -49,26 +49,35 @@ from .mixture import (
     simplex_lattice_design,
 )
 from .optimal import (
+    CandidateSet,
+    PolynomialModel,
     a_efficiency,
     a_optimality,
+    approximate_design,
+    blocked_design,
     build_design_matrix,
     build_uniform_moment_matrix,
     c_optimality,
+    coordinate_exchange,
     criterion_value,
+    criterion_value_batch,
     d_efficiency,
     d_optimality,
     detmax,
     e_optimality,
+    efficient_rounding,
     fedorov,
     g_optimality,
     generate_candidate_set,
     i_optimality,
     information_matrix,
+    iter_candidate_set,
     modified_fedorov,
     optimal_design,
     s_optimality,
     sequential_dykstra,
     simple_exchange_wynn_mitchell,
+    split_plot_design,
     t_optimality,
     v_optimality,
 )
@@ -104,6 +113,7 @@ from .space_filling.quasi_random import (
 )
 from .space_filling.stochastic import (
     lhs,
+    lhs_stream,
     maximin_design,
     maxpro_design,
     minimax_design,
@@ -131,21 +141,27 @@ except PackageNotFoundError:
     __version__ = "unknown"
 
 __all__ = [
+    "CandidateSet",
     "GaussianProcessRegressor",
+    "PolynomialModel",
     "TaguchiObjective",
     "a_efficiency",
     "a_optimality",
     "alias_vector_indices",
+    "approximate_design",
     "bbdesign",
     "block_ccdesign",
     "block_full_factorial",
+    "blocked_design",
     "build_design_matrix",
     "build_uniform_moment_matrix",
     "c_optimality",
     "ccdesign",
     "compute_snr",
+    "coordinate_exchange",
     "cranley_patterson_shift",
     "criterion_value",
+    "criterion_value_batch",
     "d_efficiency",
     "d_optimality",
     "definitive_screening_design",
@@ -154,6 +170,7 @@ __all__ = [
     "doehlert_shell_design",
     "doehlert_simplex_design",
     "e_optimality",
+    "efficient_rounding",
     "expected_improvement",
     "extreme_vertices_design",
     "faure_sequence",
@@ -176,10 +193,12 @@ __all__ = [
     "i_optimality",
     "iman_conover",
     "information_matrix",
+    "iter_candidate_set",
     "john_three_quarter_design",
     "korobov_sequence",
     "latin_square",
     "lhs",
+    "lhs_stream",
     "list_orthogonal_arrays",
     "maximin_design",
     "maxpro_design",
@@ -211,6 +230,7 @@ __all__ = [
     "small_composite_design",
     "sobol_sequence",
     "sparse_grid_dimension",
+    "split_plot_design",
     "star",
     "sukharev_grid",
     "supersaturated_design",
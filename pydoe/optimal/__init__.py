@@ -9,6 +9,9 @@ Main Functions:
 --------------
 optimal_design : Generate optimal designs
 generate_candidate_set : Generate candidate points for design space
+iter_candidate_set : Generate candidate points in blocks of bounded size
+CandidateSet : Candidate points with their model matrices, built once
+PolynomialModel : Compiled polynomial model with custom terms
 
 Algorithms:
 ----------
@@ -17,6 +20,9 @@ Algorithms:
 - Fedorov
 - Modified Fedorov
 - DETMAX
+- Coordinate exchange (Meyer-Nachtsheim)
+- Approximate designs (multiplicative, vertex direction)
+- Blocked and split-plot exchange
 
 Optimality Criteria:
 -------------------
@@ -54,12 +60,15 @@ Examples
 """
 
 from .algorithms import (
+    coordinate_exchange,
     detmax,
     fedorov,
     modified_fedorov,
     sequential_dykstra,
     simple_exchange_wynn_mitchell,
 )
+from .approximate import approximate_design, efficient_rounding
+from .blocked import blocked_design, split_plot_design
 from .criterion import (
     a_optimality,
     c_optimality,
@@ -73,36 +82,47 @@ from .criterion import (
 )
 from .efficiency import a_efficiency, d_efficiency
 from .model import (
+    CandidateSet,
+    PolynomialModel,
     build_design_matrix,
     build_uniform_moment_matrix,
     generate_candidate_set,
+    iter_candidate_set,
 )
 from .optimal import optimal_design
-from .utils import criterion_value, information_matrix
+from .utils import criterion_value, criterion_value_batch, information_matrix
 
 
 __author__ = "Saud Zahir"
 
 __all__ = [
+    "CandidateSet",
+    "PolynomialModel",
     "a_efficiency",
     "a_optimality",
+    "approximate_design",
     # Model building
+    "blocked_design",
     "build_design_matrix",
     "build_uniform_moment_matrix",
     "c_optimality",
+    "coordinate_exchange",
     "criterion_value",
+    "criterion_value_batch",
     # Efficiency measures
     "d_efficiency",
     # Optimality criteria
     "d_optimality",
     "detmax",
     "e_optimality",
+    "efficient_rounding",
     "fedorov",
     "g_optimality",
     "generate_candidate_set",
     "i_optimality",
     # Utilities
     "information_matrix",
+    "iter_candidate_set",
     "modified_fedorov",
     # Main functions
     "optimal_design",
@@ -110,6 +130,7 @@ __all__ = [
     # Algorithms
     "sequential_dykstra",
     "simple_exchange_wynn_mitchell",
+    "split_plot_design",
     "t_optimality",
     "v_optimality",
 ]
@@ -18,6 +18,9 @@ References:
     - Wynn, H. P. (1972). "The Sequential Generation of D-Optimal Experimental
     Designs." Annals of Mathematical Statistics, 41(5), 1655-1664.
     - Fedorov, V. V. (1972). "Theory of Optimal Experiments." Academic Press.
+    - Meyer, R. K., & Nachtsheim, C. J. (1995). "The Coordinate-Exchange
+    Algorithm for Constructing Exact Optimal Experimental Designs."
+    Technometrics, 37(1), 60-69.
 
 Algorithms
 ----------
@@ -50,7 +53,9 @@ Modified Fedorov Algorithm
     modification ensures that certain points, which may be of particular
     interest or importance, are included in the final design while still
     optimizing the overall efficiency. It is particularly useful when some
-    experimental runs are mandatory.
+    experimental runs are mandatory. Every algorithm accepts such runs as
+    fixed_points, whose information is precomputed once; only the
+    remaining runs are exchanged.
 
 DETMAX Algorithm
     The DETMAX algorithm, developed by Mitchell (1974), is designed to construct
@@ -58,45 +63,467 @@ DETMAX Algorithm
     It starts with an initial design and iteratively adds or removes points to
     improve the determinant. This method is widely used due to its effectiveness
     in producing highly efficient designs.
+
+Coordinate Exchange Algorithm
+    The coordinate-exchange algorithm of Meyer and Nachtsheim (1995) does not
+    use a candidate set. Starting from a random design, it changes one
+    coordinate (one factor of one run) at a time to the value in the factor's
+    range that most improves the criterion. Its memory use therefore does not
+    grow with the number of factors, which makes designs with many factors
+    feasible where a full factorial candidate set would not fit in memory.
 """
 
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
 from typing import Literal
 
 import numpy as np
 
-from pydoe.optimal.model import build_design_matrix, build_uniform_moment_matrix
-from pydoe.optimal.utils import (
-    _best_single_add,
-    _best_single_drop,
-    criterion_value,
+from pydoe.optimal.model import (
+    CandidateSet,
+    PolynomialModel,
+    _as_candidate_set,
+    _factor_region,
+    _model_exponents,
+    _region_moment_matrix,
+    build_design_matrix,
 )
+from pydoe.optimal.updates import InformationState
+from pydoe.optimal.utils import _scan_improvement
 
 
 # ------------------- Algorithms -----------------
+#
+# Designs are tracked as integer indices into the candidate set. Unless
+# sampling with replacement, a boolean mask marks the candidates that are
+# not in the current design and is updated in O(1) per exchange.
+
+
+def _sequential_indices(  # noqa: PLR0913
+    cset: CandidateSet,
+    n_points: int,
+    criterion: str,
+    alpha: float,
+    *,
+    replacement: bool,
+    rng: np.random.Generator | None = None,
+    fixed: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Select design points greedily, as in `sequential_dykstra`.
+
+    With a random generator, the greedy selection starts from a random
+    number (below p) of randomly chosen candidates instead of an empty
+    design. Model rows in 'fixed' are runs that stay in the design; only
+    the n_points free runs are selected.
+
+    Returns
+    -------
+    ndarray of shape (n_points,)
+        Candidate indices of the selected design.
+
+    Raises
+    ------
+    ValueError
+        If n_points is less than 1, or exceeds the number of candidates
+        without replacement.
+    """
+    if n_points < 1:
+        raise ValueError("n_points must be at least 1")
+    if not replacement and n_points > len(cset):
+        raise ValueError(
+            f"n_points ({n_points}) exceeds the number of candidates "
+            f"({len(cset)}); use replacement=True to allow replicates"
+        )
+    X0 = cset.X0
+
+    state = InformationState(
+        np.empty((0, X0.shape[1])),
+        criterion,
+        cset,
+        alpha,
+        log_det=True,
+        fixed=fixed,
+    )
+    available = np.ones(len(cset), dtype=bool)
+    selected = np.empty(n_points, dtype=int)
+
+    n_random = 0
+    if rng is not None:
+        n_random = int(rng.integers(min(n_points, X0.shape[1])))
+        selected[:n_random] = rng.choice(
+            len(cset), size=n_random, replace=replacement
+        )
+        for j in selected[:n_random]:
+            state.add(X0[j])
+            available[j] = replacement
+
+    for t in range(n_random, n_points):
+        remaining = np.flatnonzero(available)
+        j_best, _ = state.best_add(X0[remaining])
+        j = remaining[max(j_best, 0)]
+        state.add(X0[j])
+        available[j] = replacement
+        selected[t] = j
+
+    return selected
+
+
+def _start_rng(
+    seed: int | np.random.Generator | None,
+) -> np.random.Generator | None:
+    """
+    Build the generator of a randomized start.
+
+    Returns
+    -------
+    np.random.Generator or None
+        Generator seeded with 'seed', or None for the deterministic greedy
+        start.
+    """
+    return None if seed is None else np.random.default_rng(seed)
+
+
+def _available_mask(
+    cset: CandidateSet, idx: np.ndarray, *, replacement: bool
+) -> np.ndarray:
+    """
+    Mark the candidates that may enter the design with indices 'idx'.
+
+    Returns
+    -------
+    ndarray of shape (N,)
+        Boolean availability mask over the candidate set.
+    """
+    available = np.ones(len(cset), dtype=bool)
+    if not replacement:
+        available[idx] = False
+    return available
+
+
+# Number of swap values computed per block when a search is chunked.
+_SWAP_BLOCK = 1 << 16
+
+
+class _SearchControl:
+    """
+    Stopping rules and neighbourhood search of the exchange algorithms.
+
+    Parameters
+    ----------
+    time_budget : float or None
+        Wall-clock budget of the search in seconds.
+    tol_relative : float
+        Stop once an iteration improves the criterion by less than this
+        fraction.
+    first_improvement : bool
+        Accept the first improving swap instead of the best one.
+    max_candidates : int or None
+        Number of available candidates sampled per search.
+    callback : callable or None
+        Called with a progress dictionary after every iteration.
+    seed : int, np.random.Generator or None
+        Seed of the candidate sampling.
+
+    Raises
+    ------
+    ValueError
+        If time_budget is not positive, tol_relative is negative or
+        max_candidates is less than 1.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        time_budget: float | None = None,
+        tol_relative: float = 0.0,
+        *,
+        first_improvement: bool = False,
+        max_candidates: int | None = None,
+        callback: Callable[[dict], bool | None] | None = None,
+        seed: int | np.random.Generator | None = None,
+    ) -> None:
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"time_budget must be positive, got {time_budget}")
+        if tol_relative < 0:
+            raise ValueError(
+                f"tol_relative must be non-negative, got {tol_relative}"
+            )
+        if max_candidates is not None and max_candidates < 1:
+            raise ValueError(
+                f"max_candidates must be at least 1, got {max_candidates}"
+            )
+        self.start = time.perf_counter()
+        self.deadline = (
+            None if time_budget is None else self.start + time_budget
+        )
+        self.tol_relative = tol_relative
+        self.first_improvement = first_improvement
+        self.max_candidates = max_candidates
+        self.callback = callback
+        # The sampled neighbourhoods are reproducible even for the
+        # deterministic start.
+        self.rng = np.random.default_rng(0 if seed is None else seed)
+
+    def expired(self) -> bool:
+        """
+        Whether the time budget is used up.
+
+        Returns
+        -------
+        bool
+            True once the deadline has passed.
+        """
+        return self.deadline is not None and time.perf_counter() > self.deadline
+
+    def sample(self, pool: np.ndarray) -> np.ndarray:
+        """
+        Random subset of the available candidates to search.
+
+        Returns
+        -------
+        ndarray
+            At most max_candidates indices of 'pool', in increasing order.
+        """
+        if self.max_candidates is None or pool.size <= self.max_candidates:
+            return pool
+        return np.sort(
+            self.rng.choice(pool, self.max_candidates, replace=False)
+        )
+
+    def find_swap(
+        self,
+        state: InformationState,
+        rows: np.ndarray,
+        pool: np.ndarray,
+        X0: np.ndarray,
+        base: float,
+    ) -> tuple[int, int, float]:
+        """
+        Search the exchanges of design positions 'rows' with the candidates
+        'pool' for one that improves on 'base'.
+
+        Without a time budget or first-improvement the whole neighbourhood
+        is scored at once. Otherwise it is scored in blocks of rows so that
+        the search can stop at the first improving swap or at the deadline,
+        in which case the best swap found so far is returned.
+
+        Returns
+        -------
+        row : int
+            Position of the design point to remove, or -1 if no swap
+            improves.
+        candidate : int
+            Index of the candidate to add.
+        value : float
+            Criterion value after the swap (or 'base').
+        """
+        Y = X0[pool]
+        if self.deadline is None and not self.first_improvement:
+            k, value = _scan_improvement(state.swap_values(rows, Y), base)
+            if k < 0:
+                return -1, -1, base
+            a, j = divmod(k, len(pool))
+            return int(rows[a]), int(pool[j]), value
+
+        step = max(state.p, _SWAP_BLOCK // max(len(pool), 1))
+        best = (-1, -1, base)
+        for start in range(0, len(rows), step):
+            block = rows[start : start + step]
+            values = state.swap_values(block, Y)
+            if self.first_improvement:
+                hits = np.flatnonzero(values.ravel() > base + 1e-12)
+                if hits.size:
+                    a, j = divmod(int(hits[0]), len(pool))
+                    return int(block[a]), int(pool[j]), float(values[a, j])
+            else:
+                k, value = _scan_improvement(values, best[2])
+                if k >= 0:
+                    a, j = divmod(k, len(pool))
+                    best = (int(block[a]), int(pool[j]), value)
+            if self.expired():
+                break
+        return best
+
+    def stop(
+        self, iteration: int, old: float, new: float, *, log: bool
+    ) -> bool:
+        """
+        Report progress and decide whether the search should end.
+
+        Parameters
+        ----------
+        iteration : int
+            Number of completed iterations.
+        old, new : float
+            Criterion values before and after the iteration.
+        log : bool
+            Whether the values are log-determinants, whose difference is
+            already a relative change.
+
+        Returns
+        -------
+        bool
+            True if the callback asked to stop, the improvement fell below
+            tol_relative or the time budget is used up.
+        """
+        elapsed = time.perf_counter() - self.start
+        if self.callback is not None and self.callback({
+            "iteration": iteration,
+            "value": new,
+            "elapsed": elapsed,
+        }):
+            return True
+        if self.tol_relative:
+            if log:
+                gain = np.expm1(new - old)
+            else:
+                gain = (new - old) / max(abs(old), np.finfo(float).tiny)
+            if gain < self.tol_relative:
+                return True
+        return self.expired()
+
+
+def _fixed_runs(
+    fixed_points: np.ndarray | None,
+    n_points: int,
+    n_factors: int,
+    degree: int | PolynomialModel,
+) -> tuple[np.ndarray, np.ndarray | None, int]:
+    """
+    Split a design of n_points runs into fixed runs and free runs.
+
+    Returns
+    -------
+    fixed_points : ndarray of shape (m, k)
+        Fixed runs (empty if there are none).
+    fixed : ndarray of shape (m, p) or None
+        Model rows of the fixed runs.
+    n_free : int
+        Number of runs left to choose.
+
+    Raises
+    ------
+    ValueError
+        If fixed_points does not have n_factors columns or n_points does
+        not exceed the number of fixed runs.
+    """
+    if fixed_points is None:
+        return np.empty((0, n_factors)), None, n_points
+    points = np.atleast_2d(np.asarray(fixed_points, dtype=float))
+    if points.shape[1] != n_factors:
+        raise ValueError(
+            f"fixed_points must have {n_factors} columns, got {points.shape[1]}"
+        )
+    if n_points <= len(points):
+        raise ValueError(
+            f"n_points ({n_points}) must exceed the number of fixed points "
+            f"({len(points)})"
+        )
+    return points, build_design_matrix(points, degree), n_points - len(points)
+
+
+def _simple_exchange_indices(  # noqa: PLR0913
+    cset: CandidateSet,
+    n_points: int,
+    criterion: str,
+    alpha: float,
+    max_iter: int,
+    *,
+    replacement: bool,
+    rng: np.random.Generator | None = None,
+    fixed: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Improve a greedy design by Wynn-Mitchell exchanges, keeping the runs
+    with model rows 'fixed'.
+
+    Returns
+    -------
+    ndarray of shape (n_points,)
+        Candidate indices of the final design.
+    """
+    idx = _sequential_indices(
+        cset,
+        n_points,
+        criterion,
+        alpha,
+        replacement=replacement,
+        rng=rng,
+        fixed=fixed,
+    )
+    X0 = cset.X0
+    available = _available_mask(cset, idx, replacement=replacement)
+    state = InformationState(
+        X0[idx], criterion, cset, alpha, log_det=True, fixed=fixed
+    )
+    best_score = state.value()
 
+    for _ in range(max_iter):
+        # Drop, making the dropped point available again
+        drop_idx, _ = state.best_drop()
+        state.drop(drop_idx)
+        dropped = idx[drop_idx]
+        idx = np.delete(idx, drop_idx)
+        available[dropped] = True
+
+        # Add
+        pool = np.flatnonzero(available)
+        add_idx, cand_score = state.best_add(X0[pool])
 
-def sequential_dykstra(
-    candidates: np.ndarray,
+        if add_idx >= 0 and cand_score > best_score + 1e-12:
+            j = pool[add_idx]
+            idx = np.append(idx, j)
+            available[j] = replacement
+            state.add(X0[j])
+            best_score = cand_score
+        else:
+            idx = np.insert(idx, drop_idx, dropped)
+            available[dropped] = replacement
+            break
+
+    return idx
+
+
+def sequential_dykstra(  # noqa: PLR0913
+    candidates: np.ndarray | CandidateSet,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     alpha: float = 0.0,
+    *,
+    replacement: bool = False,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Construct an optimal design using the sequential (Dykstra) greedy algorithm.
 
     Parameters
     ----------
-    candidates : ndarray of shape (N, k)
+    candidates : ndarray of shape (N, k) or CandidateSet
         Candidate points in the design space.
     n_points : int
         Number of points to select for the design.
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}, optional
         Optimality criterion to maximize (default is 'D').
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and they are never
+        exchanged; the returned design starts with them and n_points
+        counts them.
 
     Returns
     -------
@@ -106,36 +533,36 @@ def sequential_dykstra(
     Raises
     ------
     ValueError
-        If n_points is less than 1.
-    """
-    candidates = np.asarray(candidates, dtype=float)
-    if n_points < 1:
-        raise ValueError("n_points must be at least 1")
-    # Precompute for I- and A-opt
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
-
-    design = np.empty((0, candidates.shape[1]), dtype=float)
-    remaining = candidates.copy()
-
-    for _ in range(n_points):
-        j_best, _ = _best_single_add(
-            design, remaining, degree, criterion, X0, alpha, M_moment
-        )
-        j_best = max(j_best, 0)
-        design = np.vstack([design, remaining[j_best]])
-        remaining = np.delete(remaining, j_best, axis=0)
-
-    return design
+        If n_points is less than 1, exceeds the number of candidates
+        without replacement, or does not exceed the number of fixed points.
+    """  # noqa: DOC502
+    cset = _as_candidate_set(candidates, degree)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, cset.points.shape[1], degree
+    )
+    idx = _sequential_indices(
+        cset,
+        n_free,
+        criterion,
+        alpha,
+        replacement=replacement,
+        rng=_start_rng(seed),
+        fixed=fixed,
+    )
+    return np.vstack([fixed_pts, cset.points[idx]])
 
 
 def simple_exchange_wynn_mitchell(  # noqa: PLR0913, PLR0917
-    candidates: np.ndarray,
+    candidates: np.ndarray | CandidateSet,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     alpha: float = 0.0,
     max_iter: int = 200,
+    *,
+    replacement: bool = False,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Construct an optimal design using the simple exchange (Wynn-Mitchell)
@@ -143,223 +570,351 @@ def simple_exchange_wynn_mitchell(  # noqa: PLR0913, PLR0917
 
     Parameters
     ----------
-    candidates : ndarray of shape (N, k)
+    candidates : ndarray of shape (N, k) or CandidateSet
         Candidate points in the design space.
     n_points : int
         Number of points to select for the design.
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}, optional
         Optimality criterion to maximize (default is 'D').
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
     max_iter : int, optional
         Maximum number of iterations (default is 200).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and they are never
+        exchanged; the returned design starts with them and n_points
+        counts them.
 
     Returns
     -------
     design : ndarray of shape (n_points, k)
         Selected design points.
-    """
-    candidates = np.asarray(candidates, dtype=float)
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
-
-    design = sequential_dykstra(candidates, n_points, degree, criterion, alpha)
-
-    def score(des: np.ndarray) -> float:
-        X = build_design_matrix(des, degree)
-        return criterion_value(X, criterion, X0, alpha, M_moment)
-
-    best_score = score(design)
-
-    for _ in range(max_iter):
-        # Drop
-        drop_idx, _ = _best_single_drop(
-            design, degree, criterion, X0, alpha, M_moment
-        )
-        # Remove from pool those already in design except the one
-        # we plan to drop. Using exact match; for numeric safety,
-        # use all rows then filter after equality check
-        design_wo = np.delete(design, drop_idx, axis=0)
 
-        # Add
-        mask = np.ones(len(candidates), dtype=bool)
-        # Mark rows equal to rows in design_wo as not
-        # available (basic filtering)
-        for r in design_wo:
-            eq = np.all(np.isclose(candidates, r, atol=1e-12), axis=1)
-            mask &= ~eq
-        pool_avail = candidates[mask]
-
-        add_idx, cand_score = _best_single_add(
-            design_wo, pool_avail, degree, criterion, X0, alpha, M_moment
-        )
-
-        if add_idx >= 0 and cand_score > best_score + 1e-12:
-            design = np.vstack([design_wo, pool_avail[add_idx]])
-            best_score = cand_score
-        else:
-            break
-
-    return design
+    Raises
+    ------
+    ValueError
+        If n_points is less than 1, exceeds the number of candidates
+        without replacement, or does not exceed the number of fixed points.
+    """  # noqa: DOC502
+    cset = _as_candidate_set(candidates, degree)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, cset.points.shape[1], degree
+    )
+    idx = _simple_exchange_indices(
+        cset,
+        n_free,
+        criterion,
+        alpha,
+        max_iter,
+        replacement=replacement,
+        rng=_start_rng(seed),
+        fixed=fixed,
+    )
+    return np.vstack([fixed_pts, cset.points[idx]])
 
 
-def fedorov(  # noqa: PLR0913, PLR0917
-    candidates: np.ndarray,
+def fedorov(  # noqa: PLR0913, PLR0914, PLR0917
+    candidates: np.ndarray | CandidateSet,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     alpha: float = 0.0,
     max_iter: int = 200,
+    *,
+    replacement: bool = False,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
+    time_budget: float | None = None,
+    tol_relative: float = 0.0,
+    first_improvement: bool = False,
+    max_candidates: int | None = None,
+    callback: Callable[[dict], bool | None] | None = None,
 ) -> np.ndarray:
     """
     Construct an optimal design using the Fedorov exchange algorithm.
 
     Parameters
     ----------
-    candidates : ndarray of shape (N, k)
+    candidates : ndarray of shape (N, k) or CandidateSet
         Candidate points in the design space.
     n_points : int
         Number of points to select for the design.
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}, optional
         Optimality criterion to maximize (default is 'D').
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
     max_iter : int, optional
         Maximum number of iterations (default is 200).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and they are never
+        exchanged; the returned design starts with them and n_points
+        counts them.
+    time_budget : float, optional
+        Wall-clock budget of the search in seconds. The search stops at the
+        first check after the deadline, including partway through an
+        iteration, and returns the best design found so far. None (default)
+        sets no limit.
+    tol_relative : float, optional
+        Stop once an iteration improves the criterion by less than this
+        fraction (default is 0.0, which runs to a local optimum).
+    first_improvement : bool, optional
+        Make the first improving exchange found instead of the best one
+        (default is False).
+    max_candidates : int, optional
+        Search a random sample of at most this many available candidates in
+        each iteration; the sample is drawn from 'seed'. All candidates are
+        searched before the design is declared locally optimal. None
+        (default) always searches all candidates.
+    callback : callable, optional
+        Called after every iteration with a dictionary holding 'iteration',
+        'value' (criterion value, $\\log \\det(M)$ for D-optimality) and
+        'elapsed' (seconds). Returning True stops the search.
 
     Returns
     -------
     design : ndarray of shape (n_points, k)
         Selected design points.
-    """
-    candidates = np.asarray(candidates, dtype=float)
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
-
-    design = sequential_dykstra(candidates, n_points, degree, criterion, alpha)
-
-    def score(des: np.ndarray) -> float:
-        X = build_design_matrix(des, degree)
-        return criterion_value(X, criterion, X0, alpha, M_moment)
-
-    best = score(design)
 
-    for _ in range(max_iter):
-        improved = False
-        # Build availability mask
-        mask = np.ones(len(candidates), dtype=bool)
-        for r in design:
-            eq = np.all(np.isclose(candidates, r, atol=1e-12), axis=1)
-            mask &= ~eq
-        pool = candidates[mask]
-
-        # evaluate all swaps (i in design, j in pool)
-        best_i, best_j, best_val = -1, -1, best
-        for i in range(design.shape[0]):
-            for j in range(pool.shape[0]):
-                trial = design.copy()
-                trial[i] = pool[j]
-                s = score(trial)
-                if s > best_val + 1e-12:
-                    best_i, best_j, best_val = i, j, s
+    Raises
+    ------
+    ValueError
+        If time_budget is not positive, tol_relative is negative,
+        max_candidates is less than 1, or n_points does not exceed the
+        number of fixed points.
+    """  # noqa: DOC502
+    control = _SearchControl(
+        time_budget,
+        tol_relative,
+        first_improvement=first_improvement,
+        max_candidates=max_candidates,
+        callback=callback,
+        seed=seed,
+    )
+    cset = _as_candidate_set(candidates, degree)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, cset.points.shape[1], degree
+    )
+    X0 = cset.X0
+    idx = _sequential_indices(
+        cset,
+        n_free,
+        criterion,
+        alpha,
+        replacement=replacement,
+        rng=_start_rng(seed),
+        fixed=fixed,
+    )
+    available = _available_mask(cset, idx, replacement=replacement)
+    state = InformationState(
+        X0[idx], criterion, cset, alpha, log_det=True, fixed=fixed
+    )
+    best = state.value()
+    rows = np.arange(len(idx))
 
-        if best_i >= 0:
-            design[best_i] = pool[best_j]
-            best = best_val
-            improved = True
+    for it in range(max_iter):
+        if control.expired():
+            break
+        pool = np.flatnonzero(available)
+
+        # evaluate all swaps (i in design, j in pool), on a sample of the
+        # pool first if requested
+        sample = control.sample(pool)
+        best_i, j, best_val = control.find_swap(state, rows, sample, X0, best)
+        if best_i < 0 and sample.size < pool.size and not control.expired():
+            best_i, j, best_val = control.find_swap(state, rows, pool, X0, best)
+        if best_i < 0:
+            break
 
-        if not improved:
+        available[idx[best_i]] = True
+        idx[best_i] = j
+        available[j] = replacement
+        state.swap(best_i, X0[j])
+        best, previous = best_val, best
+        if control.stop(it + 1, previous, best, log=state.log_det):
             break
 
-    return design
+    return np.vstack([fixed_pts, cset.points[idx]])
 
 
-def modified_fedorov(  # noqa: PLR0913, PLR0917
-    candidates: np.ndarray,
+def modified_fedorov(  # noqa: PLR0913, PLR0914, PLR0917
+    candidates: np.ndarray | CandidateSet,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     alpha: float = 0.0,
     max_iter: int = 100,
+    *,
+    replacement: bool = False,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
+    time_budget: float | None = None,
+    tol_relative: float = 0.0,
+    first_improvement: bool = False,
+    max_candidates: int | None = None,
+    callback: Callable[[dict], bool | None] | None = None,
 ) -> np.ndarray:
     """
     Construct an optimal design using the modified Fedorov algorithm.
 
     Parameters
     ----------
-    candidates : ndarray of shape (N, k)
+    candidates : ndarray of shape (N, k) or CandidateSet
         Candidate points in the design space.
     n_points : int
         Number of points to select for the design.
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}, optional
         Optimality criterion to maximize (default is 'D').
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
     max_iter : int, optional
         Maximum number of iterations (default is 100).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and they are never
+        exchanged; the returned design starts with them and n_points
+        counts them.
+    time_budget : float, optional
+        Wall-clock budget of the search in seconds. The search stops at the
+        first check after the deadline, including partway through an
+        iteration, and returns the best design found so far. None (default)
+        sets no limit.
+    tol_relative : float, optional
+        Stop once an iteration improves the criterion by less than this
+        fraction (default is 0.0, which runs to a local optimum).
+    first_improvement : bool, optional
+        Make the first improving exchange found instead of the best one
+        (default is False).
+    max_candidates : int, optional
+        Search a random sample of at most this many available candidates in
+        each iteration; the sample is drawn from 'seed'. All candidates are
+        searched before the design is declared locally optimal. None
+        (default) always searches all candidates.
+    callback : callable, optional
+        Called after every iteration with a dictionary holding 'iteration',
+        'value' (criterion value, $\\log \\det(M)$ for D-optimality) and
+        'elapsed' (seconds). Returning True stops the search.
 
     Returns
     -------
     design : ndarray of shape (n_points, k)
         Selected design points.
-    """
-    candidates = np.asarray(candidates, dtype=float)
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
-
-    design = sequential_dykstra(candidates, n_points, degree, criterion, alpha)
 
-    def score(des: np.ndarray) -> float:
-        X = build_design_matrix(des, degree)
-        return criterion_value(X, criterion, X0, alpha, M_moment)
+    Raises
+    ------
+    ValueError
+        If time_budget is not positive, tol_relative is negative,
+        max_candidates is less than 1, or n_points does not exceed the
+        number of fixed points.
+    """  # noqa: DOC502
+    control = _SearchControl(
+        time_budget,
+        tol_relative,
+        first_improvement=first_improvement,
+        max_candidates=max_candidates,
+        callback=callback,
+        seed=seed,
+    )
+    cset = _as_candidate_set(candidates, degree)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, cset.points.shape[1], degree
+    )
+    X0 = cset.X0
+    idx = _sequential_indices(
+        cset,
+        n_free,
+        criterion,
+        alpha,
+        replacement=replacement,
+        rng=_start_rng(seed),
+        fixed=fixed,
+    )
+    available = _available_mask(cset, idx, replacement=replacement)
+    state = InformationState(
+        X0[idx], criterion, cset, alpha, log_det=True, fixed=fixed
+    )
 
-    for _ in range(max_iter):
-        base = score(design)
+    # Passes over sampled candidates are confirmed by a pass over all of
+    # them before the design is declared locally optimal.
+    exhaustive = max_candidates is None
+    for it in range(max_iter):
+        if control.expired():
+            break
+        start = base = state.value()
         any_change = False
 
-        # Build pool availability once (exclude exact duplicates of current)
-        mask_all = np.ones(len(candidates), dtype=bool)
-        for r in design:
-            mask_all &= ~np.all(np.isclose(candidates, r, atol=1e-12), axis=1)
-        pool = candidates[mask_all]
-
         # Try replace each point with best candidate for that position
-        new_design = design.copy()
-        for i in range(design.shape[0]):
-            best_val = base
-            best_row = None
-            for j in range(pool.shape[0]):
-                trial = new_design.copy()
-                trial[i] = pool[j]
-                s = score(trial)
-                if s > best_val + 1e-12:
-                    best_val = s
-                    best_row = pool[j]
-            if best_row is not None:
-                new_design[i] = best_row
+        for i in range(len(idx)):
+            pool = np.flatnonzero(available)
+            if not exhaustive:
+                pool = control.sample(pool)
+            _, j, best_val = control.find_swap(state, [i], pool, X0, base)
+            if j >= 0:
+                available[idx[i]] = True
+                idx[i] = j
+                available[j] = replacement
+                state.swap(i, X0[j])
                 base = best_val
                 any_change = True
+            if control.expired():
+                break
 
-        design = new_design
         if not any_change:
+            if exhaustive or control.expired():
+                break
+            exhaustive = True
+            continue
+        exhaustive = max_candidates is None
+        if control.stop(it + 1, start, base, log=state.log_det):
             break
 
-    return design
+    return np.vstack([fixed_pts, cset.points[idx]])
 
 
 def detmax(  # noqa: PLR0913, PLR0914, PLR0917
-    candidates: np.ndarray,
+    candidates: np.ndarray | CandidateSet,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     alpha: float = 0.0,
     max_iter: int = 100,
+    *,
+    replacement: bool = False,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
+    time_budget: float | None = None,
+    tol_relative: float = 0.0,
+    first_improvement: bool = False,
+    max_candidates: int | None = None,
+    callback: Callable[[dict], bool | None] | None = None,
 ) -> np.ndarray:
     """
     Construct an optimal design using the DETMAX algorithm
@@ -367,81 +922,341 @@ def detmax(  # noqa: PLR0913, PLR0914, PLR0917
 
     Parameters
     ----------
-    candidates : ndarray of shape (N, k)
+    candidates : ndarray of shape (N, k) or CandidateSet
         Candidate points in the design space.
     n_points : int
         Number of points to select for the design.
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}, optional
         Optimality criterion to maximize (default is 'D').
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
     max_iter : int, optional
         Maximum number of iterations (default is 100).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and they are never
+        exchanged; the returned design starts with them and n_points
+        counts them.
+    time_budget : float, optional
+        Wall-clock budget of the search in seconds. The search stops at the
+        first check after the deadline, including partway through an
+        iteration, and returns the best design found so far. None (default)
+        sets no limit.
+    tol_relative : float, optional
+        Stop once an iteration improves the criterion by less than this
+        fraction (default is 0.0, which runs to a local optimum).
+    first_improvement : bool, optional
+        Make the first improving exchange found instead of the best one
+        (default is False).
+    max_candidates : int, optional
+        Search a random sample of at most this many available candidates in
+        each iteration; the sample is drawn from 'seed'. All candidates are
+        searched before the design is declared locally optimal. None
+        (default) always searches all candidates.
+    callback : callable, optional
+        Called after every iteration with a dictionary holding 'iteration',
+        'value' (criterion value, $\\log \\det(M)$ for D-optimality) and
+        'elapsed' (seconds). Returning True stops the search.
 
     Returns
     -------
     design : ndarray of shape (n_points, k)
         Selected design points.
-    """
-    candidates = np.asarray(candidates, dtype=float)
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
 
-    design = simple_exchange_wynn_mitchell(
-        candidates, n_points, degree, criterion, alpha
+    Raises
+    ------
+    ValueError
+        If time_budget is not positive, tol_relative is negative,
+        max_candidates is less than 1, or n_points does not exceed the
+        number of fixed points.
+    """  # noqa: DOC502
+    control = _SearchControl(
+        time_budget,
+        tol_relative,
+        first_improvement=first_improvement,
+        max_candidates=max_candidates,
+        callback=callback,
+        seed=seed,
     )
+    cset = _as_candidate_set(candidates, degree)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, cset.points.shape[1], degree
+    )
+    X0 = cset.X0
+    idx = _simple_exchange_indices(
+        cset,
+        n_free,
+        criterion,
+        alpha,
+        200,
+        replacement=replacement,
+        rng=_start_rng(seed),
+        fixed=fixed,
+    )
+    available = _available_mask(cset, idx, replacement=replacement)
+    state = InformationState(
+        X0[idx], criterion, cset, alpha, log_det=True, fixed=fixed
+    )
+    best = state.value()
 
-    def score(des: np.ndarray) -> float:
-        X = build_design_matrix(des, degree)
-        return criterion_value(X, criterion, X0, alpha, M_moment)
-
-    best = score(design)
-
-    for _ in range(max_iter):
+    for it in range(max_iter):
+        if control.expired():
+            break
         # Try a Fedorov-style single swap first
-        improved = False
-        mask = np.ones(len(candidates), dtype=bool)
-        for r in design:
-            mask &= ~np.all(np.isclose(candidates, r, atol=1e-12), axis=1)
-        pool = candidates[mask]
-
-        best_i, best_j, best_val = -1, -1, best
-        for i in range(design.shape[0]):
-            for j in range(pool.shape[0]):
-                trial = design.copy()
-                trial[i] = pool[j]
-                s = score(trial)
-                if s > best_val + 1e-12:
-                    best_i, best_j, best_val = i, j, s
-
+        pool = np.flatnonzero(available)
+        rows = np.arange(len(idx))
+        sample = control.sample(pool)
+        best_i, j, best_val = control.find_swap(state, rows, sample, X0, best)
+        if best_i < 0 and sample.size < pool.size and not control.expired():
+            best_i, j, best_val = control.find_swap(state, rows, pool, X0, best)
         if best_i >= 0:
-            design[best_i] = pool[best_j]
-            best = best_val
-            improved = True
-
-        if improved:
+            available[idx[best_i]] = True
+            idx[best_i] = j
+            available[j] = replacement
+            state.swap(best_i, X0[j])
+            best, previous = best_val, best
+            if control.stop(it + 1, previous, best, log=state.log_det):
+                break
             continue
+        if control.expired():
+            break
 
         # Excursion: add best extra, then drop worst
-        add_idx, _add_score = _best_single_add(
-            design, pool, degree, criterion, X0, alpha, M_moment
-        )
+        add_idx, _add_score = state.best_add(X0[pool])
         if add_idx < 0:
             break  # nothing to add
 
-        expanded = np.vstack([design, pool[add_idx]])
+        state.add(X0[pool[add_idx]])
         # Drop worst from expanded
-        drop_idx, final_score = _best_single_drop(
-            expanded, degree, criterion, X0, alpha, M_moment
-        )
+        drop_idx, final_score = state.best_drop()
 
         if final_score > best + 1e-12:
-            design = np.delete(expanded, drop_idx, axis=0)
-            best = final_score
-            improved = True
+            expanded = np.append(idx, pool[add_idx])
+            available[pool[add_idx]] = replacement
+            available[expanded[drop_idx]] = True
+            idx = np.delete(expanded, drop_idx)
+            state.drop(drop_idx)
+            best, previous = final_score, best
+            if control.stop(it + 1, previous, best, log=state.log_det):
+                break
         else:
             break
 
-    return design
+    return np.vstack([fixed_pts, cset.points[idx]])
+
+
+# Criteria supported by coordinate exchange, which relies on rank-one updates
+# and has no candidate set to evaluate the remaining criteria on.
+_COORDINATE_CRITERIA = ("D", "A", "I", "C")
+
+# Random starting designs tried before accepting a singular one.
+_MAX_STARTS = 10
+
+# Relative improvement required to accept a coordinate change.
+_COORDINATE_RTOL = 1e-10
+
+
+def _coordinate_terms(exponents: np.ndarray, j: int) -> tuple:
+    """
+    Split the model terms that contain factor j into its powers and the
+    exponents of the other factors.
+
+    Returns
+    -------
+    tuple of ndarray
+        Column indices, powers of factor j and exponents of the remaining
+        factors for the model terms that depend on factor j.
+    """
+    cols = np.flatnonzero(exponents[:, j])
+    others = exponents[cols]
+    powers = others[:, j].copy()
+    others[:, j] = 0
+    return cols, powers, others
+
+
+def _exchange_coordinate(  # noqa: PLR0913, PLR0917
+    state: InformationState,
+    design: np.ndarray,
+    i: int,
+    j: int,
+    values: np.ndarray,
+    terms: tuple,
+    best: float,
+) -> float:
+    """
+    Set coordinate (i, j) of the design to the best of 'values' if that
+    improves the criterion, updating 'design' and 'state' in place.
+
+    Returns
+    -------
+    float
+        Criterion value after the (possible) change.
+    """
+    # Only the model terms that contain factor j depend on its value.
+    cols, powers, others = terms
+    rest = np.prod(design[i] ** others, axis=1)
+    Y = np.repeat(state.X[i : i + 1], len(values), axis=0)
+    Y[:, cols] = values[:, None] ** powers * rest
+    tol = _COORDINATE_RTOL * abs(best)
+    k, best_val = _scan_improvement(state.swap_values(i, Y), best, tol)
+    if k < 0:
+        return best
+    design[i, j] = values[k]
+    state.swap(i, Y[k])
+    return best_val
+
+
+def coordinate_exchange(  # noqa: PLR0913, PLR0914
+    n_factors: int,
+    n_points: int,
+    degree: int | PolynomialModel,
+    criterion: Literal["D", "A", "I", "C"] = "D",
+    max_iter: int = 100,
+    *,
+    bounds: tuple | list | None = None,
+    levels: int | list | None = None,
+    n_grid: int = 21,
+    seed: int | np.random.Generator | None = None,
+    fixed_points: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Construct an optimal design using the coordinate-exchange algorithm
+    (Meyer and Nachtsheim).
+
+    No candidate set is built: each pass visits every coordinate of the
+    design and moves it to the best value in the factor's range, scoring
+    all values at once with rank-one updates of the information matrix.
+    Memory use is O(n_points * p), independent of the size of the
+    factorial grid.
+
+    Parameters
+    ----------
+    n_factors : int
+        Number of factors.
+    n_points : int
+        Number of runs in the design.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+    criterion : {'D', 'A', 'I', 'C'}, optional
+        Optimality criterion to maximize (default is 'D').
+    max_iter : int, optional
+        Maximum number of passes over all coordinates (default is 100).
+    bounds : tuple or list of tuples, optional
+        Range of each factor. If a single tuple, applies to all factors.
+        Default is (-1, 1) for all factors.
+    levels : int or list, optional
+        Discrete levels of the factors. An int gives that many equally
+        spaced levels within the bounds of every factor; a list gives, for
+        each factor, an int, an array of levels or None. Factors without
+        levels are continuous (default is None, all continuous).
+    n_grid : int, optional
+        Number of values scored for a continuous coordinate, first on the
+        whole range and then around the best value (default is 21).
+    seed : int, np.random.Generator or None, optional
+        Seed or generator for the random starting design.
+    fixed_points : ndarray of shape (m, n_factors), optional
+        Runs that must stay in the design, such as experiments already
+        performed. Their information is added once and their coordinates
+        are never changed; the returned design starts with them and
+        n_points counts them.
+
+    Returns
+    -------
+    design : ndarray of shape (n_points, n_factors)
+        Design points.
+
+    Raises
+    ------
+    ValueError
+        If the criterion is not supported, n_points is less than 1 or does
+        not exceed the number of fixed points, n_grid is less than 2, or
+        bounds or levels do not match n_factors.
+
+    Notes
+    -----
+    For I-optimality the moment matrix is that of the uniform measure on the
+    region (continuous factors uniform on their range, discrete factors
+    uniform on their levels).
+
+    Examples
+    --------
+    >>> from pydoe import coordinate_exchange
+    >>> design = coordinate_exchange(
+    ...     n_factors=10, n_points=12, degree=1, levels=2, seed=0
+    ... )
+    >>> design.shape
+    (12, 10)
+    """
+    if criterion.upper() not in _COORDINATE_CRITERIA:
+        raise ValueError(
+            f"coordinate_exchange supports criteria "
+            f"{', '.join(_COORDINATE_CRITERIA)}, got {criterion}"
+        )
+    if n_points < 1:
+        raise ValueError("n_points must be at least 1")
+    if n_grid < 2:
+        raise ValueError("n_grid must be at least 2")
+    bounds, levels = _factor_region(n_factors, bounds, levels)
+    fixed_pts, fixed, n_free = _fixed_runs(
+        fixed_points, n_points, n_factors, degree
+    )
+    exponents = _model_exponents(n_factors, degree)
+    rng = np.random.default_rng(seed)
+    M_moment = None
+    if criterion.upper() == "I":
+        M_moment = _region_moment_matrix(bounds, levels, degree)
+
+    for _ in range(_MAX_STARTS):
+        design = np.column_stack([
+            rng.uniform(low, high, n_free)
+            if lev is None
+            else rng.choice(lev, n_free)
+            for (low, high), lev in zip(bounds, levels, strict=True)
+        ])
+        X = build_design_matrix(design, degree)
+        state = InformationState(
+            X, criterion, None, 0.0, M_moment, log_det=True, fixed=fixed
+        )
+        if state.uses_updates:
+            break
+    best = state.value()
+
+    terms = [_coordinate_terms(exponents, j) for j in range(n_factors)]
+    grids = [
+        np.linspace(low, high, n_grid) if lev is None else lev
+        for (low, high), lev in zip(bounds, levels, strict=True)
+    ]
+
+    for _ in range(max_iter):
+        start = best
+        for i in range(n_free):
+            for j in range(n_factors):
+                best = _exchange_coordinate(
+                    state, design, i, j, grids[j], terms[j], best
+                )
+                if levels[j] is not None:
+                    continue
+                # Refine a continuous factor around its best grid value
+                low, high = bounds[j]
+                step = grids[j][1] - grids[j][0]
+                fine = np.linspace(
+                    max(low, design[i, j] - step),
+                    min(high, design[i, j] + step),
+                    n_grid,
+                )
+                best = _exchange_coordinate(
+                    state, design, i, j, fine, terms[j], best
+                )
+        if best == start:
+            break
+
+    return np.vstack([fixed_pts, design])
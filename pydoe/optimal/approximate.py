@@ -0,0 +1,352 @@
+r"""
+Approximate (continuous) optimal designs.
+
+An approximate design is a probability measure $w$ on the candidate set
+rather than a list of n runs. Its information matrix
+
+$$M(w) = \sum_i w_i x_i x_i^T$$
+
+is linear in the weights, so the design criteria become concave functions
+of $w$ and the optimum can be found by simple iterations that score all
+candidates at once. The Kiefer-Wolfowitz equivalence theorem certifies
+optimality: for D-optimality $w$ is optimal exactly when the sensitivity
+$d_i(w) = x_i^T M(w)^{-1} x_i$ does not exceed p at any candidate, and the
+gap gives a lower bound on the efficiency of $w$. An exact n-run design is
+obtained by efficient rounding of the weights.
+
+References:
+    - Silvey, S. D., Titterington, D. M., & Torsney, B. (1978). "An
+    Algorithm for Optimal Designs on a Finite Design Space."
+    Communications in Statistics - Theory and Methods, 7(14), 1379-1389.
+    - Yu, Y. (2010). "Monotonic Convergence of a General Algorithm for
+    Computing Optimal Designs." Annals of Statistics, 38(3), 1593-1606.
+    - Fedorov, V. V. (1972). "Theory of Optimal Experiments." Academic Press.
+    - Wynn, H. P. (1970). "The Sequential Generation of D-Optimum
+    Experimental Designs." Annals of Mathematical Statistics, 41(5),
+    1655-1664.
+    - Harman, R., & Pronzato, L. (2007). "Improvements on Removing
+    Nonoptimal Support Points in D-Optimum Design Algorithms." Statistics &
+    Probability Letters, 77(1), 90-94.
+    - Pukelsheim, F., & Rieder, S. (1992). "Efficient Rounding of
+    Approximate Designs." Biometrika, 79(4), 763-770.
+"""
+
+from __future__ import annotations
+
+import warnings
+from typing import Literal
+
+import numpy as np
+from scipy.optimize import minimize_scalar
+
+from pydoe.optimal.model import CandidateSet, PolynomialModel, _as_candidate_set
+
+
+__all__ = ["approximate_design", "efficient_rounding"]
+
+# Criteria with a closed-form sensitivity function.
+_APPROXIMATE_CRITERIA = ("D", "A", "I")
+
+# Weights below this fraction of the largest weight are not rounded.
+_NEGLIGIBLE_WEIGHT = 1e-4
+
+# Relative norm below which a model row is in the span of the kept rows.
+_RANK_TOL = 1e-8
+
+
+def _sensitivity(
+    X0: np.ndarray, w: np.ndarray, B: np.ndarray | None
+) -> tuple[np.ndarray, float, np.ndarray]:
+    """
+    Sensitivity of every candidate and its bound under the equivalence
+    theorem.
+
+    For D-optimality (B is None) the sensitivity is $x^T M^{-1} x$ with
+    bound p; for the linear criteria $\\operatorname{tr}(B M^{-1})$ (A- and
+    I-optimality) it is $x^T M^{-1} B M^{-1} x$ with bound
+    $\\operatorname{tr}(B M^{-1})$.
+
+    Returns
+    -------
+    sens : ndarray of shape (N,)
+        Sensitivity of each candidate.
+    bound : float
+        Value the sensitivity cannot exceed at an optimal design.
+    M_inv : ndarray of shape (p, p)
+        Inverse information matrix of the weights.
+
+    Raises
+    ------
+    ValueError
+        If the information matrix of the weights is singular.
+    """
+    M = (X0.T * w) @ X0
+    try:
+        M_inv = np.linalg.inv(M)
+    except np.linalg.LinAlgError:
+        raise ValueError(
+            "the information matrix of the weights is singular; the "
+            "candidates must span the model"
+        ) from None
+    if B is None:
+        V = X0 @ M_inv
+        return np.einsum("ij,ij->i", V, X0), float(X0.shape[1]), M_inv
+    C = M_inv @ B @ M_inv
+    return (np.einsum("ij,ij->i", X0 @ C, X0), float(np.sum(B * M_inv)), M_inv)
+
+
+def _vertex_step(
+    sens_j: float, d_j: float, bound: float, *, d_optimal: bool
+) -> float:
+    """
+    Optimal step length towards a single candidate.
+
+    Returns
+    -------
+    float
+        Weight moved onto the candidate, in [0, 1).
+    """
+    if d_optimal:
+        # Fedorov-Wynn step for D-optimality.
+        return max((d_j - bound) / (bound * (d_j - 1.0)), 0.0)
+
+    # Linear criteria: with beta = a / (1 - a) the criterion along the step
+    # is (1 + beta) * (t - beta * g / (1 + beta * d)).
+    def value(a: float) -> float:
+        beta = a / (1.0 - a)
+        return (1.0 + beta) * (bound - beta * sens_j / (1.0 + beta * d_j))
+
+    res = minimize_scalar(value, bounds=(0.0, 1.0 - 1e-9), method="bounded")
+    return float(res.x) if res.fun < bound else 0.0
+
+
+def approximate_design(  # noqa: PLR0913, PLR0914, PLR0917
+    candidates: np.ndarray | CandidateSet,
+    degree: int | PolynomialModel,
+    criterion: Literal["D", "A", "I"] = "D",
+    method: Literal["multiplicative", "vertex_direction"] = "multiplicative",
+    max_iter: int = 1000,
+    tol: float = 1e-6,
+) -> tuple[np.ndarray, dict]:
+    """
+    Compute an approximate optimal design as weights on the candidate set.
+
+    Parameters
+    ----------
+    candidates : ndarray of shape (N0, k) or CandidateSet
+        Candidate set (region R).
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+    criterion : {'D', 'A', 'I'}, optional
+        Optimality criterion (default is 'D').
+    method : {'multiplicative', 'vertex_direction'}, optional
+        'multiplicative' (default) rescales every weight by a power of its
+        sensitivity, which converges monotonically; for D-optimality,
+        candidates that provably cannot support an optimal design are
+        removed on the way. 'vertex_direction' is the Fedorov-Wynn
+        (Frank-Wolfe) algorithm, moving weight onto the most sensitive
+        candidate with an exact line search.
+    max_iter : int, optional
+        Maximum number of iterations (default is 1000).
+    tol : float, optional
+        Stop once the certified efficiency bound reaches 1 - tol (default
+        is 1e-6).
+
+    Returns
+    -------
+    weights : ndarray of shape (N0,)
+        Weight of each candidate, summing to one.
+    info : dict
+        Dictionary with:
+        - 'criterion': criterion used
+        - 'method': algorithm used
+        - 'n_iter': number of iterations performed
+        - 'converged': whether the efficiency bound reached 1 - tol
+        - 'efficiency_bound': lower bound on the efficiency of the weights
+          relative to the optimal approximate design, from the
+          equivalence theorem
+        - 'max_sensitivity': largest candidate sensitivity
+        - 'support': indices of the candidates with nonzero weight
+
+    Raises
+    ------
+    ValueError
+        If the criterion or method is unknown, or the candidates do not
+        span the model.
+
+    Examples
+    --------
+    >>> from pydoe import approximate_design, generate_candidate_set
+    >>> candidates = generate_candidate_set(n_factors=2, n_levels=3)
+    >>> weights, info = approximate_design(candidates, degree=2)
+    >>> bool(info["converged"])
+    True
+    """
+    crit = criterion.upper()
+    if crit not in _APPROXIMATE_CRITERIA:
+        raise ValueError(
+            f"approximate_design supports criteria "
+            f"{', '.join(_APPROXIMATE_CRITERIA)}, got {criterion}"
+        )
+    if method not in {"multiplicative", "vertex_direction"}:
+        raise ValueError(f"Unknown method: {method}")
+    cset = _as_candidate_set(candidates, degree)
+    X0 = cset.X0
+    N, p = X0.shape
+    B = None
+    if crit == "A":
+        B = np.eye(p)
+    elif crit == "I":
+        B = cset.M_moment
+    # Yu's exponent: 1 for D-, 1/2 for the linear criteria.
+    power = 1.0 if B is None else 0.5
+
+    w = np.full(N, 1.0 / N)
+    sens, bound, M_inv = _sensitivity(X0, w, B)
+    n_iter = 0
+    while n_iter < max_iter and bound / np.max(sens) < 1.0 - tol:
+        n_iter += 1
+        if method == "multiplicative":
+            w *= (sens / bound) ** power
+            if B is None:
+                # Harman-Pronzato: candidates below this sensitivity cannot
+                # support a D-optimal design, with eps the absolute gap
+                # between the largest sensitivity and its optimal value p.
+                eps = max(np.max(sens) - p, 0.0)
+                h = p * (
+                    1.0 + eps / 2.0 - np.sqrt(eps * (4.0 + eps - 4.0 / p)) / 2.0
+                )
+                w[sens < h] = 0.0
+            w /= np.sum(w)
+        else:
+            j = int(np.argmax(sens))
+            d_j = float(X0[j] @ M_inv @ X0[j])
+            step = _vertex_step(sens[j], d_j, bound, d_optimal=B is None)
+            w *= 1.0 - step
+            w[j] += step
+        sens, bound, M_inv = _sensitivity(X0, w, B)
+
+    max_sens = float(np.max(sens))
+    efficiency = min(bound / max_sens, 1.0)
+    info = {
+        "criterion": crit,
+        "method": method,
+        "n_iter": n_iter,
+        "converged": bool(efficiency >= 1.0 - tol),
+        "efficiency_bound": float(efficiency),
+        "max_sensitivity": max_sens,
+        "support": np.flatnonzero(w > 0),
+    }
+    return w, info
+
+
+def _spanning_support(
+    support: np.ndarray, w: np.ndarray, X0: np.ndarray, n_points: int
+) -> np.ndarray:
+    """
+    Keep n_points of the support, the heaviest ones that span the model.
+
+    The support points are visited by decreasing weight and kept while they
+    increase the rank of the kept model rows; the remaining places go to
+    the heaviest points left.
+
+    Returns
+    -------
+    ndarray of shape (n_points,)
+        Indices of the kept support points.
+    """
+    order = support[np.argsort(-w[support], kind="stable")]
+    rank = min(n_points, np.linalg.matrix_rank(X0[support]))
+    basis = np.empty((0, X0.shape[1]))
+    kept = []
+    for i in order:
+        if len(kept) == rank:
+            break
+        x = X0[i] - basis.T @ (basis @ X0[i])
+        norm = np.linalg.norm(x)
+        if norm > _RANK_TOL * max(np.linalg.norm(X0[i]), 1.0):
+            basis = np.vstack([basis, x / norm])
+            kept.append(i)
+    rest = order[~np.isin(order, kept)]
+    return np.concatenate([kept, rest[: n_points - len(kept)]]).astype(int)
+
+
+def efficient_rounding(
+    weights: np.ndarray,
+    n_points: int,
+    *,
+    model_matrix: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Round approximate design weights to run counts of an n-run design.
+
+    Uses the efficient apportionment of Pukelsheim and Rieder (1992): every
+    support point first receives ``ceil((n - l / 2) * w)`` runs, where l is
+    the support size, and the counts are then adjusted one run at a time
+    where the ratio of count to weight is smallest (to add) or largest (to
+    remove). Weights below ``1e-4`` times the largest weight are residue of
+    an iterative solver and are dropped first.
+
+    If more than n points remain, only n of them can be kept. With the
+    model matrix of the candidates, the heaviest points that span the
+    model are kept first, so the design is not singular when n is at
+    least the number of parameters; otherwise the n largest weights are
+    kept and a warning is issued, since they may not span the model.
+
+    Parameters
+    ----------
+    weights : ndarray of shape (N0,)
+        Non-negative design weights.
+    n_points : int
+        Number of runs of the exact design.
+    model_matrix : ndarray of shape (N0, p), optional
+        Model matrix of the candidates, used to keep a support that spans
+        the model when it must be truncated.
+
+    Returns
+    -------
+    ndarray of shape (N0,)
+        Number of runs at each candidate, summing to n_points.
+
+    Raises
+    ------
+    ValueError
+        If n_points is less than 1 or all weights are zero.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pydoe import efficient_rounding
+    >>> efficient_rounding(np.array([0.5, 0.3, 0.2]), 7)
+    array([3, 2, 2])
+    """
+    if n_points < 1:
+        raise ValueError("n_points must be at least 1")
+    w = np.asarray(weights, dtype=float)
+    if not np.any(w > 0):
+        raise ValueError("weights must have a positive entry")
+    w = np.where(w >= _NEGLIGIBLE_WEIGHT * np.max(w), w, 0.0)
+    support = np.flatnonzero(w > 0)
+    if support.size > n_points and model_matrix is not None:
+        support = np.sort(
+            _spanning_support(support, w, np.asarray(model_matrix), n_points)
+        )
+    elif support.size > n_points:
+        warnings.warn(
+            f"the weights have {support.size} support points but the design "
+            f"has {n_points} runs; keeping the {n_points} largest weights, "
+            f"which may not span the model",
+            stacklevel=2,
+        )
+        support = support[np.argsort(-w[support], kind="stable")[:n_points]]
+    w_s = w[support] / np.sum(w[support])
+
+    counts = np.ceil((n_points - support.size / 2) * w_s).astype(int)
+    while counts.sum() < n_points:
+        counts[np.argmin(counts / w_s)] += 1
+    while counts.sum() > n_points:
+        counts[np.argmax((counts - 1) / w_s)] -= 1
+
+    result = np.zeros(w.shape, dtype=int)
+    result[support] = counts
+    return result
@@ -0,0 +1,403 @@
+r"""
+Blocked and split-plot optimal designs.
+
+When the runs of an experiment are grouped in blocks (days, batches) or
+some factors are hard to change, the observations within a group are
+correlated. Writing $Z$ for the indicator matrix of the groups, the model
+
+$$y = X \beta + Z \gamma + \varepsilon$$
+
+has generalized least squares information matrix $X^T V^{-1} X$ with
+$V = I + \eta Z Z^T$, where $\eta$ is the ratio of the group variance to
+the error variance. Fixed block effects correspond to $\eta \to \infty$.
+The exchange algorithms below keep this matrix up to date with the
+rank-three updates of `BlockedInformationState`, so exchanging a run
+within its group costs $O(p^2)$ like an unblocked exchange.
+
+In a split-plot design the groups are whole plots: the hard-to-change
+factors are set once per whole plot and only the easy-to-change factors
+vary between its runs. Besides run exchanges, the split-plot algorithm
+exchanges the hard-to-change setting of a whole plot.
+
+References:
+    - Atkinson, A. C., Donev, A. N., & Tobias, R. D. (2007).
+    "Optimum Experimental Designs, with SAS." Oxford University Press.
+    - Goos, P., & Vandebroek, M. (2001). "Optimal Split-Plot Designs."
+    Journal of Quality Technology, 33(4), 436-450.
+    - Goos, P., & Jones, B. (2011). "Optimal Design of Experiments: A Case
+    Study Approach." Wiley.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Literal
+
+import numpy as np
+
+from pydoe.optimal.algorithms import _sequential_indices, _start_rng
+from pydoe.optimal.model import (
+    CandidateSet,
+    PolynomialModel,
+    _as_candidate_set,
+    _model_exponents,
+    build_design_matrix,
+)
+from pydoe.optimal.updates import BlockedInformationState
+from pydoe.optimal.utils import _scan_improvement
+
+
+__all__ = ["blocked_design", "split_plot_design"]
+
+# Criteria with block-aware updates.
+_BLOCKED_CRITERIA = ("D", "I")
+
+# Random starting designs tried before accepting a singular one.
+_MAX_STARTS = 10
+
+# Relative improvement required to accept an exchange.
+_BLOCKED_RTOL = 1e-10
+
+
+def _check_criterion(criterion: str) -> str:
+    """
+    Validate a criterion of the blocked algorithms.
+
+    Returns
+    -------
+    str
+        Upper-case criterion.
+
+    Raises
+    ------
+    ValueError
+        If the criterion has no block-aware updates.
+    """
+    crit = criterion.upper()
+    if crit not in _BLOCKED_CRITERIA:
+        raise ValueError(
+            f"blocked designs support criteria "
+            f"{', '.join(_BLOCKED_CRITERIA)}, got {criterion}"
+        )
+    return crit
+
+
+def _model_columns(
+    cset: CandidateSet, degree: int | PolynomialModel, *, fixed: bool
+) -> np.ndarray:
+    """
+    Columns of the model matrix estimable in the presence of block effects.
+
+    Fixed block effects absorb the intercept, whose column is dropped.
+
+    Returns
+    -------
+    ndarray of int
+        Indices of the retained model columns.
+    """
+    exponents = _model_exponents(cset.points.shape[1], degree)
+    keep = np.ones(len(exponents), dtype=bool)
+    if fixed:
+        keep &= np.any(exponents != 0, axis=1)
+    return np.flatnonzero(keep)
+
+
+def _exchange_runs(
+    state: BlockedInformationState,
+    rows: Sequence[int],
+    Y: np.ndarray,
+    best: float,
+) -> tuple[float, list]:
+    """
+    Move each run in 'rows' to the best candidate of 'Y' if that improves
+    the criterion, updating 'state' in place.
+
+    Returns
+    -------
+    best : float
+        Criterion value after the exchanges.
+    moves : list of tuple
+        (row, candidate) pairs of the accepted exchanges.
+    """
+    moves = []
+    for i in rows:
+        tol = _BLOCKED_RTOL * abs(best)
+        k, value = _scan_improvement(state.swap_values(i, Y), best, tol)
+        if k >= 0:
+            state.swap(i, Y[k])
+            moves.append((i, k))
+            best = value
+    return best, moves
+
+
+def _round_robin(sizes: np.ndarray) -> np.ndarray:
+    """
+    Block labels that deal consecutive runs to the blocks in turn.
+
+    Returns
+    -------
+    ndarray of int
+        Block of each run; block b appears sizes[b] times.
+    """
+    order = np.argsort(
+        np.concatenate([np.arange(size) for size in sizes]), kind="stable"
+    )
+    return np.repeat(np.arange(len(sizes)), sizes)[order]
+
+
+def blocked_design(  # noqa: PLR0913
+    candidates: np.ndarray | CandidateSet,
+    block_sizes: Sequence[int],
+    degree: int | PolynomialModel,
+    criterion: Literal["D", "I"] = "D",
+    max_iter: int = 100,
+    *,
+    block_effects: Literal["fixed", "random"] = "fixed",
+    variance_ratio: float = 1.0,
+    seed: int | np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Construct a D- or I-optimal design arranged in blocks.
+
+    The design starts from the greedy sequential design, dealt to the
+    blocks in turn, and is improved by exchanging each run for the best
+    candidate within its block until a pass brings no improvement. Every
+    exchange is scored with the generalized least squares information
+    matrix of the blocked model.
+
+    Parameters
+    ----------
+    candidates : ndarray of shape (N, k) or CandidateSet
+        Candidate points in the design space.
+    block_sizes : sequence of int
+        Number of runs in each block.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+    criterion : {'D', 'I'}, optional
+        Optimality criterion to maximize (default is 'D').
+    max_iter : int, optional
+        Maximum number of passes over the runs (default is 100).
+    block_effects : {'fixed', 'random'}, optional
+        Treat the block effects as fixed parameters, which absorb the
+        intercept (default), or as random effects with variance
+        ``variance_ratio`` times the error variance.
+    variance_ratio : float, optional
+        Ratio of the block variance to the error variance for random block
+        effects (default is 1.0).
+    seed : int, np.random.Generator or None, optional
+        Seed for a randomized start, in which the greedy construction begins
+        from randomly chosen candidates. If None (default), the start is the
+        deterministic greedy design.
+
+    Returns
+    -------
+    design : ndarray of shape (n, k)
+        Design points, ordered by block; n is the sum of block_sizes.
+    blocks : ndarray of shape (n,)
+        Block of each run.
+
+    Raises
+    ------
+    ValueError
+        If the criterion or block_effects is not supported, a block size
+        is less than 1, or variance_ratio is negative.
+
+    Notes
+    -----
+    Candidates may be repeated, within a block or across blocks.
+
+    Examples
+    --------
+    >>> from pydoe import blocked_design, generate_candidate_set
+    >>> candidates = generate_candidate_set(n_factors=3, n_levels=3)
+    >>> design, blocks = blocked_design(candidates, [6, 6, 6], degree=2)
+    >>> design.shape
+    (18, 3)
+    """
+    crit = _check_criterion(criterion)
+    if block_effects not in {"fixed", "random"}:
+        raise ValueError(f"Unknown block_effects: {block_effects}")
+    sizes = np.asarray(block_sizes, dtype=int)
+    if sizes.ndim != 1 or sizes.size == 0 or np.any(sizes < 1):
+        raise ValueError("block_sizes must be a sequence of positive ints")
+    if variance_ratio < 0:
+        raise ValueError(
+            f"variance_ratio must be non-negative, got {variance_ratio}"
+        )
+    fixed = block_effects == "fixed"
+    cset = _as_candidate_set(candidates, degree)
+    cols = _model_columns(cset, degree, fixed=fixed)
+    X0 = cset.X0[:, cols]
+    M_moment = cset.M_moment[np.ix_(cols, cols)] if crit == "I" else None
+
+    n = int(sizes.sum())
+    idx = _sequential_indices(
+        cset, n, crit, 0.0, replacement=n > len(cset), rng=_start_rng(seed)
+    )
+    blocks = _round_robin(sizes)
+    state = BlockedInformationState(
+        X0[idx],
+        blocks,
+        crit,
+        M_moment,
+        variance_ratio=None if fixed else variance_ratio,
+    )
+    best = state.value()
+
+    for _ in range(max_iter):
+        best, moves = _exchange_runs(state, range(n), X0, best)
+        for i, k in moves:
+            idx[i] = k
+        if not moves:
+            break
+
+    order = np.argsort(blocks, kind="stable")
+    return cset.points[idx[order]], blocks[order]
+
+
+def split_plot_design(  # noqa: PLR0912, PLR0913, PLR0914, PLR0917
+    candidates: np.ndarray | CandidateSet,
+    n_whole_plots: int,
+    whole_plot_size: int,
+    degree: int | PolynomialModel,
+    hard_to_change: Sequence[int],
+    criterion: Literal["D", "I"] = "D",
+    max_iter: int = 100,
+    *,
+    variance_ratio: float = 1.0,
+    seed: int | np.random.Generator | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Construct a D- or I-optimal split-plot design.
+
+    The hard-to-change factors are constant within each whole plot, whose
+    effect is random with variance ``variance_ratio`` times the error
+    variance. Starting from a random design, each pass exchanges every run
+    for the best candidate sharing its whole plot's hard-to-change setting
+    (scored with rank-three updates), then tries every other
+    hard-to-change setting for each whole plot, keeping the easy-to-change
+    settings of its runs.
+
+    Parameters
+    ----------
+    candidates : ndarray of shape (N, k) or CandidateSet
+        Candidate points in the design space. Each hard-to-change setting
+        should be combined with all easy-to-change settings.
+    n_whole_plots : int
+        Number of whole plots.
+    whole_plot_size : int
+        Number of runs in each whole plot.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+    hard_to_change : sequence of int
+        Indices of the hard-to-change factors.
+    criterion : {'D', 'I'}, optional
+        Optimality criterion to maximize (default is 'D').
+    max_iter : int, optional
+        Maximum number of passes (default is 100).
+    variance_ratio : float, optional
+        Ratio of the whole-plot variance to the error variance (default is
+        1.0).
+    seed : int, np.random.Generator or None, optional
+        Seed or generator for the random starting design.
+
+    Returns
+    -------
+    design : ndarray of shape (n_whole_plots * whole_plot_size, k)
+        Design points, ordered by whole plot.
+    whole_plots : ndarray of shape (n_whole_plots * whole_plot_size,)
+        Whole plot of each run.
+
+    Raises
+    ------
+    ValueError
+        If the criterion is not supported, n_whole_plots or
+        whole_plot_size is less than 1, hard_to_change is empty or out of
+        range, or variance_ratio is negative.
+
+    Examples
+    --------
+    >>> from pydoe import generate_candidate_set, split_plot_design
+    >>> candidates = generate_candidate_set(n_factors=3, n_levels=3)
+    >>> design, plots = split_plot_design(
+    ...     candidates, 6, 3, degree=2, hard_to_change=[0], seed=0
+    ... )
+    >>> design.shape
+    (18, 3)
+    """
+    crit = _check_criterion(criterion)
+    if n_whole_plots < 1 or whole_plot_size < 1:
+        raise ValueError("n_whole_plots and whole_plot_size must be positive")
+    if variance_ratio < 0:
+        raise ValueError(
+            f"variance_ratio must be non-negative, got {variance_ratio}"
+        )
+    cset = _as_candidate_set(candidates, degree)
+    points = cset.points
+    htc = np.unique(np.asarray(hard_to_change, dtype=int))
+    if htc.size == 0 or htc[0] < 0 or htc[-1] >= points.shape[1]:
+        raise ValueError(
+            f"hard_to_change must index factors 0 to {points.shape[1] - 1}"
+        )
+    settings, setting_of = np.unique(
+        points[:, htc], axis=0, return_inverse=True
+    )
+    setting_of = setting_of.ravel()
+    members = [np.flatnonzero(setting_of == c) for c in range(len(settings))]
+    X0 = cset.X0
+    M_moment = cset.M_moment if crit == "I" else None
+    rng = np.random.default_rng(seed)
+
+    plots = np.repeat(np.arange(n_whole_plots), whole_plot_size)
+    for _ in range(_MAX_STARTS):
+        plot_setting = rng.choice(
+            len(settings), n_whole_plots, replace=n_whole_plots > len(settings)
+        )
+        idx = np.concatenate([
+            rng.choice(
+                members[c],
+                whole_plot_size,
+                replace=whole_plot_size > members[c].size,
+            )
+            for c in plot_setting
+        ])
+        design = points[idx].copy()
+        state = BlockedInformationState(
+            X0[idx], plots, crit, M_moment, variance_ratio=variance_ratio
+        )
+        if state.uses_updates:
+            break
+    best = state.value()
+
+    for _ in range(max_iter):
+        start = best
+        # Run exchanges within each whole plot.
+        for w in range(n_whole_plots):
+            rows = np.flatnonzero(plots == w)
+            pool = members[plot_setting[w]]
+            best, moves = _exchange_runs(state, rows, X0[pool], best)
+            for i, k in moves:
+                design[i] = points[pool[k]]
+
+        # Whole-plot exchanges of the hard-to-change setting.
+        for w in range(n_whole_plots):
+            rows = np.flatnonzero(plots == w)
+            trial = design[rows].copy()
+            best_c, best_Y = -1, None
+            for c in range(len(settings)):
+                if c == plot_setting[w]:
+                    continue
+                trial[:, htc] = settings[c]
+                Y = build_design_matrix(trial, degree)
+                value = state.rows_value(rows, Y)
+                if value > best + _BLOCKED_RTOL * abs(best):
+                    best, best_c, best_Y = value, c, Y
+            if best_c >= 0:
+                design[np.ix_(rows, htc)] = settings[best_c]
+                plot_setting[w] = best_c
+                state.replace_rows(rows, best_Y)
+
+        if best <= start + _BLOCKED_RTOL * abs(start):
+            break
+
+    return design, plots
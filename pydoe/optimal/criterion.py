@@ -32,9 +32,73 @@ points.
 """
 
 import warnings
+from collections.abc import Iterator
 
 import numpy as np
 from scipy.linalg import LinAlgWarning, inv
+from scipy.linalg.lapack import dpotrf, dpotri
+
+
+# Reciprocal condition number below which `regularized_inv` regularizes,
+# the threshold at which scipy.linalg.inv warns.
+_RCOND_EPS = np.finfo(float).eps
+
+
+def _cholesky(M: np.ndarray) -> np.ndarray | None:
+    """
+    Lower Cholesky factor of a symmetric positive definite matrix.
+
+    This is the single factorization shared by the criterion kernels: the
+    log-determinant, the inverse and the traces the criteria need all
+    follow from it.
+
+    Returns
+    -------
+    ndarray of shape (p, p) or None
+        Factor L with $M = L L^T$ and a zero upper triangle, or None if M
+        is not symmetric positive definite.
+    """
+    M = np.asarray(M, dtype=float)
+    if M.ndim != 2 or M.shape[0] != M.shape[1] or M.size == 0:
+        return None
+    if not (M == M.T).all():
+        return None
+    L, info = dpotrf(M, lower=1, clean=1)
+    return L if info == 0 else None
+
+
+def _cholesky_inverse(L: np.ndarray) -> np.ndarray:
+    """
+    Inverse of $M = L L^T$ from its Cholesky factor.
+
+    Returns
+    -------
+    ndarray of shape (p, p)
+        Symmetric inverse of M.
+    """
+    # potri fills the lower triangle and keeps the zero upper one of L.
+    lower, _ = dpotri(L, lower=1)
+    M_inv = lower + lower.T
+    M_inv.flat[:: M_inv.shape[0] + 1] *= 0.5
+    return M_inv
+
+
+def _slogdet(M: np.ndarray) -> tuple[float, float]:
+    """
+    Sign and natural logarithm of the determinant of M.
+
+    Returns
+    -------
+    sign : float
+        1, 0 or -1.
+    logdet : float
+        Log of the absolute value of the determinant (-inf if singular).
+    """
+    L = _cholesky(M)
+    if L is not None:
+        return 1.0, float(2.0 * np.sum(np.log(np.diagonal(L))))
+    sign, logdet = np.linalg.slogdet(M)
+    return float(sign), float(logdet)
 
 
 def regularized_inv(M: np.ndarray, reg_param: float = 1e-8) -> np.ndarray:
@@ -60,7 +124,18 @@ def regularized_inv(M: np.ndarray, reg_param: float = 1e-8) -> np.ndarray:
     -------
     ndarray of shape (p, p)
         Inverse (or regularized inverse) of M.
+
+    Notes
+    -----
+    Well-conditioned symmetric positive definite matrices, the common case
+    for information matrices, are inverted from their Cholesky factor
+    without entering the warnings machinery.
     """
+    L = _cholesky(M)
+    if L is not None:
+        d = np.diagonal(L)
+        if np.min(d) ** 2 >= _RCOND_EPS * np.max(d) ** 2:
+            return _cholesky_inverse(L)
     with warnings.catch_warnings():
         warnings.simplefilter("error", LinAlgWarning)
         try:
@@ -70,7 +145,7 @@ def regularized_inv(M: np.ndarray, reg_param: float = 1e-8) -> np.ndarray:
             return inv(M_reg)
 
 
-def d_optimality(M: np.ndarray) -> float:
+def d_optimality(M: np.ndarray, *, log: bool = False) -> float:
     r"""
     Compute D-optimality criterion for a given information matrix.
 
@@ -84,12 +159,19 @@ def d_optimality(M: np.ndarray) -> float:
     ----------
     M : ndarray of shape (p, p)
         Information matrix.
+    log : bool, optional
+        If True, return $\log \det(M)$ (-inf unless M is positive
+        definite), which neither underflows nor overflows for models with
+        many parameters (default is False).
 
     Returns
     -------
     float
-        Determinant of the information matrix.
+        Determinant, or log-determinant, of the information matrix.
     """
+    if log:
+        sign, logdet = _slogdet(M)
+        return logdet if sign > 0 else -np.inf
     return float(np.linalg.det(M))
 
 
@@ -141,7 +223,8 @@ def i_optimality(M_X: np.ndarray, moment_matrix: np.ndarray) -> float:
     float
         Negative trace of moment_matrix @ inv(M_X).
     """
-    return -float(np.trace(moment_matrix @ regularized_inv(M_X)))
+    # tr(A B) = sum(A * B^T) avoids forming the product.
+    return -float(np.sum(moment_matrix * regularized_inv(M_X).T))
 
 
 def c_optimality(M: np.ndarray, c: np.ndarray) -> float:
@@ -200,7 +283,9 @@ def _pred_var_rows(rows: np.ndarray, M_inv: np.ndarray) -> np.ndarray:
     return np.einsum("ij,jk,ik->i", rows, M_inv, rows)
 
 
-def g_optimality(M: np.ndarray, candidates: np.ndarray) -> float:
+def g_optimality(
+    M: np.ndarray, candidates: np.ndarray | Iterator[np.ndarray]
+) -> float:
     r"""
     Compute G-optimality criterion for a given information matrix
     and candidate set.
@@ -216,8 +301,10 @@ def g_optimality(M: np.ndarray, candidates: np.ndarray) -> float:
     ----------
     M : ndarray of shape (p, p)
         Information matrix.
-    candidates : ndarray of shape (N, p)
-        Candidate points for prediction variance evaluation.
+    candidates : ndarray of shape (N, p) or iterator of ndarray
+        Candidate points for prediction variance evaluation, or an iterator
+        over blocks of them (for instance from `iter_candidate_set` with a
+        degree), which are scanned one at a time.
 
     Returns
     -------
@@ -225,8 +312,13 @@ def g_optimality(M: np.ndarray, candidates: np.ndarray) -> float:
         Negative maximum prediction variance.
     """
     M_inv = regularized_inv(M)
-    variances = _pred_var_rows(np.asarray(candidates), M_inv)
-    return -float(np.max(variances))
+    if not isinstance(candidates, Iterator):
+        variances = _pred_var_rows(np.asarray(candidates), M_inv)
+        return -float(np.max(variances))
+    return -max(
+        float(np.max(_pred_var_rows(block, M_inv), initial=-np.inf))
+        for block in candidates
+    )
 
 
 def i_pred_variance(M: np.ndarray, candidates: np.ndarray) -> float:
@@ -302,7 +394,10 @@ def s_optimality(M: np.ndarray) -> float:
         S-optimality value.
     """
     col_rms = np.sqrt(np.clip(np.diag(M), 1e-15, None))
-    return float(np.linalg.det(M) / np.prod(col_rms))
+    # Ratio of logs: det(M) and the product can over- or underflow on their
+    # own while their ratio is representable.
+    sign, logdet = _slogdet(M)
+    return float(sign * np.exp(logdet - np.sum(np.log(col_rms))))
 
 
 def t_optimality(X: np.ndarray, model_diff_subset: np.ndarray) -> float:
@@ -1,6 +1,6 @@
 import numpy as np
 
-from pydoe.optimal.criterion import regularized_inv
+from pydoe.optimal.criterion import _slogdet, regularized_inv
 from pydoe.optimal.utils import information_matrix
 
 
@@ -26,10 +26,10 @@ def d_efficiency(X: np.ndarray) -> float:
     """
     M = information_matrix(X, normalized=True, alpha=0.0, X0=None)
     p = X.shape[1]
-    det = np.linalg.det(M)
-    if det < 0:
+    sign, logdet = _slogdet(M)
+    if sign <= 0:
         return 0.0
-    return 100.0 * (det ** (1.0 / p))
+    return 100.0 * np.exp(logdet / p)
 
 
 def a_efficiency(X: np.ndarray) -> float:
@@ -49,12 +49,20 @@ $$X =
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import itertools
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import ClassVar
 
 import numpy as np
 
 
-def build_design_matrix(candidates: np.ndarray, degree: int) -> np.ndarray:
+def build_design_matrix(
+    candidates: np.ndarray, degree: int | PolynomialModel
+) -> np.ndarray:
     r"""
     Build design matrix X from candidate points for a polynomial model
     of given degree.
@@ -63,8 +71,9 @@ def build_design_matrix(candidates: np.ndarray, degree: int) -> np.ndarray:
     ----------
     candidates : ndarray of shape (n_points, n_factors)
         Candidate points in the design space.
-    degree : int
-        Polynomial degree (1=linear, 2=quadratic, etc.).
+    degree : int or PolynomialModel
+        Polynomial degree (1=linear, 2=quadratic, etc.), or a
+        `PolynomialModel` with custom terms.
 
     Returns
     -------
@@ -74,7 +83,8 @@ def build_design_matrix(candidates: np.ndarray, degree: int) -> np.ndarray:
     Raises
     ------
     ValueError
-        If degree is less than 1.
+        If degree is less than 1, or if a model for another number of
+        factors is given.
 
     Notes
     -----
@@ -90,63 +100,777 @@ def build_design_matrix(candidates: np.ndarray, degree: int) -> np.ndarray:
         $y = \beta_0 + \sum_{i=1}^k \beta_i x_i + \sum_{i=1}^k \beta_{ii} x_i^2 + \sum_{i<j} \beta_{ij} x_i x_j$
 
     where $k$ is the number of factors, $x_i$ are the input variables, and $\beta$ are
-    the model parameters.
+    the model parameters. Higher degrees add all monomials of degree 3 and
+    above.
     """  # noqa: E501
     candidates = np.asarray(candidates, dtype=float)
-    n_points, n_factors = candidates.shape
-
+    n_factors = candidates.shape[1]
+
+    if isinstance(degree, PolynomialModel):
+        if degree.n_factors != n_factors:
+            raise ValueError(
+                f"model has {degree.n_factors} factors, candidates have "
+                f"{n_factors}"
+            )
+        return degree.evaluate(candidates)
     if degree < 1:
         raise ValueError("Degree must be at least 1")
+    return _polynomial_model(n_factors, int(degree)).evaluate(candidates)
 
-    # Start with intercept term
-    X_cols = [np.ones(n_points)]
 
-    # Linear terms
-    for i in range(n_factors):
-        X_cols.append(candidates[:, i])
+def build_uniform_moment_matrix(
+    X0: np.ndarray | Iterator[np.ndarray],
+) -> np.ndarray:
+    """
+    Compute the moment matrix for I-optimality under uniform
+    measure over the candidate region.
 
-    if degree >= 2:
-        # Quadratic terms (pure squares)
-        for i in range(n_factors):
-            X_cols.append(candidates[:, i] ** 2)
+    Parameters
+    ----------
+    X0 : ndarray of shape (N0, p) or iterator of ndarray
+        Design matrix for the candidate region, or an iterator over its row
+        blocks (for instance from `iter_candidate_set` with a degree), which
+        are accumulated one at a time.
 
-        # Interaction terms (cross products)
+    Returns
+    -------
+    ndarray of shape (p, p)
+        Moment matrix.
+    """
+    if not isinstance(X0, Iterator):
+        N0 = X0.shape[0]
+        return (X0.T @ X0) / max(N0, 1)
+    H0, N0 = 0.0, 0
+    for block in X0:
+        H0 = H0 + block.T @ block  # noqa: PLR6104
+        N0 += block.shape[0]
+    return H0 / max(N0, 1)
+
+
+def _model_exponents(
+    n_factors: int, degree: int | PolynomialModel
+) -> np.ndarray:
+    """
+    Exponents of the model terms, in the column order of
+    `build_design_matrix`.
+
+    Returns
+    -------
+    ndarray of shape (p, n_factors)
+        Entry ``[t, i]`` is the power of factor ``i`` in model term ``t``.
+    """
+    if isinstance(degree, PolynomialModel):
+        return degree.exponents
+    eye = np.eye(n_factors, dtype=int)
+    terms = [np.zeros(n_factors, dtype=int), *eye]
+    if degree >= 2:
+        terms.extend(2 * eye)
         for i in range(n_factors):
             for j in range(i + 1, n_factors):
-                X_cols.append(candidates[:, i] * candidates[:, j])
+                terms.append(eye[i] + eye[j])
+    for d in range(3, degree + 1):
+        for combo in itertools.combinations_with_replacement(
+            range(n_factors), d
+        ):
+            terms.append(np.bincount(combo, minlength=n_factors))
+    return np.array(terms)
 
-    # Higher order terms if needed
-    if degree >= 3:
-        # Cubic terms and higher order interactions
-        for d in range(3, degree + 1):
-            for combo in itertools.combinations_with_replacement(
-                range(n_factors), d
-            ):
-                term = np.ones(n_points)
-                for factor_idx in combo:
-                    term *= candidates[:, factor_idx]
-                X_cols.append(term)
 
-    return np.column_stack(X_cols)
+# Number of points from which `PolynomialModel.evaluate` computes one term at
+# a time instead of all terms of a degree at once.
+_TERM_LOOP_MIN_ROWS = 512
 
 
-def build_uniform_moment_matrix(X0: np.ndarray) -> np.ndarray:
+@functools.lru_cache(maxsize=32)
+def _polynomial_model(n_factors: int, degree: int) -> PolynomialModel:
     """
-    Compute the moment matrix for I-optimality under uniform
-    measure over the candidate region.
+    Full polynomial model of a degree, compiled once per shape.
+
+    Returns
+    -------
+    PolynomialModel
+        Model with the terms of `build_design_matrix`.
+    """
+    return PolynomialModel(_model_exponents(n_factors, degree))
+
+
+class PolynomialModel:
+    r"""
+    Polynomial model compiled for fast evaluation of its model matrix.
+
+    A model is a list of monomial terms, each given by the powers of the
+    factors. Every term is evaluated as a lower-order monomial times one
+    factor, so a column costs one multiplication whatever its degree, and
+    all terms of the same degree are computed in one vectorized step.
+    Monomials that are needed as intermediates but are not model terms are
+    kept in scratch space.
+
+    A model can be passed as the ``degree`` argument of
+    `build_design_matrix`, `CandidateSet`, the algorithms and
+    `optimal_design` to use custom terms.
 
     Parameters
     ----------
-    X0 : ndarray of shape (N0, p)
-        Design matrix for the candidate region.
+    exponents : array_like of shape (p, k)
+        Non-negative integer powers; entry ``[t, i]`` is the power of factor
+        ``i`` in term ``t``. A row of zeros is the intercept.
+
+    Attributes
+    ----------
+    exponents : ndarray of shape (p, k)
+        Powers of the factors in every term (read-only).
+    n_factors : int
+        Number of factors k.
+    n_terms : int
+        Number of model terms p.
+
+    Raises
+    ------
+    ValueError
+        If exponents is not a non-empty 2-D array of non-negative integers
+        or contains a term twice.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pydoe import PolynomialModel
+    >>> model = PolynomialModel.from_terms(2, [(), (0,), (1,), (0, 1)])
+    >>> model.evaluate(np.array([[2.0, 3.0]]))
+    array([[1., 2., 3., 6.]])
+    """
+
+    def __init__(self, exponents: np.ndarray) -> None:
+        exps = np.array(exponents, dtype=np.int64)
+        if exps.ndim != 2 or exps.shape[0] == 0:
+            raise ValueError("exponents must be a non-empty 2-D array")
+        if (exps < 0).any():
+            raise ValueError("exponents must be non-negative")
+        if len(np.unique(exps, axis=0)) != len(exps):
+            raise ValueError("exponents contain a duplicate term")
+        exps.setflags(write=False)
+        self.exponents = exps
+        self.n_terms, self.n_factors = exps.shape
+        self._compile()
+
+    def _compile(self) -> None:
+        # Assign a slot to every monomial: the model terms first, followed
+        # by the lower-order monomials they are built from. Each monomial is
+        # its parent (one power less of its last factor) times that factor.
+        slots = {tuple(row): t for t, row in enumerate(self.exponents.tolist())}
+        pending = list(slots)
+        steps = {}
+        while pending:
+            mono = pending.pop()
+            if not any(mono):
+                continue
+            f = max(i for i, e in enumerate(mono) if e)
+            parent = (*mono[:f], mono[f] - 1, *mono[f + 1 :])
+            if parent not in slots:
+                slots[parent] = len(slots)
+                pending.append(parent)
+            steps.setdefault(sum(mono), []).append((
+                slots[mono],
+                slots[parent],
+                f,
+            ))
+        slots.setdefault((0,) * self.n_factors, len(slots))
+        self._one = slots[(0,) * self.n_factors]
+        self._n_slots = len(slots)
+        self._steps = [
+            tuple(np.array(col) for col in zip(*steps[d], strict=True))
+            for d in sorted(steps)
+        ]
+        self._step_terms = [op for d in sorted(steps) for op in steps[d]]
+
+    def __len__(self) -> int:
+        return self.n_terms
+
+    def __repr__(self) -> str:
+        return (
+            f"PolynomialModel(n_factors={self.n_factors}, "
+            f"n_terms={self.n_terms})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PolynomialModel):
+            return NotImplemented
+        return np.array_equal(self.exponents, other.exponents)
+
+    def __hash__(self) -> int:
+        return hash((self.exponents.shape, self.exponents.tobytes()))
+
+    @classmethod
+    def polynomial(cls, n_factors: int, degree: int) -> PolynomialModel:
+        """
+        Full polynomial model of a degree, as built by `build_design_matrix`.
+
+        Parameters
+        ----------
+        n_factors : int
+            Number of factors.
+        degree : int
+            Polynomial degree.
+
+        Returns
+        -------
+        PolynomialModel
+            Intercept and all monomials up to the degree.
+
+        Raises
+        ------
+        ValueError
+            If degree is less than 1.
+        """
+        if degree < 1:
+            raise ValueError("Degree must be at least 1")
+        return cls(_model_exponents(n_factors, degree))
+
+    @classmethod
+    def from_terms(cls, n_factors: int, terms: list) -> PolynomialModel:
+        """
+        Model from terms written as tuples of factor indices.
+
+        Parameters
+        ----------
+        n_factors : int
+            Number of factors.
+        terms : list of tuple of int
+            One tuple per term listing its factors, repeated for powers:
+            ``()`` is the intercept, ``(0,)`` is $x_0$, ``(0, 0)`` is
+            $x_0^2$ and ``(0, 2)`` is $x_0 x_2$.
+
+        Returns
+        -------
+        PolynomialModel
+            Model with the terms in the given order.
+
+        Raises
+        ------
+        ValueError
+            If a factor index is out of range.
+        """
+        exps = np.zeros((len(terms), n_factors), dtype=np.int64)
+        for t, term in enumerate(terms):
+            for i in term:
+                if not 0 <= i < n_factors:
+                    raise ValueError(
+                        f"factor index {i} out of range for {n_factors} factors"
+                    )
+                exps[t, i] += 1
+        return cls(exps)
+
+    @classmethod
+    def interactions(
+        cls, n_factors: int, order: int = 2, *, intercept: bool = True
+    ) -> PolynomialModel:
+        """
+        Main effects and interactions of distinct factors.
+
+        Parameters
+        ----------
+        n_factors : int
+            Number of factors.
+        order : int, optional
+            Highest number of factors in an interaction; 1 gives a main
+            effects model (default is 2).
+        intercept : bool, optional
+            Whether the model has an intercept (default is True).
+
+        Returns
+        -------
+        PolynomialModel
+            Model with the products of up to 'order' distinct factors.
+        """
+        terms = [()] if intercept else []
+        for d in range(1, order + 1):
+            terms.extend(itertools.combinations(range(n_factors), d))
+        return cls.from_terms(n_factors, terms)
+
+    @classmethod
+    def scheffe(cls, n_factors: int, degree: int = 2) -> PolynomialModel:
+        """
+        Scheffé canonical polynomial for mixture experiments.
+
+        Mixture components sum to one, so the model has no intercept and no
+        pure powers.
+
+        Parameters
+        ----------
+        n_factors : int
+            Number of mixture components.
+        degree : {1, 2, 3}, optional
+            1 for the linear, 2 for the quadratic and 3 for the special cubic
+            Scheffé model (default is 2).
+
+        Returns
+        -------
+        PolynomialModel
+            Products of up to 'degree' distinct components.
+
+        Raises
+        ------
+        ValueError
+            If degree is not 1, 2 or 3.
+        """
+        if degree not in {1, 2, 3}:
+            raise ValueError(f"Scheffé degree must be 1, 2 or 3, got {degree}")
+        return cls.interactions(n_factors, degree, intercept=False)
+
+    def evaluate(
+        self,
+        points: np.ndarray,
+        out: np.ndarray | None = None,
+        dtype: np.dtype | type = np.float64,
+    ) -> np.ndarray:
+        """
+        Model matrix of the points.
+
+        Parameters
+        ----------
+        points : ndarray of shape (n, k) or (k,)
+            Points to expand. A single point costs O(p) operations.
+        out : ndarray of shape (n, p) or (p,), optional
+            Array to write the result into; its dtype takes precedence over
+            'dtype'.
+        dtype : dtype, optional
+            Precision of the computation, e.g. np.float32 (default is
+            np.float64).
+
+        Returns
+        -------
+        ndarray of shape (n, p) or (p,)
+            Model matrix, or model row of a single point.
+
+        Raises
+        ------
+        ValueError
+            If the points do not have n_factors columns.
+        """
+        points = np.asarray(points)
+        single = points.ndim == 1
+        points = np.atleast_2d(points)
+        if points.shape[1] != self.n_factors:
+            raise ValueError(
+                f"points must have {self.n_factors} columns, got "
+                f"{points.shape[1]}"
+            )
+        if out is not None:
+            dtype = out.dtype
+        n_points = points.shape[0]
+        xt = np.ascontiguousarray(points.T, dtype=dtype)
+        work = np.empty((self._n_slots, n_points), dtype=dtype)
+        work[self._one] = 1
+        if n_points < _TERM_LOOP_MIN_ROWS:
+            # Few rows: one vectorized step per degree.
+            for targets, parents, factors in self._steps:
+                work[targets] = work[parents] * xt[factors]
+        else:
+            # Many rows: one contiguous multiply per term, no gathers.
+            for targets, parents, factors in self._step_terms:
+                np.multiply(work[parents], xt[factors], out=work[targets])
+        result = work[: self.n_terms].T
+        if single:
+            result = result[0]
+        if out is None:
+            return np.ascontiguousarray(result)
+        out[...] = result
+        return out
+
+
+def _factor_region(
+    n_factors: int, bounds: tuple | list | None, levels: int | list | None
+) -> tuple[list, list]:
+    """
+    Describe each factor as a continuous range or a set of discrete levels.
+
+    Returns
+    -------
+    bounds : list of tuple
+        Range (low, high) of each factor.
+    levels : list
+        Sorted discrete levels of each factor, or None for a continuous
+        factor.
+
+    Raises
+    ------
+    ValueError
+        If bounds or levels are not compatible with n_factors.
+    """
+    if bounds is None:
+        bounds = [(-1, 1)] * n_factors
+    elif isinstance(bounds, tuple) and len(bounds) == 2:
+        bounds = [bounds] * n_factors
+    elif len(bounds) != n_factors:
+        raise ValueError(f"bounds must have length {n_factors}")
+    bounds = [tuple(b) for b in bounds]
+
+    if levels is None or isinstance(levels, int):
+        levels = [levels] * n_factors
+    elif len(levels) != n_factors:
+        raise ValueError(f"levels must have length {n_factors}")
+
+    factor_levels = []
+    for i, spec in enumerate(levels):
+        if spec is None:
+            factor_levels.append(None)
+            continue
+        if isinstance(spec, int):
+            lev = np.linspace(*bounds[i], spec)
+        else:
+            lev = np.unique(np.asarray(spec, dtype=float))
+        if lev.size < 1:
+            raise ValueError(f"factor {i} has no levels")
+        bounds[i] = (lev[0], lev[-1])
+        factor_levels.append(lev)
+    return bounds, factor_levels
+
+
+def _region_moment_matrix(
+    bounds: list, levels: list, degree: int | PolynomialModel
+) -> np.ndarray:
+    """
+    Moment matrix of the model terms under the uniform measure on a region.
+
+    Continuous factors are uniform on their range and discrete factors are
+    uniform on their levels, so for a grid region the result equals
+    `build_uniform_moment_matrix` of the full factorial candidate set.
 
     Returns
     -------
     ndarray of shape (p, p)
         Moment matrix.
     """
-    N0 = X0.shape[0]
-    return (X0.T @ X0) / max(N0, 1)
+    exps = _model_exponents(len(bounds), degree)
+    orders = np.arange(2 * exps.max() + 1)
+    M = np.ones((len(exps), len(exps)))
+    for i, ((low, high), lev) in enumerate(zip(bounds, levels, strict=True)):
+        if lev is not None:
+            moments = np.mean(lev[:, None] ** orders, axis=0)
+        elif high > low:
+            moments = (high ** (orders + 1) - low ** (orders + 1)) / (
+                (orders + 1) * (high - low)
+            )
+        else:
+            moments = float(low) ** orders
+        M *= moments[exps[:, None, i] + exps[None, :, i]]
+    return M
+
+
+class CandidateSet:
+    r"""
+    Candidate region expanded once for a polynomial model.
+
+    A candidate set bundles the candidate points with everything the
+    algorithms and criteria derive from them: the model matrix $X_0$, the
+    uniform moment matrix used by I-optimality and the augmentation matrix
+    $H_0 = X_0^T X_0 / N_0$. Passing a `CandidateSet` instead of a raw array
+    to the algorithms, `optimal_design` or `criterion_value` computes these
+    only once. All arrays are read-only.
+
+    Parameters
+    ----------
+    candidates : ndarray of shape (N0, k)
+        Candidate points in the design space.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+
+    Attributes
+    ----------
+    points : ndarray of shape (N0, k)
+        Candidate points.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+    X0 : ndarray of shape (N0, p)
+        Model matrix of the candidate points.
+    M_moment : ndarray of shape (p, p)
+        Moment matrix under the uniform measure on the candidates.
+    H0 : ndarray of shape (p, p)
+        Augmentation matrix $X_0^T X_0 / N_0$. Under the uniform measure it
+        is the same matrix as `M_moment`.
+
+    Examples
+    --------
+    >>> from pydoe import CandidateSet, generate_candidate_set, optimal_design
+    >>> region = CandidateSet.cached(generate_candidate_set(2, n_levels=5), 2)
+    >>> design, info = optimal_design(region, n_points=8, degree=2)
+    """
+
+    #: Maximum number of entries kept by `CandidateSet.cached`.
+    cache_size = 16
+
+    _cache: ClassVar[OrderedDict[tuple, CandidateSet]] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, candidates: np.ndarray, degree: int | PolynomialModel
+    ) -> None:
+        points = np.array(candidates, dtype=float)
+        X0 = build_design_matrix(points, degree)
+        M_moment = build_uniform_moment_matrix(X0)
+        for arr in (points, X0, M_moment):
+            arr.flags.writeable = False
+
+        self.points = points
+        self.degree = degree
+        self.X0 = X0
+        self.M_moment = M_moment
+        self.H0 = M_moment
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        points: np.ndarray,
+        degree: int | PolynomialModel,
+        X0: np.ndarray,
+        M_moment: np.ndarray,
+    ) -> CandidateSet:
+        """
+        Wrap precomputed arrays (e.g. views of shared memory) without
+        copying or recomputing them.
+
+        Returns
+        -------
+        CandidateSet
+            Candidate set backed by the given arrays.
+        """
+        cset = cls.__new__(cls)
+        for arr in (points, X0, M_moment):
+            arr.flags.writeable = False
+        cset.points = points
+        cset.degree = degree
+        cset.X0 = X0
+        cset.M_moment = M_moment
+        cset.H0 = M_moment
+        return cset
+
+    def __len__(self) -> int:
+        return self.points.shape[0]
+
+    def __repr__(self) -> str:
+        n, k = self.points.shape
+        return (
+            f"CandidateSet(n_candidates={n}, n_factors={k}, "
+            f"degree={self.degree}, n_parameters={self.X0.shape[1]})"
+        )
+
+    @classmethod
+    def cached(
+        cls, candidates: np.ndarray, degree: int | PolynomialModel
+    ) -> CandidateSet:
+        """
+        Return the candidate set for (candidates, degree) from an LRU cache.
+
+        Repeated calls with equal candidate arrays and the same degree return
+        the same object, so services designing many experiments over one
+        region expand it only once. At most `CandidateSet.cache_size`
+        entries are kept.
+
+        Parameters
+        ----------
+        candidates : ndarray of shape (N0, k)
+            Candidate points in the design space.
+        degree : int or PolynomialModel
+            Polynomial degree of the model, or a `PolynomialModel`.
+
+        Returns
+        -------
+        CandidateSet
+            Cached (or newly built) candidate set.
+        """
+        points = np.ascontiguousarray(candidates, dtype=float)
+        digest = hashlib.blake2b(points.tobytes(), digest_size=16).digest()
+        if not isinstance(degree, PolynomialModel):
+            degree = int(degree)
+        key = (digest, points.shape, degree)
+        with cls._cache_lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key]
+        cset = cls(points, degree)
+        with cls._cache_lock:
+            cls._cache[key] = cset
+            while len(cls._cache) > max(cls.cache_size, 0):
+                cls._cache.popitem(last=False)
+        return cset
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove all entries from the `CandidateSet.cached` cache."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+
+def _as_candidate_set(
+    candidates: np.ndarray | CandidateSet, degree: int | PolynomialModel
+) -> CandidateSet:
+    """
+    Wrap a candidate array, or check the degree of a `CandidateSet`.
+
+    Parameters
+    ----------
+    candidates : ndarray of shape (N0, k) or CandidateSet
+        Candidate points in the design space.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
+
+    Returns
+    -------
+    CandidateSet
+        The given candidate set, or a new one built from the array.
+
+    Raises
+    ------
+    ValueError
+        If a `CandidateSet` built for another degree is given.
+    """
+    if isinstance(candidates, CandidateSet):
+        if candidates.degree != degree:
+            raise ValueError(
+                f"CandidateSet was built for degree {candidates.degree}, "
+                f"got degree {degree}"
+            )
+        return candidates
+    return CandidateSet(candidates, degree)
+
+
+def _candidate_bounds(
+    n_factors: int, bounds: tuple | list | None
+) -> list[tuple[float, float]]:
+    """
+    Bounds of every factor of a candidate set.
+
+    Returns
+    -------
+    list of tuple
+        (low, high) of each factor.
+
+    Raises
+    ------
+    ValueError
+        If bounds are not compatible with n_factors.
+    """
+    if bounds is None:
+        return [(-1, 1)] * n_factors
+    if isinstance(bounds, tuple) and len(bounds) == 2:
+        return [bounds] * n_factors
+    if len(bounds) != n_factors:
+        raise ValueError(f"bounds must have length {n_factors}")
+    return list(bounds)
+
+
+def _factorial_block(
+    levels: list[np.ndarray], start: int, stop: int
+) -> np.ndarray:
+    """
+    Rows start to stop of the full factorial grid over 'levels'.
+
+    The rows follow the order of ``itertools.product(*levels)`` (the last
+    factor varies fastest) and are computed from the row indices, without
+    building the preceding rows.
+
+    Returns
+    -------
+    ndarray of shape (stop - start, len(levels))
+        Grid points.
+    """
+    rows = np.arange(start, stop, dtype=np.int64)
+    block = np.empty((rows.size, len(levels)))
+    for i in range(len(levels) - 1, -1, -1):
+        rows, digit = np.divmod(rows, len(levels[i]))
+        block[:, i] = levels[i][digit]
+    return block
+
+
+def _candidate_blocks(  # noqa: PLR0913, PLR0917
+    n_factors: int,
+    bounds: list[tuple[float, float]],
+    n_levels: int,
+    grid_type: str,
+    chunk_size: int,
+    degree: int | PolynomialModel | None,
+) -> Iterator[np.ndarray]:
+    """
+    Yield the blocks of `iter_candidate_set`.
+
+    Yields
+    ------
+    ndarray
+        Candidate points, or their model matrix when degree is given.
+    """
+    n_candidates = n_levels**n_factors
+    levels = [np.linspace(low, high, n_levels) for low, high in bounds]
+    low = np.array([b[0] for b in bounds], dtype=float)
+    span = np.array([b[1] for b in bounds], dtype=float) - low
+    for start in range(0, n_candidates, chunk_size):
+        stop = min(start + chunk_size, n_candidates)
+        if grid_type == "full_factorial":
+            block = _factorial_block(levels, start, stop)
+        else:
+            block = np.random.uniform(size=(stop - start, n_factors))
+            block = block * span + low
+        yield block if degree is None else build_design_matrix(block, degree)
+
+
+def iter_candidate_set(  # noqa: PLR0913
+    n_factors: int,
+    bounds: tuple | list | None = None,
+    n_levels: int = 3,
+    grid_type: str = "full_factorial",
+    *,
+    chunk_size: int = 65536,
+    degree: int | PolynomialModel | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    Iterate over a candidate set in blocks of bounded size.
+
+    The blocks, stacked, equal `generate_candidate_set` called with the same
+    arguments, but only 'chunk_size' rows are held in memory at a time. This
+    allows regions whose full grid does not fit in memory to be scanned, for
+    instance by `g_optimality` or `build_uniform_moment_matrix`.
+
+    Parameters
+    ----------
+    n_factors : int
+        Number of factors/variables.
+    bounds : tuple or list of tuples, optional
+        Bounds for each factor. If single tuple, applies to all factors.
+        Default is (-1, 1) for all factors.
+    n_levels : int, optional
+        Number of levels per factor for grid (default is 3).
+    grid_type : {'full_factorial', 'uniform_random'}, optional
+        Type of grid to generate (default is 'full_factorial').
+    chunk_size : int, optional
+        Number of candidates per block (default is 65536).
+    degree : int or PolynomialModel, optional
+        If given, the blocks are the model matrices of the candidates for
+        this model instead of the candidates.
+
+    Returns
+    -------
+    iterator of ndarray
+        Blocks of shape (m, n_factors), or (m, p) when degree is given,
+        with m <= chunk_size.
+
+    Raises
+    ------
+    ValueError
+        If bounds are not compatible with n_factors, grid_type is unknown or
+        chunk_size is less than 1.
+
+    Examples
+    --------
+    >>> from pydoe import iter_candidate_set
+    >>> [block.shape for block in iter_candidate_set(2, chunk_size=4)]
+    [(4, 2), (4, 2), (1, 2)]
+    """
+    bounds = _candidate_bounds(n_factors, bounds)
+    if grid_type not in {"full_factorial", "uniform_random"}:
+        raise ValueError(f"Unknown grid_type: {grid_type}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    return _candidate_blocks(
+        n_factors, bounds, n_levels, grid_type, chunk_size, degree
+    )
 
 
 def generate_candidate_set(
@@ -180,20 +904,12 @@ def generate_candidate_set(
     ValueError
         If bounds are not compatible with n_factors or grid_type is unknown.
     """
-    if bounds is None:
-        bounds = [(-1, 1)] * n_factors
-    elif isinstance(bounds, tuple) and len(bounds) == 2:
-        bounds = [bounds] * n_factors
-    elif len(bounds) != n_factors:
-        raise ValueError(f"bounds must have length {n_factors}")
+    bounds = _candidate_bounds(n_factors, bounds)
 
     if grid_type == "full_factorial":
         # Generate full factorial grid
-        levels = []
-        for low, high in bounds:
-            levels.append(np.linspace(low, high, n_levels))
-
-        candidates = np.array(list(itertools.product(*levels)))
+        levels = [np.linspace(low, high, n_levels) for low, high in bounds]
+        candidates = _factorial_block(levels, 0, n_levels**n_factors)
 
     elif grid_type == "uniform_random":
         # Generate random uniform points
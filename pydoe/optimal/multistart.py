@@ -0,0 +1,151 @@
+"""
+Multi-start execution of the optimal design algorithms.
+
+Exchange algorithms converge to local optima that depend on their starting
+design, so `optimal_design` can run several randomized starts and keep the
+best design. Starts are independent and may run in a process pool. The
+read-only arrays of the candidate set (points and model matrix) are placed
+in shared memory once and mapped by every worker instead of being pickled
+for each start.
+
+Every start receives its own random generator, spawned from the user seed
+before any work is dispatched, so the results do not depend on the number
+of workers or on the order in which starts complete.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from pydoe.optimal.model import CandidateSet
+
+
+__all__ = ["resolve_n_jobs", "run_starts"]
+
+# Candidate set and shared memory blocks attached by a pool worker.
+_WORKER: dict = {}
+
+
+def resolve_n_jobs(n_jobs: int | None, n_tasks: int) -> int:
+    """
+    Number of worker processes to use for 'n_tasks' independent tasks.
+
+    Parameters
+    ----------
+    n_jobs : int or None
+        Requested number of processes. None or -1 uses all CPUs.
+    n_tasks : int
+        Number of tasks to run.
+
+    Returns
+    -------
+    int
+        Number of processes, between 1 and 'n_tasks'.
+
+    Raises
+    ------
+    ValueError
+        If n_jobs is zero or less than -1.
+    """
+    if n_jobs is None or n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(
+            f"n_jobs must be a positive integer or -1, got {n_jobs}"
+        )
+    return max(1, min(n_jobs, n_tasks))
+
+
+def _share(arr: np.ndarray) -> tuple[shared_memory.SharedMemory, tuple]:
+    # Copy 'arr' into a new shared memory block; the returned spec lets a
+    # worker map it again.
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach(spec: tuple) -> tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(
+    func: Callable, specs: tuple | None, degree: int, M_moment: np.ndarray
+) -> None:
+    _WORKER["func"] = func
+    _WORKER["cset"] = None
+    if specs is not None:
+        (shm_points, points), (shm_X0, X0) = map(_attach, specs)
+        _WORKER["shm"] = (shm_points, shm_X0)
+        _WORKER["cset"] = CandidateSet._from_arrays(
+            points, degree, X0, M_moment
+        )
+
+
+def _run_in_worker(task: tuple) -> object:
+    return _WORKER["func"](_WORKER["cset"], *task)
+
+
+def run_starts(
+    func: Callable,
+    tasks: Sequence[tuple],
+    *,
+    cset: CandidateSet | None = None,
+    n_jobs: int | None = 1,
+) -> list:
+    """
+    Evaluate ``func(cset, *task)`` for every task, in order.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function taking the candidate set followed by the
+        task arguments.
+    tasks : sequence of tuple
+        Arguments of each start.
+    cset : CandidateSet, optional
+        Candidate set shared by all starts. With several processes its
+        points and model matrix are passed through shared memory.
+    n_jobs : int or None, optional
+        Number of processes. 1 (default) runs the starts serially in the
+        calling process; None or -1 uses all CPUs.
+
+    Returns
+    -------
+    list
+        Results of the starts, in the order of 'tasks'.
+    """
+    n_workers = resolve_n_jobs(n_jobs, len(tasks))
+    if n_workers == 1:
+        return [func(cset, *task) for task in tasks]
+
+    blocks = []
+    try:
+        specs = None
+        degree, M_moment = None, None
+        if cset is not None:
+            for arr in (cset.points, cset.X0):
+                shm, spec = _share(np.ascontiguousarray(arr))
+                blocks.append((shm, spec))
+            specs = tuple(spec for _, spec in blocks)
+            degree, M_moment = cset.degree, np.array(cset.M_moment)
+        # Workers are spawned rather than forked: the parent may be running
+        # BLAS threads, which makes fork() unsafe.
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(func, specs, degree, M_moment),
+        ) as pool:
+            return list(pool.map(_run_in_worker, tasks))
+    finally:
+        for shm, _ in blocks:
+            shm.close()
+            shm.unlink()
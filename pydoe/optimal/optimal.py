@@ -1,31 +1,175 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Literal
 
 import numpy as np
 
 from pydoe.optimal.algorithms import (
+    coordinate_exchange,
     detmax,
     fedorov,
     modified_fedorov,
     sequential_dykstra,
     simple_exchange_wynn_mitchell,
 )
+from pydoe.optimal.approximate import approximate_design, efficient_rounding
 from pydoe.optimal.efficiency import a_efficiency, d_efficiency
-from pydoe.optimal.model import build_design_matrix, build_uniform_moment_matrix
+from pydoe.optimal.model import (
+    CandidateSet,
+    PolynomialModel,
+    _as_candidate_set,
+    _factor_region,
+    _region_moment_matrix,
+    build_design_matrix,
+)
+from pydoe.optimal.multistart import run_starts
 from pydoe.optimal.utils import criterion_value
 
 
+_EXCHANGE_METHODS = {
+    "simple_exchange": simple_exchange_wynn_mitchell,
+    "fedorov": fedorov,
+    "modified_fedorov": modified_fedorov,
+    "detmax": detmax,
+}
+
+# Methods accepting the early-termination controls.
+_SEARCH_METHODS = ("fedorov", "modified_fedorov", "detmax")
+
+
+def _coordinate_region(
+    candidates: np.ndarray | CandidateSet | None,
+    n_factors: int | None,
+    levels: int | list | None,
+) -> tuple[int, int | list | None]:
+    """
+    Number of factors and levels of the 'coordinate_exchange' region.
+
+    Returns
+    -------
+    n_factors : int
+        Number of factors.
+    levels : int, list or None
+        Levels of the factors; see `coordinate_exchange`.
+
+    Raises
+    ------
+    ValueError
+        If neither candidates nor n_factors describe the region.
+    """
+    if candidates is not None:
+        if isinstance(candidates, CandidateSet):
+            candidates = candidates.points
+        candidates = np.asarray(candidates, dtype=float)
+        return candidates.shape[1], [np.unique(c) for c in candidates.T]
+    if n_factors is None:
+        raise ValueError(
+            "coordinate_exchange needs candidates or n_factors to define "
+            "the design region"
+        )
+    return n_factors, levels
+
+
+def _run_start(  # noqa: PLR0913, PLR0917
+    cset: CandidateSet | None,
+    method: str,
+    n_points: int,
+    degree: int | PolynomialModel,
+    criterion: str,
+    alpha: float,
+    max_iter: int,
+    options: dict,
+    seed: np.random.Generator | None,
+) -> tuple[np.ndarray, float]:
+    """
+    Run one start of `optimal_design` and score its design.
+
+    Returns
+    -------
+    design : ndarray of shape (n_points, k)
+        Design points.
+    score : float
+        Criterion value of the design.
+    """
+    M_moment = None
+    if method == "coordinate_exchange":
+        design = coordinate_exchange(
+            options["n_factors"],
+            n_points,
+            degree,
+            criterion,
+            max_iter,
+            bounds=options["bounds"],
+            levels=options["levels"],
+            seed=seed,
+            fixed_points=options["fixed_points"],
+        )
+        M_moment = options["M_moment"]
+    elif method == "approximate":
+        weights, _ = approximate_design(
+            cset, degree, criterion, max_iter=max_iter
+        )
+        counts = efficient_rounding(weights, n_points, model_matrix=cset.X0)
+        design = np.repeat(cset.points, counts, axis=0)
+    elif method == "sequential":
+        design = sequential_dykstra(
+            cset,
+            n_points,
+            degree,
+            criterion,
+            alpha,
+            replacement=options["replacement"],
+            seed=seed,
+            fixed_points=options["fixed_points"],
+        )
+    else:
+        design = _EXCHANGE_METHODS[method](
+            cset,
+            n_points,
+            degree,
+            criterion,
+            alpha,
+            max_iter,
+            replacement=options["replacement"],
+            seed=seed,
+            fixed_points=options["fixed_points"],
+            **options["search"],
+        )
+    X = build_design_matrix(design, degree)
+    return design, float(criterion_value(X, criterion, cset, alpha, M_moment))
+
+
 def optimal_design(  # noqa: PLR0913, PLR0917
-    candidates: np.ndarray,
+    candidates: np.ndarray | CandidateSet | None,
     n_points: int,
-    degree: int,
+    degree: int | PolynomialModel,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"] = "D",
     method: Literal[
-        "sequential", "simple_exchange", "fedorov", "modified_fedorov", "detmax"
+        "sequential",
+        "simple_exchange",
+        "fedorov",
+        "modified_fedorov",
+        "detmax",
+        "coordinate_exchange",
+        "approximate",
     ] = "sequential",
     alpha: float = 0.0,
     max_iter: int = 200,
+    *,
+    replacement: bool = False,
+    n_factors: int | None = None,
+    bounds: tuple | list | None = None,
+    levels: int | list | None = None,
+    seed: int | np.random.Generator | None = None,
+    n_starts: int = 1,
+    n_jobs: int | None = 1,
+    time_budget: float | None = None,
+    tol_relative: float = 0.0,
+    first_improvement: bool = False,
+    max_candidates: int | None = None,
+    callback: Callable[[dict], bool | None] | None = None,
+    fixed_points: np.ndarray | None = None,
 ) -> tuple[np.ndarray, dict]:
     """
     Generate an optimal experimental design using a specified
@@ -33,21 +177,56 @@ def optimal_design(  # noqa: PLR0913, PLR0917
 
     Parameters
     ----------
-    candidates : ndarray of shape (N0, k)
-        Candidate set (region R).
+    candidates : ndarray of shape (N0, k), CandidateSet or None
+        Candidate set (region R). Pass a `CandidateSet` to reuse the
+        expanded model matrices across calls. For 'coordinate_exchange'
+        the candidates only supply the levels of each factor and may be
+        None, in which case the region is given by n_factors, bounds and
+        levels.
     n_points : int
         Requested design size (n >= p is recommended).
-    degree : int
-        Polynomial degree of the model.
+    degree : int or PolynomialModel
+        Polynomial degree of the model, or a `PolynomialModel`.
     criterion : {'D', 'A', 'I'}, optional
         Optimality criterion to maximize (default is 'D').
     method : {'sequential', 'simple_exchange', 'fedorov', 'modified_fedorov',
-              'detmax'}, optional. Algorithm to use for design generation
-              (default is 'detmax').
+              'detmax', 'coordinate_exchange', 'approximate'}, optional.
+              Algorithm to use for design generation (default is 'detmax').
+              'approximate' computes the optimal weights on the candidates
+              with `approximate_design` and rounds them to n_points runs
+              with `efficient_rounding`; the design may replicate runs.
     alpha : float, optional
         Augmentation parameter for information matrix (default is 0.0).
     max_iter : int, optional
         Maximum number of iterations for iterative methods (default is 200).
+    replacement : bool, optional
+        If True, candidates may be selected more than once, giving designs
+        with replicated runs (default is False).
+    n_factors, bounds, levels : optional
+        Design region for 'coordinate_exchange' when no candidates are
+        given; see `coordinate_exchange`.
+    seed : int, np.random.Generator or None, optional
+        Seed of the randomized starts. The design is reproducible for a
+        fixed seed, whatever the value of n_jobs.
+    n_starts : int, optional
+        Number of starts; the best design is returned (default is 1). The
+        first start of the candidate-set algorithms is their deterministic
+        greedy start, the others begin from randomly chosen candidates.
+        Every start of 'coordinate_exchange' is random.
+    n_jobs : int or None, optional
+        Number of processes running the starts. 1 (default) runs them in
+        the calling process; None or -1 uses all CPUs. Workers are
+        spawned, so scripts using n_jobs > 1 need an
+        ``if __name__ == "__main__":`` guard.
+    time_budget, tol_relative, first_improvement, max_candidates, callback :
+        optional
+        Early-termination controls of the 'fedorov', 'modified_fedorov' and
+        'detmax' searches; see `fedorov`. The time budget applies to each
+        start, and a callback used with n_jobs > 1 must be picklable.
+    fixed_points : ndarray of shape (m, k), optional
+        Runs that must stay in the design, such as experiments already
+        performed; the design is augmented with n_points - m new runs.
+        Not supported by 'approximate'.
 
     Returns
     -------
@@ -64,41 +243,82 @@ def optimal_design(  # noqa: PLR0913, PLR0917
         - 'A_eff': A-efficiency
         - 'p_columns': number of model parameters
         - 'n_runs': number of runs in the design
+        - 'n_starts': number of starts
+        - 'start_scores': criterion value reached by each start
+        - 'best_start': index of the start that gave the design
 
     Raises
     ------
     ValueError
-        If an unknown method or criterion is specified.
+        If an unknown method or criterion is specified, if n_starts is less
+        than 1, if alpha is nonzero for 'coordinate_exchange' or
+        'approximate', if early-termination controls are given for a
+        method without them, or if fixed_points are given for
+        'approximate'.
     """
-    # Choose algorithm
-    if method == "sequential":
-        design = sequential_dykstra(
-            candidates, n_points, degree, criterion, alpha
-        )
-    elif method == "simple_exchange":
-        design = simple_exchange_wynn_mitchell(
-            candidates, n_points, degree, criterion, alpha, max_iter
-        )
-    elif method == "fedorov":
-        design = fedorov(
-            candidates, n_points, degree, criterion, alpha, max_iter
+    if n_starts < 1:
+        raise ValueError("n_starts must be at least 1")
+    search = {
+        name: value
+        for name, value, default in (
+            ("time_budget", time_budget, None),
+            ("tol_relative", tol_relative, 0.0),
+            ("first_improvement", first_improvement, False),
+            ("max_candidates", max_candidates, None),
+            ("callback", callback, None),
         )
-    elif method == "modified_fedorov":
-        design = modified_fedorov(
-            candidates, n_points, degree, criterion, alpha, max_iter
-        )
-    elif method == "detmax":
-        design = detmax(
-            candidates, n_points, degree, criterion, alpha, max_iter
+        if value != default
+    }
+    if search and method not in _SEARCH_METHODS:
+        raise ValueError(
+            f"{', '.join(search)} only apply to the methods "
+            f"{', '.join(_SEARCH_METHODS)}, got {method}"
         )
+    options = {
+        "replacement": replacement,
+        "search": search,
+        "fixed_points": fixed_points,
+    }
+    if method == "coordinate_exchange":
+        if alpha:
+            raise ValueError("coordinate_exchange does not support alpha")
+        n_factors, levels = _coordinate_region(candidates, n_factors, levels)
+        options = {
+            "n_factors": n_factors,
+            "bounds": bounds,
+            "levels": levels,
+            "M_moment": _region_moment_matrix(
+                *_factor_region(n_factors, bounds, levels), degree
+            ),
+            "fixed_points": fixed_points,
+        }
+        cset = None
+    elif method in {"sequential", "approximate"} or method in _EXCHANGE_METHODS:
+        if method == "approximate" and alpha:
+            raise ValueError("approximate does not support alpha")
+        if method == "approximate" and fixed_points is not None:
+            raise ValueError("approximate does not support fixed_points")
+        cset = _as_candidate_set(candidates, degree)
     else:
         raise ValueError("Unknown method.")
 
+    # Every start gets its own generator, spawned before dispatch so that
+    # the result does not depend on n_jobs. The first start of the
+    # candidate-set algorithms keeps the deterministic greedy start.
+    rngs = np.random.default_rng(seed).spawn(n_starts)
+    if method != "coordinate_exchange":
+        rngs[0] = None
+    tasks = [
+        (method, n_points, degree, criterion, alpha, max_iter, options, rng)
+        for rng in rngs
+    ]
+    results = run_starts(_run_start, tasks, cset=cset, n_jobs=n_jobs)
+    start_scores = [score for _, score in results]
+    best_start = int(np.argmax(np.nan_to_num(start_scores, nan=-np.inf)))
+    design, score = results[best_start]
+
     # Scores & efficiencies
     X = build_design_matrix(design, degree)
-    X0 = build_design_matrix(candidates, degree)
-    M_moment = build_uniform_moment_matrix(X0)
-    score = criterion_value(X, criterion, X0, alpha, M_moment)
     info = {
         "criterion": criterion,
         "method": method,
@@ -109,5 +329,8 @@ def optimal_design(  # noqa: PLR0913, PLR0917
         "A_eff": float(a_efficiency(X)),
         "p_columns": int(X.shape[1]),
         "n_runs": int(X.shape[0]),
+        "n_starts": n_starts,
+        "start_scores": start_scores,
+        "best_start": best_start,
     }
     return design, info
@@ -0,0 +1,986 @@
+r"""
+Rank-one updates of the information matrix for exchange algorithms.
+
+Exchanging the design point $x$ for the candidate $y$ changes the
+unnormalized information matrix $H = X^T X + \alpha H_0$ by the rank-two
+term $y y^T - x x^T$. Writing $d(a, b) = a^T H^{-1} b$, the matrix
+determinant lemma gives Fedorov's delta function
+
+$$\frac{\det(H')}{\det(H)} = (1 - d(x, x))(1 + d(y, y)) + d(x, y)^2$$
+
+and the Woodbury identity gives the updated inverse, from which the
+trace criteria $\operatorname{tr}(W H'^{-1})$ (A-, I-, C- and
+V-optimality) follow in closed form. Every swap of a design is
+therefore scored in $O(p^2)$ operations instead of rebuilding and
+refactorizing $X^T X$. Adding or dropping a single point is the special
+case $x = 0$ or $y = 0$, so greedy construction scores a whole candidate
+set from the leverages $y^T H^{-1} y$ in one vectorized expression.
+
+G-optimality depends on the prediction variances $r^T H^{-1} r$ of all
+rows r of the candidate set. They are kept up to date with the same
+low-rank corrections of $H^{-1}$, so a swap changes every variance by a
+2 x 2 quadratic form. To score many swaps, the largest variances after
+each swap are first bounded on the current top-k candidates, and only
+the swaps whose bound can beat the best exactly scored swap are scored
+over the whole candidate set.
+
+References:
+    - Fedorov, V. V. (1972). "Theory of Optimal Experiments." Academic Press.
+    - Atkinson, A. C., Donev, A. N., & Tobias, R. D. (2007).
+    "Optimum Experimental Designs, with SAS." Oxford University Press.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Literal
+
+import numpy as np
+
+from pydoe.optimal.criterion import _cholesky, _cholesky_inverse, d_optimality
+from pydoe.optimal.model import CandidateSet
+from pydoe.optimal.utils import criterion_value, information_matrix
+
+
+__all__ = ["BlockedInformationState", "InformationState"]
+
+#: Criteria whose change under an exchange has a closed form.
+RANK_ONE_CRITERIA = frozenset({"D", "A", "I", "C", "V"})
+
+# Below this reciprocal condition number the updates are not trusted and
+# candidate designs are scored exactly instead.
+_RCOND_MIN = 1e-10
+
+# Exchanges whose determinant ratio falls below this value would make the
+# information matrix (numerically) singular and are never accepted.
+_LAMBDA_MIN = 1e-10
+
+# Tikhonov shift applied by `regularized_inv` to rank-deficient matrices.
+_RIDGE = 1e-8
+
+# Candidates with the largest prediction variances on which G-optimal swaps
+# are screened, and the number of screened swaps scored exactly at a time.
+_G_SCREEN = 32
+_G_BATCH = 64
+
+# Largest number of prediction variances computed at once.
+_G_BLOCK = 1 << 20
+
+# Relative tolerance within which two candidate moves are considered tied,
+# and the largest tie that is re-scored exactly.
+_TIE_RTOL = 1e-8
+_MAX_EXACT_TIES = 64
+
+
+class InformationState:
+    """
+    Information matrix of an exact design, kept up to date under exchanges.
+
+    The state holds the model matrix of the current design together with
+    $H = X^T X + X_f^T X_f + \\alpha H_0$, its inverse and its
+    log-determinant, where $X_f$ holds the model rows of fixed runs. Swaps,
+    additions and deletions are scored and applied with rank-one updates
+    for the D-, A-, I-, C- and V-criteria, and for the G-criterion when
+    the candidate set is given. For any other criterion every
+    candidate design is scored exactly with `criterion_value`. While $H$
+    is rank-deficient (e.g. at the start of a greedy construction),
+    additions and deletions are scored on the Tikhonov-regularized matrix
+    used by `regularized_inv`, and swaps are scored exactly.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n, p)
+        Model matrix of the current design.
+    criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'}
+        Optimality criterion to maximize.
+    X0 : ndarray of shape (N0, p) or CandidateSet, optional
+        Model matrix of the candidate set, used for augmentation. A
+        `CandidateSet` also supplies the moment matrix and $H_0$.
+    alpha : float, optional
+        Augmentation parameter for information matrix (default is 0.0).
+    M_moment : ndarray of shape (p, p), optional
+        Moment matrix for I-optimality.
+    refresh_every : int, optional
+        Number of applied swaps after which $H^{-1}$ is recomputed from
+        scratch to bound round-off drift (default is 50).
+    log_det : bool, optional
+        If True, D-optimality values are reported as $\\log \\det(M)$
+        instead of $\\det(M)$, which does not underflow for models with
+        many parameters (default is False).
+    fixed : ndarray of shape (m, p), optional
+        Model rows of runs that stay in the design. Their contribution is
+        added to $H$ once; they count towards the number of runs but are
+        never exchanged, added or dropped.
+    g_screen : int or None, optional
+        Number of candidates with the largest prediction variances on
+        which G-optimal swaps are screened (default is 32). `swap_values`
+        then scores exactly every swap that could be the best one and
+        returns -inf for the swaps that provably cannot. None scores all
+        swaps exactly.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        X: np.ndarray,
+        criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"],
+        X0: np.ndarray | CandidateSet | None = None,
+        alpha: float = 0.0,
+        M_moment: np.ndarray | None = None,
+        *,
+        refresh_every: int = 50,
+        log_det: bool = False,
+        fixed: np.ndarray | None = None,
+        g_screen: int | None = _G_SCREEN,
+    ) -> None:
+        self.X = np.array(X, dtype=float)
+        self.criterion = criterion.upper()
+        self.X0 = X0
+        self.alpha = alpha
+        self.refresh_every = refresh_every
+        self.log_det = log_det and self.criterion == "D"
+
+        p = self.X.shape[1]
+        self.base = np.zeros((p, p))
+        if isinstance(X0, CandidateSet):
+            if M_moment is None:
+                M_moment = X0.M_moment
+            if alpha and len(X0) > 0:
+                self.base = alpha * X0.H0
+        elif alpha and X0 is not None and len(X0) > 0:
+            self.base = alpha * (X0.T @ X0) / X0.shape[0]
+        # The augmentation alone is the weight of V-optimality.
+        self._augment = self.base
+        self.fixed = np.empty((0, p))
+        if fixed is not None and len(fixed) > 0:
+            self.fixed = np.array(fixed, dtype=float)
+            self.base = self._augment + self.fixed.T @ self.fixed
+        self.M_moment = M_moment
+        # Region over which G-optimality takes the largest variance.
+        self._region = None
+        if self.criterion == "G" and X0 is not None:
+            region = X0.X0 if isinstance(X0, CandidateSet) else X0
+            self._region = np.asarray(region, dtype=float)
+        self.g_screen = g_screen
+        self.refresh()
+
+    @property
+    def n(self) -> int:
+        """Number of runs in the current design, including fixed runs."""
+        return self.X.shape[0] + self.fixed.shape[0]
+
+    @property
+    def p(self) -> int:
+        """Number of model parameters."""
+        return self.X.shape[1]
+
+    @property
+    def uses_updates(self) -> bool:
+        """Whether swaps are currently scored with rank-one updates."""
+        closed_form = (
+            self.criterion in RANK_ONE_CRITERIA or self._region is not None
+        )
+        return closed_form and self._stable
+
+    def refresh(self) -> None:
+        """Recompute $H$, its inverse and log-determinant from scratch."""
+        self.H = self.X.T @ self.X + self.base
+        self._n_updates = 0
+        self._G, self._trace = None, 0.0
+        # One Cholesky factorization gives the log-determinant and the
+        # inverse; the 1-norm condition number follows from both.
+        L = _cholesky(self.H)
+        if L is None:
+            self.sign, self.logdet = np.linalg.slogdet(self.H)
+            self._stable = False
+            return
+        self.sign = 1.0
+        self.logdet = 2.0 * np.sum(np.log(np.diagonal(L)))
+        H_inv = _cholesky_inverse(L)
+        rcond = 1.0 / (np.linalg.norm(self.H, 1) * np.linalg.norm(H_inv, 1))
+        self._stable = bool(rcond > _RCOND_MIN)
+        if self._stable:
+            self.H_inv = H_inv
+            self._update_trace_terms()
+            if self._region is not None:
+                self._P = self._region @ H_inv
+                self._var = np.einsum("ij,ij->i", self._P, self._region)
+
+    def value(self) -> float:
+        """
+        Criterion value of the current design.
+
+        Returns
+        -------
+        float
+            Value of the criterion, as returned by `criterion_value`.
+        """
+        return self._exact_value(self.X)
+
+    def swap_values(  # noqa: PLR0914
+        self, rows: np.ndarray, Y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Criterion values of all designs obtained by a single exchange.
+
+        Parameters
+        ----------
+        rows : array_like of int, shape (m,)
+            Positions of the design points that may be removed.
+        Y : ndarray of shape (N, p)
+            Model rows of the candidates that may be added.
+
+        Returns
+        -------
+        ndarray of shape (m, N)
+            Entry ``[a, j]`` is the criterion value of the design in which
+            the point at position ``rows[a]`` is replaced by ``Y[j]``.
+        """
+        rows = np.atleast_1d(np.asarray(rows, dtype=int))
+        Y = np.asarray(Y, dtype=float)
+        if not self.uses_updates:
+            return self._swap_values_exact(rows, Y)
+
+        Xr = self.X[rows]
+        BX = Xr @ self.H_inv
+        BY = Y @ self.H_inv
+        d_xx = np.einsum("ij,ij->i", Xr, BX)
+        d_yy = np.einsum("ij,ij->i", Y, BY)
+        d_xy = BX @ Y.T
+        lam = np.outer(1.0 - d_xx, 1.0 + d_yy) + d_xy**2
+
+        if self.criterion == "D":
+            return self._d_values(self.n, lam)
+        if self.criterion == "G":
+            return self._g_swap_values(Xr, Y, d_xx, d_yy, d_xy, lam)
+
+        GX = Xr @ self._G
+        g_xx = np.einsum("ij,ij->i", Xr, GX)
+        g_yy = np.einsum("ij,ij->i", Y, Y @ self._G)
+        g_xy = GX @ Y.T
+        numerator = (
+            np.outer(d_xx - 1.0, g_yy)
+            - 2.0 * d_xy * g_xy
+            + np.outer(g_xx, 1.0 + d_yy)
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            trace = self._trace + numerator / lam
+        coef, offset = self._trace_form(self.n)
+        values = offset + coef * trace
+        values[lam <= _LAMBDA_MIN] = -np.inf
+        return values
+
+    def add_values(self, Y: np.ndarray) -> np.ndarray:
+        """
+        Criterion values of all designs obtained by adding one point.
+
+        Parameters
+        ----------
+        Y : ndarray of shape (N, p)
+            Model rows of the candidates that may be added.
+
+        Returns
+        -------
+        ndarray of shape (N,)
+            Entry ``j`` is the criterion value of the design augmented
+            with ``Y[j]``.
+        """
+        Y = np.asarray(Y, dtype=float)
+        if not self.uses_updates:
+            return np.array([self._add_value_exact(y) for y in Y])
+
+        n_new = self.n + 1
+        lam = 1.0 + np.einsum("ij,ij->i", Y, Y @ self.H_inv)
+        if self.criterion == "D":
+            return self._d_values(n_new, lam)
+        if self.criterion == "G":
+            return -n_new * self._max_variance(Y, -1.0 / lam)
+        coef, offset = self._trace_form(n_new)
+        g_yy = np.einsum("ij,ij->i", Y, Y @ self._G)
+        return offset + coef * (self._trace - g_yy / lam)
+
+    def drop_values(self) -> np.ndarray:
+        """
+        Criterion values of all designs obtained by dropping one point.
+
+        Returns
+        -------
+        ndarray of shape (n,)
+            Entry ``i`` is the criterion value of the design without its
+            ``i``-th point.
+        """
+        if not self.uses_updates:
+            return np.array([
+                self._drop_value_exact(i) for i in range(len(self.X))
+            ])
+
+        n_new = self.n - 1
+        lam = 1.0 - np.einsum("ij,ij->i", self.X, self.X @ self.H_inv)
+        singular = lam <= _LAMBDA_MIN
+        if self.criterion == "D":
+            values = self._d_values(n_new, lam)
+        elif self.criterion == "G":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = -n_new * self._max_variance(self.X, 1.0 / lam)
+        else:
+            coef, offset = self._trace_form(n_new)
+            g_xx = np.einsum("ij,ij->i", self.X, self.X @ self._G)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = offset + coef * (self._trace + g_xx / lam)
+        # Removing a point that the design cannot spare leaves a singular
+        # matrix, whose regularized criterion has no closed form.
+        for i in np.flatnonzero(singular):
+            values[i] = self._drop_value_exact(i)
+        return values
+
+    def best_add(self, Y: np.ndarray) -> tuple[int, float]:
+        """
+        Find the candidate whose addition maximizes the criterion.
+
+        Parameters
+        ----------
+        Y : ndarray of shape (N, p)
+            Model rows of the candidates that may be added.
+
+        Returns
+        -------
+        best_idx : int
+            Index in ``Y`` of the best candidate to add (or -1 if none).
+        best_val : float
+            Best criterion value achieved.
+        """
+        Y = np.asarray(Y, dtype=float)
+        if Y.shape[0] == 0:
+            return -1, self.value()
+        if not self._stable:
+            leverage = self._regularized_leverage(Y, self.n + 1)
+            j = _first_max(leverage)
+            return j, self._add_value_exact(Y[j])
+        return self._select(
+            self.add_values(Y), lambda j: self._add_value_exact(Y[j])
+        )
+
+    def best_drop(self) -> tuple[int, float]:
+        """
+        Find the design point whose removal maximizes the criterion.
+
+        Returns
+        -------
+        best_idx : int
+            Position of the best point to drop (or -1 if the design has a
+            single point).
+        best_val : float
+            Best criterion value achieved after the drop.
+        """
+        if len(self.X) == 0 or self.n <= 1:
+            return -1, self.value()
+        if not self._stable:
+            leverage = self._regularized_leverage(self.X, self.n - 1)
+            i = _first_max(-leverage)
+            return i, self._drop_value_exact(i)
+        idx, val = self._select(self.drop_values(), self._drop_value_exact)
+        return max(idx, 0), val
+
+    def add(self, y: np.ndarray) -> None:
+        """
+        Append the model row ``y`` to the design.
+
+        Parameters
+        ----------
+        y : ndarray of shape (p,)
+            Model row of the point to add.
+        """
+        y = np.asarray(y, dtype=float)
+        self.X = np.vstack([self.X, y])
+        if not self._stable:
+            self.refresh()
+            return
+
+        By = self.H_inv @ y
+        lam = 1.0 + y @ By
+        self._n_updates += 1
+        if self._n_updates >= self.refresh_every:
+            self.refresh()
+            return
+
+        self.H += np.outer(y, y)
+        self._correct_variances(By[:, None], np.array([[1.0 / lam]]))
+        self.H_inv -= np.outer(By, By) / lam
+        self.logdet += np.log(lam)
+        self._update_trace_terms()
+
+    def drop(self, row: int) -> None:
+        """
+        Remove the design point at position ``row``.
+
+        Parameters
+        ----------
+        row : int
+            Position of the design point to remove.
+        """
+        x = self.X[row].copy()
+        self.X = np.delete(self.X, row, axis=0)
+        if not self._stable:
+            self.refresh()
+            return
+
+        Bx = self.H_inv @ x
+        lam = 1.0 - x @ Bx
+        self._n_updates += 1
+        if lam <= _LAMBDA_MIN or self._n_updates >= self.refresh_every:
+            self.refresh()
+            return
+
+        self.H -= np.outer(x, x)
+        self._correct_variances(Bx[:, None], np.array([[-1.0 / lam]]))
+        self.H_inv += np.outer(Bx, Bx) / lam
+        self.logdet += np.log(lam)
+        self._update_trace_terms()
+
+    def swap(self, row: int, y: np.ndarray) -> None:
+        """
+        Replace the design point at position ``row`` by the model row ``y``.
+
+        Parameters
+        ----------
+        row : int
+            Position of the design point to remove.
+        y : ndarray of shape (p,)
+            Model row of the point to add.
+        """
+        y = np.asarray(y, dtype=float)
+        x = self.X[row].copy()
+        self.X[row] = y
+        if not self._stable:
+            self.refresh()
+            return
+
+        U = np.column_stack([y, x])
+        BU = self.H_inv @ U
+        S = np.diag([1.0, -1.0]) + U.T @ BU
+        lam = -np.linalg.det(S)
+        self._n_updates += 1
+        if lam <= _LAMBDA_MIN or self._n_updates >= self.refresh_every:
+            self.refresh()
+            return
+
+        self.H += np.outer(y, y) - np.outer(x, x)
+        self._correct_variances(BU, np.linalg.inv(S))
+        self.H_inv -= BU @ np.linalg.solve(S, BU.T)
+        self.logdet += np.log(lam)
+        self._update_trace_terms()
+
+    # ------------------------------------------------------------------
+
+    def _trace_form(self, n: int) -> tuple[float, float]:
+        # Trace criteria are ``offset + coef * tr(W H^-1)``; the scaling by
+        # n comes from M^-1 = n H^-1. V-optimality is evaluated at the
+        # design points themselves (fixed runs included), so
+        # tr(X^T X H^-1) = p - tr(alpha H_0 H^-1).
+        if self.criterion == "V":
+            return 1.0, -float(self.p)
+        return -float(n), 0.0
+
+    def _d_values(self, n: int, lam: np.ndarray) -> np.ndarray:
+        # det(M') = det(H) / n^p * lam for the normalized information
+        # matrix, where lam = det(H') / det(H).
+        log_det = self.logdet - self.p * np.log(n)
+        if self.log_det:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(lam > 0, log_det + np.log(lam), -np.inf)
+        return np.exp(log_det) * lam
+
+    def _weight_matrix(self) -> np.ndarray:
+        if self.criterion == "A":
+            return np.eye(self.p)
+        if self.criterion == "I":
+            M_moment = self.M_moment
+            if M_moment is None and self.X0 is not None:
+                M_moment = (self.X0.T @ self.X0) / max(self.X0.shape[0], 1)
+            return M_moment
+        if self.criterion == "C":
+            return np.ones((self.p, self.p))
+        # V
+        return self._augment
+
+    def _update_trace_terms(self) -> None:
+        if self.criterion in RANK_ONE_CRITERIA - {"D"}:
+            W = self._weight_matrix()
+            self._G = self.H_inv @ W @ self.H_inv
+            self._trace = float(np.sum(W * self.H_inv))
+
+    def _correct_variances(self, B: np.ndarray, C: np.ndarray) -> None:
+        # Apply H^-1 -> H^-1 - B C B^T to the G-optimality region terms
+        # P = R H^-1 and the prediction variances diag(R H^-1 R^T).
+        if self._region is None:
+            return
+        RB = self._region @ B
+        RBC = RB @ C
+        self._P -= RBC @ B.T
+        self._var -= np.einsum("ij,ij->i", RBC, RB)
+
+    def _max_variance(self, Y: np.ndarray, coef: np.ndarray) -> np.ndarray:
+        # Largest prediction variance after H^-1 -> H^-1 + coef_j b_j b_j^T
+        # with b_j = H^-1 y_j, for every row y_j of Y (adding a point has
+        # coef = -1 / (1 + y^T H^-1 y), dropping one 1 / (1 - x^T H^-1 x)).
+        out = np.empty(len(Y))
+        step = max(1, _G_BLOCK // len(self._var))
+        for start in range(0, len(Y), step):
+            A = self._P @ Y[start : start + step].T
+            v = self._var[:, None] + coef[start : start + step] * A**2
+            out[start : start + step] = np.max(v, axis=0)
+        return out
+
+    def _swap_variances(  # noqa: PLR0913, PLR0917
+        self,
+        region: np.ndarray | slice,
+        ax: np.ndarray,
+        AY: np.ndarray,
+        d_xx: np.ndarray,
+        d_yy: np.ndarray,
+        d_xy: np.ndarray,
+        lam: np.ndarray,
+    ) -> np.ndarray:
+        # Largest prediction variance over 'region' after swapping x for
+        # each y. With U = [y, x] the swap subtracts B S^-1 B^T from H^-1,
+        # S = diag(1, -1) + U^T H^-1 U and det(S) = -lam, which changes the
+        # variance of r by ((d_xx - 1) a_y^2 - 2 d_xy a_x a_y
+        # + (1 + d_yy) a_x^2) / lam, where a = r^T H^-1 U. Arguments are
+        # broadcast against the candidate axis of AY.
+        v = (
+            self._var[region][:, None]
+            + (
+                (d_xx - 1.0) * AY**2
+                - 2.0 * d_xy * AY * ax
+                + (1.0 + d_yy) * ax**2
+            )
+            / lam
+        )
+        return np.max(v, axis=0)
+
+    def _g_swap_values(  # noqa: PLR0913, PLR0914, PLR0917
+        self,
+        Xr: np.ndarray,
+        Y: np.ndarray,
+        d_xx: np.ndarray,
+        d_yy: np.ndarray,
+        d_xy: np.ndarray,
+        lam: np.ndarray,
+    ) -> np.ndarray:
+        n, m, N = self.n, len(Xr), len(Y)
+        valid = lam > _LAMBDA_MIN
+        lam = np.where(valid, lam, 1.0)
+        AX = self._P @ Xr.T
+        values = np.full((m, N), -np.inf)
+        screen = self.g_screen
+        if screen is None or screen >= len(self._var):
+            step = max(1, _G_BLOCK // len(self._var))
+            for start in range(0, N, step):
+                cols = slice(start, start + step)
+                AY = self._P @ Y[cols].T
+                for a in range(m):
+                    values[a, cols] = -n * self._swap_variances(
+                        slice(None),
+                        AX[:, a : a + 1],
+                        AY,
+                        d_xx[a],
+                        d_yy[cols],
+                        d_xy[a, cols],
+                        lam[a, cols],
+                    )
+            values[~valid] = -np.inf
+            return values
+
+        # The top-k variances bound the largest variance from below, so the
+        # screened values bound the criterion from above. Swaps are scored
+        # exactly in order of their bound until no bound can beat the best.
+        top = np.argpartition(self._var, -screen)[-screen:]
+        AY_top = self._P[top] @ Y.T
+        bound = np.empty((m, N))
+        for a in range(m):
+            bound[a] = -n * self._swap_variances(
+                top, AX[top, a : a + 1], AY_top, d_xx[a], d_yy, d_xy[a], lam[a]
+            )
+        bound[~valid] = -np.inf
+        flat = bound.ravel()
+        order = np.argsort(-flat, kind="stable")
+        best = -np.inf
+        for start in range(0, order.size, _G_BATCH):
+            batch = order[start : start + _G_BATCH]
+            if flat[batch[0]] < best - _TIE_RTOL * abs(best):
+                break
+            rows, cols = np.divmod(batch, N)
+            exact = -n * self._swap_variances(
+                slice(None),
+                AX[:, rows],
+                self._P @ Y[cols].T,
+                d_xx[rows],
+                d_yy[cols],
+                d_xy[rows, cols],
+                lam[rows, cols],
+            )
+            exact[~np.isfinite(flat[batch])] = -np.inf
+            values.flat[batch] = exact
+            best = max(best, float(np.max(exact)))
+        return values
+
+    def _regularized_leverage(self, Y: np.ndarray, n: int) -> np.ndarray:
+        # While H is rank-deficient every criterion is degenerate, so points
+        # are added (or dropped) to maximize the determinant of the matrix
+        # shifted by the ridge `regularized_inv` applies to M = H / n, i.e.
+        # by their leverage y^T (H + n * ridge * I)^-1 y.
+        R = self.H + n * _RIDGE * np.eye(self.p)
+        return np.einsum("ij,ij->i", Y, np.linalg.solve(R, Y.T).T)
+
+    def _select(
+        self, values: np.ndarray, exact: Callable[[int], float]
+    ) -> tuple[int, float]:
+        # First maximum, ignoring NaN. Moves tied up to round-off are
+        # re-scored exactly so that the choice among them agrees with a
+        # direct evaluation of the criterion; larger (degenerate) ties are
+        # resolved by order.
+        values = np.where(np.isnan(values), -np.inf, values)
+        best = np.max(values)
+        if not np.isfinite(best):
+            return -1, -np.inf
+        if not self.uses_updates:
+            idx = int(np.argmax(values))
+            return idx, float(values[idx])
+        # A relative tolerance on det(M) is an absolute one on its log.
+        tol = _TIE_RTOL if self.log_det else _TIE_RTOL * abs(best)
+        near = np.flatnonzero(values >= best - tol)
+        if near.size == 1 or near.size > _MAX_EXACT_TIES:
+            return int(near[0]), float(values[near[0]])
+
+        best_idx, best_val = -1, -np.inf
+        for k in near:
+            val = exact(k)
+            if val > best_val:
+                best_idx, best_val = int(k), val
+        return best_idx, best_val
+
+    def _exact_value(self, X: np.ndarray) -> float:
+        if len(self.fixed):
+            X = np.vstack([self.fixed, X])
+        if self.log_det:
+            M = information_matrix(X, alpha=self.alpha, X0=self.X0)
+            return d_optimality(M, log=True)
+        return criterion_value(
+            X, self.criterion, self.X0, self.alpha, self.M_moment
+        )
+
+    def _add_value_exact(self, y: np.ndarray) -> float:
+        return self._exact_value(np.vstack([self.X, y]))
+
+    def _drop_value_exact(self, row: int) -> float:
+        return self._exact_value(np.delete(self.X, row, axis=0))
+
+    def _swap_values_exact(self, rows: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        values = np.empty((rows.shape[0], Y.shape[0]))
+        trial = self.X.copy()
+        for a, i in enumerate(rows):
+            for j in range(Y.shape[0]):
+                trial[i] = Y[j]
+                values[a, j] = self._exact_value(trial)
+            trial[i] = self.X[i]
+        return values
+
+
+class BlockedInformationState:
+    """
+    Information matrix of a blocked design, kept up to date under
+    exchanges within blocks.
+
+    With block effects $\\gamma_b$ the generalized least squares
+    information matrix of the model parameters is
+
+    $$H = X^T V^{-1} X = X^T X - \\sum_b c_b s_b s_b^T,$$
+
+    where $s_b$ is the sum of the model rows in block b. Random block
+    effects whose variance is $\\eta$ times the error variance give
+    $c_b = \\eta / (1 + \\eta n_b)$; fixed block effects are the limit
+    $c_b = 1 / n_b$, in which case the model matrix must not contain an
+    intercept. Replacing the run x of block b by y changes $H$ by
+    $U K U^T$ with $U = [x, y, s_b]$ and
+
+    $$K = \\operatorname{diag}(-1, 1, c_b) - c_b e e^T, \\quad
+    e = (-1, 1, 1)^T,$$
+
+    so the matrix determinant lemma and the Woodbury identity score every
+    swap from the 3 x 3 matrix $I + K U^T H^{-1} U$ in $O(p^2)$ operations.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n, p)
+        Model matrix of the current design.
+    blocks : array_like of int, shape (n,)
+        Block of each run, labelled 0 to n_blocks - 1.
+    criterion : {'D', 'I'}, optional
+        Optimality criterion to maximize (default is 'D').
+    M_moment : ndarray of shape (p, p), optional
+        Moment matrix for I-optimality.
+    variance_ratio : float or None, optional
+        Ratio $\\eta$ of the block variance to the error variance for
+        random block effects. None (default) treats the blocks as fixed.
+    refresh_every : int, optional
+        Number of applied swaps after which $H^{-1}$ is recomputed from
+        scratch to bound round-off drift (default is 50).
+
+    Raises
+    ------
+    ValueError
+        If the criterion is not 'D' or 'I', or I-optimality is requested
+        without a moment matrix.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        X: np.ndarray,
+        blocks: np.ndarray,
+        criterion: Literal["D", "I"] = "D",
+        M_moment: np.ndarray | None = None,
+        *,
+        variance_ratio: float | None = None,
+        refresh_every: int = 50,
+    ) -> None:
+        self.criterion = criterion.upper()
+        if self.criterion not in {"D", "I"}:
+            raise ValueError(
+                f"blocked designs support criteria D, I, got {criterion}"
+            )
+        if self.criterion == "I" and M_moment is None:
+            raise ValueError("I-optimality needs a moment matrix")
+        self.X = np.array(X, dtype=float)
+        self.blocks = np.asarray(blocks, dtype=int)
+        self.M_moment = M_moment
+        self.variance_ratio = variance_ratio
+        self.refresh_every = refresh_every
+        sizes = np.bincount(self.blocks)
+        if variance_ratio is None:
+            self.coef = 1.0 / np.maximum(sizes, 1)
+        else:
+            self.coef = variance_ratio / (1.0 + variance_ratio * sizes)
+        self.refresh()
+
+    @property
+    def n(self) -> int:
+        """Number of runs in the current design."""
+        return self.X.shape[0]
+
+    @property
+    def p(self) -> int:
+        """Number of model parameters."""
+        return self.X.shape[1]
+
+    @property
+    def uses_updates(self) -> bool:
+        """Whether swaps are currently scored with rank-three updates."""
+        return self._stable
+
+    def refresh(self) -> None:
+        """Recompute the block sums, $H$ and its inverse from scratch."""
+        self.sums = np.zeros((len(self.coef), self.p))
+        np.add.at(self.sums, self.blocks, self.X)
+        self.H = self._information(self.X, self.sums)
+        self._n_updates = 0
+        L = _cholesky(self.H)
+        self._stable = False
+        if L is not None:
+            H_inv = _cholesky_inverse(L)
+            rcond = 1.0 / (np.linalg.norm(self.H, 1) * np.linalg.norm(H_inv, 1))
+            self._stable = bool(rcond > _RCOND_MIN)
+        if self._stable:
+            self.H_inv = H_inv
+            self.logdet = 2.0 * np.sum(np.log(np.diagonal(L)))
+            self._update_trace_terms()
+
+    def value(self) -> float:
+        """
+        Criterion value of the current design.
+
+        Returns
+        -------
+        float
+            $\\log \\det(M)$ for D-optimality and
+            $-\\operatorname{tr}(M_{moment} M^{-1})$ for I-optimality, with
+            $M = H / n$. Singular designs are scored on $H$ shifted by the
+            ridge of `regularized_inv`.
+        """
+        if not self._stable:
+            return self._exact_value(self.X, self.sums)
+        if self.criterion == "D":
+            return float(self.logdet - self.p * np.log(self.n))
+        return -self.n * self._trace
+
+    def swap_values(  # noqa: PLR0914
+        self, row: int, Y: np.ndarray
+    ) -> np.ndarray:
+        """
+        Criterion values of the designs in which the run at position 'row'
+        is replaced by each candidate, within the same block.
+
+        Parameters
+        ----------
+        row : int
+            Position of the run to replace.
+        Y : ndarray of shape (N, p)
+            Model rows of the candidates.
+
+        Returns
+        -------
+        ndarray of shape (N,)
+            Criterion value after each exchange.
+        """
+        Y = np.asarray(Y, dtype=float)
+        if not self._stable:
+            return np.array([self._swap_value_exact(row, y) for y in Y])
+
+        x, b = self.X[row], self.blocks[row]
+        s = self.sums[b]
+        K = self._kernel(b)
+        Bx, Bs = self.H_inv @ x, self.H_inv @ s
+        BY = Y @ self.H_inv
+        G = np.empty((len(Y), 3, 3))
+        G[:, 0, 0] = x @ Bx
+        G[:, 0, 1] = G[:, 1, 0] = Y @ Bx
+        G[:, 0, 2] = G[:, 2, 0] = x @ Bs
+        G[:, 1, 1] = np.einsum("ij,ij->i", Y, BY)
+        G[:, 1, 2] = G[:, 2, 1] = Y @ Bs
+        G[:, 2, 2] = s @ Bs
+        S = np.eye(3) + K @ G
+        lam = np.linalg.det(S)
+        singular = lam <= _LAMBDA_MIN
+        S[singular] = np.eye(3)
+
+        if self.criterion == "D":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = self.logdet + np.log(lam) - self.p * np.log(self.n)
+        else:
+            Gx, Gs = self._G @ x, self._G @ s
+            Q = np.empty((len(Y), 3, 3))
+            Q[:, 0, 0] = x @ Gx
+            Q[:, 0, 1] = Q[:, 1, 0] = Y @ Gx
+            Q[:, 0, 2] = Q[:, 2, 0] = x @ Gs
+            Q[:, 1, 1] = np.einsum("ij,ij->i", Y, Y @ self._G)
+            Q[:, 1, 2] = Q[:, 2, 1] = Y @ Gs
+            Q[:, 2, 2] = s @ Gs
+            reduction = np.trace(np.linalg.solve(S, K @ Q), axis1=1, axis2=2)
+            values = -self.n * (self._trace - reduction)
+        values[singular] = -np.inf
+        return values
+
+    def swap(self, row: int, y: np.ndarray) -> None:
+        """
+        Replace the run at position 'row' by the model row 'y', keeping its
+        block.
+
+        Parameters
+        ----------
+        row : int
+            Position of the run to replace.
+        y : ndarray of shape (p,)
+            Model row of the new run.
+        """
+        y = np.asarray(y, dtype=float)
+        x, b = self.X[row].copy(), self.blocks[row]
+        U = np.column_stack([x, y, self.sums[b]])
+        self.X[row] = y
+        if not self._stable:
+            self.refresh()
+            return
+
+        K = self._kernel(b)
+        BU = self.H_inv @ U
+        S = np.eye(3) + K @ (U.T @ BU)
+        lam = np.linalg.det(S)
+        self._n_updates += 1
+        if lam <= _LAMBDA_MIN or self._n_updates >= self.refresh_every:
+            self.refresh()
+            return
+
+        self.sums[b] += y - x
+        self.H += U @ K @ U.T
+        self.H_inv -= BU @ np.linalg.solve(S, K @ BU.T)
+        self.logdet += np.log(lam)
+        self._update_trace_terms()
+
+    def replace_rows(self, rows: np.ndarray, Y: np.ndarray) -> None:
+        """
+        Replace several runs at once and recompute the state.
+
+        Parameters
+        ----------
+        rows : array_like of int
+            Positions of the runs to replace.
+        Y : ndarray of shape (len(rows), p)
+            Model rows of the new runs.
+        """
+        self.X[rows] = Y
+        self.refresh()
+
+    def rows_value(self, rows: np.ndarray, Y: np.ndarray) -> float:
+        """
+        Criterion value of the design with several runs replaced.
+
+        Parameters
+        ----------
+        rows : array_like of int
+            Positions of the runs to replace.
+        Y : ndarray of shape (len(rows), p)
+            Model rows of the new runs.
+
+        Returns
+        -------
+        float
+            Criterion value of the modified design.
+        """
+        X = self.X.copy()
+        X[rows] = Y
+        sums = np.zeros_like(self.sums)
+        np.add.at(sums, self.blocks, X)
+        return self._exact_value(X, sums)
+
+    # ------------------------------------------------------------------
+
+    def _information(self, X: np.ndarray, sums: np.ndarray) -> np.ndarray:
+        # Both products are formed as A^T A, which keeps H exactly
+        # symmetric for the Cholesky factorization.
+        scaled = sums * np.sqrt(self.coef)[:, None]
+        return X.T @ X - scaled.T @ scaled
+
+    def _kernel(self, b: int) -> np.ndarray:
+        c = self.coef[b]
+        return np.diag([-1.0, 1.0, c]) - c * np.outer(_SWAP_E, _SWAP_E)
+
+    def _update_trace_terms(self) -> None:
+        if self.criterion == "I":
+            self._G = self.H_inv @ self.M_moment @ self.H_inv
+            self._trace = float(np.sum(self.M_moment * self.H_inv))
+
+    def _exact_value(self, X: np.ndarray, sums: np.ndarray) -> float:
+        n = X.shape[0]
+        H = self._information(X, sums)
+        L = _cholesky(H)
+        if L is None:
+            H += n * _RIDGE * np.eye(self.p)
+            L = _cholesky(H)
+            if L is None:
+                return -np.inf
+        if self.criterion == "D":
+            return float(
+                2.0 * np.sum(np.log(np.diagonal(L))) - self.p * np.log(n)
+            )
+        return -n * float(np.sum(self.M_moment * _cholesky_inverse(L)))
+
+    def _swap_value_exact(self, row: int, y: np.ndarray) -> float:
+        return self.rows_value([row], y[None, :])
+
+
+# Coefficients of the new block sum s - x + y in the basis (x, y, s).
+_SWAP_E = np.array([-1.0, 1.0, 1.0])
+
+
+def _first_max(values: np.ndarray) -> int:
+    # Index of the first entry within round-off of the maximum, so that
+    # exact ties are resolved by candidate order.
+    best = np.max(values)
+    return int(np.argmax(values >= best - _TIE_RTOL * abs(best)))
@@ -5,21 +5,23 @@ from typing import Literal
 import numpy as np
 
 from pydoe.optimal.criterion import (
+    _RCOND_EPS,
     a_optimality,
     c_optimality,
     d_optimality,
     e_optimality,
     g_optimality,
     i_optimality,
+    regularized_inv,
     s_optimality,
     t_optimality,
     v_optimality,
 )
-from pydoe.optimal.model import build_design_matrix, build_uniform_moment_matrix
+from pydoe.optimal.model import CandidateSet, build_uniform_moment_matrix
 
 
 def _xtx_augmented(
-    X: np.ndarray, alpha: float = 0.0, X0: np.ndarray = None
+    X: np.ndarray, alpha: float = 0.0, X0: np.ndarray | CandidateSet = None
 ) -> np.ndarray:
     r"""
     Compute augmented information matrix:
@@ -34,8 +36,9 @@ def _xtx_augmented(
         Design matrix.
     alpha : float, optional
         Augmentation parameter (default is 0.0).
-    X0 : ndarray, optional
-        Candidate set for augmentation.
+    X0 : ndarray or CandidateSet, optional
+        Candidate set for augmentation. A `CandidateSet` supplies its
+        precomputed $H_0$.
 
     Returns
     -------
@@ -44,8 +47,10 @@ def _xtx_augmented(
     """  # noqa: E501
     H = X.T @ X
     if alpha and X0 is not None and len(X0) > 0:
-        N0 = X0.shape[0]
-        H0 = (X0.T @ X0) / N0
+        if isinstance(X0, CandidateSet):
+            H0 = X0.H0
+        else:
+            H0 = (X0.T @ X0) / X0.shape[0]
         H = H + alpha * H0  # noqa: PLR6104
     return H
 
@@ -55,7 +60,7 @@ def information_matrix(
     *,
     normalized: bool = True,
     alpha: float = 0.0,
-    X0: np.ndarray = None,
+    X0: np.ndarray | CandidateSet = None,
 ) -> np.ndarray:
     r"""
     Compute the information matrix for a design matrix,
@@ -69,7 +74,7 @@ def information_matrix(
         If True, returns $(1/n) \cdot (X^T X_{\text{aug}})$; else returns $X^T X_{\text{aug}}$.
     alpha : float, optional
         Augmentation parameter (default is 0.0).
-    X0 : ndarray, optional
+    X0 : ndarray or CandidateSet, optional
         Candidate set for augmentation.
 
     Returns
@@ -82,10 +87,10 @@ def information_matrix(
     return H_aug / n if normalized else H_aug
 
 
-def criterion_value(  # noqa: PLR0911
+def criterion_value(  # noqa: PLR0911, PLR0912
     X: np.ndarray,
     criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S", "T"],
-    X0: np.ndarray = None,
+    X0: np.ndarray | CandidateSet = None,
     alpha: float = 0.0,
     M_moment: np.ndarray = None,
     **kwargs: dict,
@@ -99,8 +104,9 @@ def criterion_value(  # noqa: PLR0911
         Design matrix.
     criterion : str
         Criterion type: 'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S', 'T'.
-    X0 : ndarray, optional
-        Full candidate set for augmentation.
+    X0 : ndarray or CandidateSet, optional
+        Full candidate set for augmentation. A `CandidateSet` also supplies
+        the default moment matrix for I-optimality.
     alpha : float, optional
         Augmentation parameter (default is 0.0).
     M_moment : ndarray, optional
@@ -124,6 +130,10 @@ def criterion_value(  # noqa: PLR0911
     """
     M = information_matrix(X, normalized=True, alpha=alpha, X0=X0)
     p = X.shape[1]
+    if isinstance(X0, CandidateSet):
+        if M_moment is None:
+            M_moment = X0.M_moment
+        X0 = X0.X0
 
     if criterion.upper() == "D":
         return d_optimality(M)
@@ -153,102 +163,185 @@ def criterion_value(  # noqa: PLR0911
         raise ValueError(f"Unknown criterion: {criterion}")
 
 
-def _best_single_add(  # noqa: PLR0913, PLR0917
-    current: np.ndarray,
-    pool: np.ndarray,
-    degree: int,
-    criterion: str,
-    X0_model: np.ndarray | None,
-    alpha: float,
-    M_moment: np.ndarray | None,
-) -> tuple[int, float]:
+def _regularized_inv_batch(M: np.ndarray) -> np.ndarray:
+    """
+    `regularized_inv` of every matrix of a stack.
+
+    Well-conditioned positive definite matrices are inverted in one stacked
+    call; the others go through `regularized_inv` one at a time.
+
+    Returns
+    -------
+    ndarray of shape (m, p, p)
+        Inverses (or regularized inverses).
     """
-    Among candidates in 'pool', find index that maximizes criterion
-    if added to 'current'.
+    try:
+        L = np.linalg.cholesky(M)
+    except np.linalg.LinAlgError:
+        return np.array([regularized_inv(Mk) for Mk in M])
+    d = np.diagonal(L, axis1=1, axis2=2)
+    ok = np.min(d, axis=1) ** 2 >= _RCOND_EPS * np.max(d, axis=1) ** 2
+    M_inv = np.empty_like(M)
+    M_inv[ok] = np.linalg.inv(M[ok])
+    for k in np.flatnonzero(~ok):
+        M_inv[k] = regularized_inv(M[k])
+    return M_inv
+
+
+def criterion_value_batch(  # noqa: PLR0911, PLR0912, PLR0914
+    X_stack: np.ndarray,
+    criterion: Literal["D", "A", "I", "C", "E", "G", "V", "S"],
+    X0: np.ndarray | CandidateSet = None,
+    alpha: float = 0.0,
+    M_moment: np.ndarray = None,
+    **kwargs: dict,
+) -> np.ndarray:
+    """
+    Compute an optimality criterion for a stack of design matrices at once.
+
+    Equivalent to calling `criterion_value` on every design, but the
+    information matrices, determinants, inverses and eigenvalues are
+    computed with stacked NumPy operations, which removes the per-design
+    overhead when a library of designs is compared.
 
     Parameters
     ----------
-    current : ndarray
-        Current design points.
-    pool : ndarray
-        Pool of candidate points to consider adding.
-    degree : int
-        Polynomial degree of the model.
-    criterion : str
-        Optimality criterion.
-    X0_model : ndarray, optional
-        Candidate set for augmentation.
-    alpha : float
-        Augmentation parameter.
+    X_stack : ndarray of shape (m, n, p)
+        Design matrices of m designs with the same number of runs.
+    criterion : {'D', 'A', 'I', 'C', 'E', 'G', 'V', 'S'}
+        Criterion type.
+    X0 : ndarray or CandidateSet, optional
+        Full candidate set for augmentation. A `CandidateSet` also supplies
+        the default moment matrix for I-optimality.
+    alpha : float, optional
+        Augmentation parameter (default is 0.0).
     M_moment : ndarray, optional
         Moment matrix for I-optimality.
+    **kwargs : dict, optional
+        Additional arguments for specific criteria, as for
+        `criterion_value`:
+        - c_vector : for C-optimality
+        - test_points : for V-optimality
+        - candidates : for G-optimality
 
     Returns
     -------
-    best_idx : int
-        Index in pool of the best candidate to add (or -1 if none improves).
-    best_val : float
-        Best criterion value achieved.
+    ndarray of shape (m,)
+        Value of the criterion for every design.
+
+    Raises
+    ------
+    ValueError
+        If X_stack is not three-dimensional, the criterion is unknown or
+        not supported, or I-optimality has no moment matrix.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pydoe import build_design_matrix, criterion_value_batch
+    >>> designs = np.random.default_rng(0).choice([-1.0, 1.0], (100, 8, 3))
+    >>> X_stack = np.array([build_design_matrix(d, 1) for d in designs])
+    >>> criterion_value_batch(X_stack, "D").shape
+    (100,)
     """
-    if len(pool) == 0:
-        X_cur = build_design_matrix(current, degree)
-        base = criterion_value(X_cur, criterion, X0_model, alpha, M_moment)
-        return -1, base
-
-    best_idx, best_val = -1, -np.inf
-    for j in range(pool.shape[0]):
-        trial = np.vstack([current, pool[j]])
-        X_trial = build_design_matrix(trial, degree)
-        val = criterion_value(X_trial, criterion, X0_model, alpha, M_moment)
-        if val > best_val:
-            best_val = val
-            best_idx = j
-    return best_idx, best_val
+    X_stack = np.asarray(X_stack, dtype=float)
+    if X_stack.ndim != 3:
+        raise ValueError("X_stack must have shape (m, n, p)")
+    n, p = X_stack.shape[1:]
+    crit = criterion.upper()
+    if crit not in {"D", "A", "I", "C", "E", "G", "V", "S"}:
+        raise ValueError(f"Unknown or unsupported criterion: {criterion}")
+
+    H = np.matmul(X_stack.transpose(0, 2, 1), X_stack)
+    if alpha and X0 is not None and len(X0) > 0:
+        if isinstance(X0, CandidateSet):
+            H0 = X0.H0
+        else:
+            H0 = (X0.T @ X0) / X0.shape[0]
+        H = H + alpha * H0  # noqa: PLR6104
+    # Stacked products are not exactly symmetric; the factorizations
+    # below expect them to be.
+    M = (H + H.transpose(0, 2, 1)) / (2 * n)
+    if isinstance(X0, CandidateSet):
+        if M_moment is None:
+            M_moment = X0.M_moment
+        X0 = X0.X0
 
+    if crit == "D":
+        return np.linalg.det(M)
+    if crit == "E":
+        return np.linalg.eigvalsh(M)[:, 0]
+    if crit == "S":
+        col_rms = np.sqrt(
+            np.clip(np.diagonal(M, axis1=1, axis2=2), 1e-15, None)
+        )
+        sign, logdet = np.linalg.slogdet(M)
+        return sign * np.exp(logdet - np.sum(np.log(col_rms), axis=1))
 
-def _best_single_drop(  # noqa: PLR0913, PLR0917
-    current: np.ndarray,
-    degree: int,
-    criterion: str,
-    X0_model: np.ndarray | None,
-    alpha: float,
-    M_moment: np.ndarray | None,
+    M_inv = _regularized_inv_batch(M)
+    if crit == "A":
+        return -np.trace(M_inv, axis1=1, axis2=2)
+    if crit == "I":
+        if M_moment is None:
+            if X0 is None:
+                raise ValueError("I-optimality needs X0 or M_moment")
+            M_moment = build_uniform_moment_matrix(X0)
+        return -np.sum(M_moment * M_inv.transpose(0, 2, 1), axis=(1, 2))
+    if crit == "C":
+        c = np.asarray(kwargs.get("c_vector", np.ones(p)), dtype=float)
+        return -np.einsum("i,mij,j->m", c, M_inv, c)
+
+    # G and V: prediction variances x^T M^-1 x at shared or per-design rows.
+    if crit == "G":
+        rows = kwargs.get("candidates", X0)
+    else:
+        rows = kwargs.get("test_points")
+    if rows is None:
+        variances = np.einsum("mni,mij,mnj->mn", X_stack, M_inv, X_stack)
+    else:
+        rows = np.asarray(rows, dtype=float)
+        variances = np.einsum("ni,mij,nj->mn", rows, M_inv, rows)
+    if crit == "G":
+        return -np.max(variances, axis=1)
+    return -np.mean(variances, axis=1)
+
+
+def _scan_improvement(
+    values: np.ndarray, base: float, tol: float = 1e-12
 ) -> tuple[int, float]:
     """
-    Among points in 'current', find index whose removal gives best criterion.
+    Select an improving entry of 'values' as a sequential scan would.
+
+    Entries are visited in C order and an entry replaces the current best
+    only when it exceeds it by more than 'tol', so that ties are resolved
+    in favour of the first entry exactly like a nested loop over all
+    exchanges.
 
     Parameters
     ----------
-    current : ndarray
-        Current design points.
-    degree : int
-        Polynomial degree of the model.
-    criterion : str
-        Optimality criterion.
-    X0_model : ndarray, optional
-        Candidate set for augmentation.
-    alpha : float
-        Augmentation parameter.
-    M_moment : ndarray, optional
-        Moment matrix for I-optimality.
+    values : ndarray
+        Criterion values of the candidate moves.
+    base : float
+        Criterion value of the current design.
+    tol : float, optional
+        Minimum improvement required to accept a move (default is 1e-12).
 
     Returns
     -------
     best_idx : int
-        Index in current of the best point to drop (or -1 if none improves).
+        Flat index of the selected entry (or -1 if none improves).
     best_val : float
-        Best criterion value achieved after drop.
+        Criterion value of the selected entry (or 'base').
     """
-    if current.shape[0] <= 1:
-        X_cur = build_design_matrix(current, degree)
-        return -1, criterion_value(X_cur, criterion, X0_model, alpha, M_moment)
-
-    best_idx, best_val = 0, -np.inf
-    for i in range(current.shape[0]):
-        trial = np.delete(current, i, axis=0)
-        X_trial = build_design_matrix(trial, degree)
-        val = criterion_value(X_trial, criterion, X0_model, alpha, M_moment)
-        if val > best_val:
-            best_val = val
-            best_idx = i
+    flat = np.ravel(values)
+    hits = np.flatnonzero(flat > base + tol)
+    best_idx, best_val = -1, base
+    start = 0
+    while start < hits.size:
+        better = flat[hits[start:]] > best_val + tol
+        if not better.any():
+            break
+        k = start + int(np.argmax(better))
+        best_idx, best_val = int(hits[k]), float(flat[hits[k]])
+        start = k + 1
     return best_idx, best_val
@@ -1,5 +1,6 @@
 from .distance_designs import maximin_design, minimax_design
 from .lhs import lhs
+from .lhs_stream import lhs_stream
 from .maxpro import maxpro_design
 from .nested_lhs import nested_lhs
 from .nolh import nearly_orthogonal_lhs
@@ -10,6 +11,7 @@ from .sliced_lhs import sliced_lhs
 
 __all__ = [
     "lhs",
+    "lhs_stream",
     "maximin_design",
     "maxpro_design",
     "minimax_design",
@@ -26,20 +26,193 @@ Johnson, M. E., Moore, L. M., & Ylvisaker, D. (1990). Minimax and
 
 from __future__ import annotations
 
+import heapq
+from typing import Literal
+
 import numpy as np
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist, pdist
 
+from pydoe.utils.restarts import run_restarts
+
 
 __all__ = ["maximin_design", "minimax_design"]
 
+# Acceptance rules of the maximin local search.
+_ACCEPTANCE = ("greedy", "annealing", "threshold")
+
+# Final temperature of simulated annealing, relative to the initial one.
+_FINAL_TEMPERATURE = 1e-3
+
+# Candidates per block when computing distances to all selected points.
+_CHUNK = 4096
+
+
+class _PairDistances:
+    """
+    Squared distances between the rows of an integer design, with their
+    minimum, cached for swaps within its columns.
+
+    The distances are kept as a condensed vector of exact integers, so a
+    swap of rows a and b only updates the 2(n - 1) pairs that contain
+    them. The minimum is tracked with its multiplicity; the vector is only
+    scanned again when a swap moves every closest pair apart.
+    """
+
+    def __init__(self, cells: np.ndarray) -> None:
+        self.cells = cells
+        n = cells.shape[0]
+        d2 = np.rint(pdist(cells, "sqeuclidean")).astype(np.int64)
+        self.min = int(d2.min())
+        self.count = int(np.count_nonzero(d2 == self.min))
+        # A last entry, larger than any distance, stands for the pair of a
+        # row with itself.
+        self.d2 = np.append(d2, np.iinfo(np.int64).max // 2)
+        self._rows = np.arange(n)
+        # Condensed index of the pair (i, j), i < j, is _start[i] + j.
+        self._start = n * self._rows - self._rows * (self._rows + 3) // 2 - 1
+
+    def _pairs(self, row: int) -> np.ndarray:
+        """
+        Condensed indices of the pairs of a row with every row.
+
+        Returns
+        -------
+        ndarray of shape (n,)
+            Index of the pair (row, j) at position j, and of the extra
+            entry at position row.
+        """
+        idx = self._start + row
+        idx[row:] = self._start[row] + self._rows[row:]
+        idx[row] = len(self.d2) - 1
+        return idx
+
+    def try_swap(self, col: int, a: int, b: int) -> int:
+        """
+        Minimum squared distance after swapping rows a and b in a column.
+
+        Returns
+        -------
+        int
+            Minimum squared distance, in squared cell widths.
+        """
+        x = self.cells[:, col]
+        # Row a takes the value of row b in this column and vice versa; the
+        # distance between a and b does not change.
+        delta = (x[b] - x[a]) * (x[a] + x[b] - 2 * x)
+        delta[[a, b]] = 0
+        idx_a, idx_b = self._pairs(a), self._pairs(b)
+        old_a, old_b = self.d2[idx_a], self.d2[idx_b]
+        new_a, new_b = old_a + delta, old_b - delta
+
+        lowest = int(min(new_a.min(), new_b.min()))
+        new_min, count = self.min, self.count
+        if lowest < self.min:
+            new_min = lowest
+            count = int(
+                np.count_nonzero(new_a == lowest)
+                + np.count_nonzero(new_b == lowest)
+            )
+        elif lowest == self.min or min(old_a.min(), old_b.min()) == self.min:
+            count += int(
+                np.count_nonzero(new_a == new_min)
+                + np.count_nonzero(new_b == new_min)
+                - np.count_nonzero(old_a == new_min)
+                - np.count_nonzero(old_b == new_min)
+            )
+            if count == 0:
+                self.d2[idx_a], self.d2[idx_b] = new_a, new_b
+                new_min = int(self.d2.min())
+                count = int(np.count_nonzero(self.d2 == new_min))
+                self.d2[idx_a], self.d2[idx_b] = old_a, old_b
+        self._swap = (col, a, b, idx_a, idx_b, new_a, new_b, new_min, count)
+        self.pending_count = count
+        return new_min
+
+    def swap(self) -> None:
+        """Apply the swap of the last `try_swap` call."""
+        col, a, b, idx_a, idx_b, new_a, new_b, self.min, self.count = self._swap
+        self.cells[[a, b], col] = self.cells[[b, a], col]
+        self.d2[idx_a], self.d2[idx_b] = new_a, new_b
+
+
+def _maximin_chain(  # noqa: PLR0913, PLR0914, PLR0917
+    n_points: int,
+    n_factors: int,
+    iterations: int,
+    acceptance: Literal["greedy", "annealing", "threshold"],
+    temperature: float | None,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, float, np.ndarray]:
+    """
+    Run one coordinate-exchange search from a random Latin hypercube.
+
+    Returns
+    -------
+    design : ndarray of shape (n_points, n_factors)
+        Best design visited, at the cell centers.
+    value : float
+        Minimum pairwise distance of the design.
+    trace : ndarray of shape (iterations,)
+        Minimum pairwise distance of the current design after each
+        iteration.
+    """
+    cells = np.empty((n_points, n_factors), dtype=int)
+    for j in range(n_factors):
+        cells[:, j] = rng.permutation(n_points)
 
-def maximin_design(
+    # Distances are compared in cell widths, where they are exact.
+    distances = _PairDistances(cells)
+    best_cells = cells
+    best = current = distances.min
+    if acceptance != "greedy":
+        best_cells = cells.copy()
+        if temperature is None:
+            temperature = 0.1 / n_points
+
+    trace = np.empty(iterations)
+    for it in range(iterations):
+        j = rng.integers(n_factors)
+        r1, r2 = rng.choice(n_points, size=2, replace=False)
+        new = distances.try_swap(j, r1, r2)
+        # Ties keep swaps that do not add closest pairs, so the search can
+        # move along plateaus of the minimum distance.
+        accept = new > current or (
+            new == current and distances.pending_count <= distances.count
+        )
+        if not accept and new < current and acceptance != "greedy":
+            change = (np.sqrt(new) - np.sqrt(current)) / n_points
+            progress = it / iterations
+            if acceptance == "threshold":
+                accept = change > -temperature * (1.0 - progress)
+            else:
+                level = temperature * _FINAL_TEMPERATURE**progress
+                accept = rng.random() < np.exp(change / level)
+        if accept:
+            distances.swap()
+            current = new
+            if current > best:
+                best = current
+                if best_cells is not cells:
+                    best_cells[...] = cells
+        trace[it] = current
+
+    design = (best_cells + 0.5) / n_points
+    return design, float(np.sqrt(best) / n_points), np.sqrt(trace) / n_points
+
+
+def maximin_design(  # noqa: PLR0913
     n_points: int,
     n_factors: int,
     *,
     iterations: int = 200,
+    acceptance: Literal["greedy", "annealing", "threshold"] = "greedy",
+    temperature: float | None = None,
+    n_restarts: int = 1,
+    n_jobs: int | None = 1,
     seed: int | np.random.Generator | None = None,
-) -> np.ndarray:
+    return_info: bool = False,
+) -> np.ndarray | tuple[np.ndarray, dict]:
     """
     Generate a maximin distance Latin hypercube design.
 
@@ -47,7 +220,9 @@ def maximin_design(
     ``0, ..., n_points - 1``, with points placed at cell centers. A
     coordinate-exchange local search swaps pairs of cell indices
     within a randomly chosen column to maximize the minimum pairwise
-    Euclidean distance between design points.
+    Euclidean distance between design points. Only the distances of
+    the two swapped points are updated, so each iteration costs
+    O(n_points) and large designs can run millions of iterations.
 
     Parameters
     ----------
@@ -58,19 +233,50 @@ def maximin_design(
     iterations : int, optional
         Number of local-search iterations, must be at least 0.
         Default is 200.
+    acceptance : {'greedy', 'annealing', 'threshold'}, optional
+        Rule deciding whether a swap is kept. 'greedy' (default) keeps
+        swaps that increase the minimum distance, or keep it without
+        adding pairs at that distance. 'annealing' (simulated
+        annealing) also keeps a swap that decreases it by d with
+        probability ``exp(-d / T)``, where the temperature T decreases
+        geometrically to a thousandth of its initial value. 'threshold'
+        (threshold accepting) keeps any swap that decreases it by less
+        than a threshold decreasing linearly to zero. With the last two
+        the best design visited is returned.
+    temperature : float, optional
+        Initial temperature or threshold of the 'annealing' and
+        'threshold' rules, in units of distance. Default is a tenth of
+        the cell width, ``0.1 / n_points``.
+    n_restarts : int, optional
+        Number of independent searches, must be at least 1; the design
+        with the largest minimum distance is returned. Default is 1.
+    n_jobs : int or None, optional
+        Number of processes running the searches. 1 (default) runs them
+        in the calling process; None or -1 uses all CPUs. Workers are
+        spawned, so scripts using n_jobs > 1 need an
+        ``if __name__ == "__main__":`` guard.
     seed : int or numpy.random.Generator, optional
-        Seed or generator for reproducibility.
+        Seed or generator for reproducibility. The design does not depend
+        on n_jobs.
+    return_info : bool, optional
+        If True, also return the traces of the minimum distance of the
+        searches (default is False).
 
     Returns
     -------
     design : ndarray of shape (n_points, n_factors)
         Design points in :math:`[0, 1)^{\\text{n\\_factors}}`, with
         each column a Latin hypercube permutation of cell centers.
+    info : dict
+        Only returned if `return_info` is True; see
+        `pydoe.utils.restarts.run_restarts`.
 
     Raises
     ------
     ValueError
-        If ``n_points < 2``, ``n_factors < 1``, or ``iterations < 0``.
+        If ``n_points < 2``, ``n_factors < 1``, ``iterations < 0``,
+        ``n_restarts < 1``, ``acceptance`` is unknown, or
+        ``temperature`` is not positive.
 
     Examples
     --------
@@ -92,28 +298,164 @@ def maximin_design(
         raise ValueError(f"n_factors must be at least 1, got {n_factors}")
     if iterations < 0:
         raise ValueError(f"iterations must be at least 0, got {iterations}")
+    if acceptance not in _ACCEPTANCE:
+        raise ValueError(
+            f"acceptance must be one of {', '.join(_ACCEPTANCE)}, "
+            f"got {acceptance}"
+        )
+    if temperature is not None and temperature <= 0:
+        raise ValueError(f"temperature must be positive, got {temperature}")
 
-    rng = np.random.default_rng(seed)
-    cells = np.empty((n_points, n_factors), dtype=int)
-    for j in range(n_factors):
-        cells[:, j] = rng.permutation(n_points)
+    design, info = run_restarts(
+        _maximin_chain,
+        (n_points, n_factors, iterations, acceptance, temperature),
+        n_restarts=n_restarts,
+        n_jobs=n_jobs,
+        seed=seed,
+        maximize=True,
+    )
+    return (design, info) if return_info else design
 
-    design = (cells + 0.5) / n_points
-    best_min_dist = pdist(design).min()
 
-    for _ in range(iterations):
-        j = rng.integers(n_factors)
-        r1, r2 = rng.choice(n_points, size=2, replace=False)
-        cells[r1, j], cells[r2, j] = cells[r2, j], cells[r1, j]
-        candidate = (cells + 0.5) / n_points
-        candidate_min_dist = pdist(candidate).min()
-        if candidate_min_dist > best_min_dist:
-            design = candidate
-            best_min_dist = candidate_min_dist
-        else:
-            cells[r1, j], cells[r2, j] = cells[r2, j], cells[r1, j]
+class _Coverage:
+    """
+    Distance from every candidate to its nearest selected point, cached for
+    swaps of one selected point.
+
+    Swapping selected point a for candidate b only changes the candidates
+    whose nearest point was a, which move to their second nearest point or
+    to b, and the candidates closer to b than to their nearest point, all
+    of which lie in a ball around b found with a KD-tree of the
+    candidates. A lazy heap keeps the largest distance (the covering
+    radius).
+    """
 
-    return design
+    def __init__(self, candidates: np.ndarray, selected: np.ndarray) -> None:
+        self.candidates = candidates
+        self.selected = selected
+        self._tree = cKDTree(candidates)
+        self.dist = np.empty(len(candidates))
+        self.nearest = np.empty(len(candidates), dtype=int)
+        for start in range(0, len(candidates), _CHUNK):
+            chunk = slice(start, start + _CHUNK)
+            d = cdist(candidates[chunk], candidates[selected])
+            self.nearest[chunk] = np.argmin(d, axis=1)
+            self.dist[chunk] = np.min(d, axis=1)
+        self._affected = np.zeros(len(candidates), dtype=bool)
+        self._rebuild_heap()
+        self._update_cell_radii()
+
+    def _update_cell_radii(self) -> None:
+        """Largest distance of the candidates nearest to each point."""
+        self._cell_radii = np.zeros(len(self.selected))
+        np.maximum.at(self._cell_radii, self.nearest, self.dist)
+
+    def _rebuild_heap(self) -> None:
+        """Rebuild the heap of distances, dropping outdated entries."""
+        self._heap = list(
+            zip((-self.dist).tolist(), range(len(self.dist)), strict=True)
+        )
+        heapq.heapify(self._heap)
+
+    def _top(self, skip: np.ndarray | None = None) -> tuple[float, list]:
+        """
+        Largest current distance of the candidates not marked in `skip`.
+
+        Returns
+        -------
+        radius : float
+            Largest distance.
+        popped : list
+            Current heap entries of skipped candidates taken off the heap.
+        """
+        popped = []
+        while self._heap:
+            d, c = self._heap[0]
+            if -d != self.dist[c]:
+                heapq.heappop(self._heap)
+            elif skip is not None and skip[c]:
+                popped.append(heapq.heappop(self._heap))
+            else:
+                return -d, popped
+        return 0.0, popped
+
+    def radius(self) -> float:
+        """
+        Covering radius of the selected points.
+
+        Returns
+        -------
+        float
+            Largest distance from a candidate to its nearest selected point.
+        """
+        return self._top()[0]
+
+    def try_swap(self, pos: int, new_idx: int) -> float:
+        """
+        Covering radius after replacing selected point `pos` by a candidate.
+
+        Returns
+        -------
+        float
+            New covering radius.
+        """
+        x = self.candidates[new_idx : new_idx + 1]
+        # Candidates of the removed point move to their nearest remaining
+        # point or to the new one.
+        lost = np.flatnonzero(self.nearest == pos)
+        d = cdist(self.candidates[lost], self.candidates[self.selected])
+        d[:, pos] = np.inf
+        lost_near = np.argmin(d, axis=1)
+        lost_dist = d[np.arange(len(lost)), lost_near]
+        to_new = cdist(self.candidates[lost], x)[:, 0]
+        closer = to_new < lost_dist
+        lost_dist[closer] = to_new[closer]
+        lost_near[closer] = pos
+
+        # Other candidates move to the new point if it is closer. Such a
+        # candidate of point s is within the radius r_s of its cell from
+        # the new point, so s is within 2 r_s of it.
+        to_points = cdist(self.candidates[self.selected], x)[:, 0]
+        near_cells = to_points < 2 * self._cell_radii
+        near_cells[pos] = False
+        reach = self._cell_radii[near_cells].max(initial=0.0)
+        ball = np.asarray(self._tree.query_ball_point(x[0], reach), dtype=int)
+        ball = ball[self.nearest[ball] != pos]
+        to_new = cdist(self.candidates[ball], x)[:, 0]
+        gained = ball[to_new < self.dist[ball]]
+        gained_dist = to_new[to_new < self.dist[ball]]
+
+        self._affected[lost] = True
+        self._affected[gained] = True
+        radius, popped = self._top(self._affected)
+        self._affected[lost] = False
+        self._affected[gained] = False
+        radius = max(
+            radius, lost_dist.max(initial=0.0), gained_dist.max(initial=0.0)
+        )
+        self._swap = (pos, new_idx, lost, lost_dist, lost_near)
+        self._swap += (gained, gained_dist, popped)
+        return float(radius)
+
+    def swap(self) -> None:
+        """Apply the swap of the last `try_swap` call."""
+        pos, new_idx, lost, lost_dist, lost_near, gained, gained_dist, _ = (
+            self._swap
+        )
+        self.selected[pos] = new_idx
+        self.dist[lost], self.nearest[lost] = lost_dist, lost_near
+        self.dist[gained], self.nearest[gained] = gained_dist, pos
+        self._update_cell_radii()
+        if len(self._heap) > 2 * len(self.dist):
+            self._rebuild_heap()
+            return
+        for c in np.concatenate([lost, gained]).tolist():
+            heapq.heappush(self._heap, (-self.dist[c], c))
+
+    def reject(self) -> None:
+        """Discard the swap of the last `try_swap` call."""
+        for entry in self._swap[-1]:
+            heapq.heappush(self._heap, entry)
 
 
 def minimax_design(
@@ -187,24 +529,26 @@ def minimax_design(
     candidates = rng.random((n_candidates, n_factors))
 
     selected = rng.choice(n_candidates, size=n_points, replace=False)
+    if n_candidates == n_points:
+        return candidates[selected]
 
-    def criterion(selected_idx: np.ndarray) -> float:
-        distances = cdist(candidates, candidates[selected_idx])
-        return distances.min(axis=1).max()
-
-    best_criterion = criterion(selected)
-    all_indices = np.arange(n_candidates)
+    coverage = _Coverage(candidates, selected)
+    best_criterion = coverage.radius()
+    # The k-th unselected candidate is k plus the number of selected
+    # candidates up to it; ranks[i] counts the unselected candidates below
+    # the i-th smallest selected one.
+    ranks = np.sort(selected) - np.arange(n_points)
 
     for _ in range(iterations):
-        unselected = np.setdiff1d(all_indices, selected, assume_unique=True)
         pos = rng.integers(n_points)
-        new_idx = rng.choice(unselected)
-        old_idx = selected[pos]
-        selected[pos] = new_idx
-        new_criterion = criterion(selected)
+        k = rng.integers(n_candidates - n_points)
+        new_idx = k + np.searchsorted(ranks, k, side="right")
+        new_criterion = coverage.try_swap(pos, new_idx)
         if new_criterion < best_criterion:
+            coverage.swap()
             best_criterion = new_criterion
+            ranks = np.sort(selected) - np.arange(n_points)
         else:
-            selected[pos] = old_idx
+            coverage.reject()
 
     return candidates[selected]
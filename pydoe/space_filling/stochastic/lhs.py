@@ -15,16 +15,31 @@ Abraham Lee.
 
 from __future__ import annotations
 
+import heapq
 from typing import Literal
 from warnings import warn
 
 import numpy as np
-from numpy import ma
+from numpy.typing import DTypeLike
 from scipy import linalg, spatial, stats
 
+from pydoe.utils.cells import MAX_FLOAT32_SAMPLES, round_into_cells
+
 
 __all__ = ["lhs"]
 
+# Exponent of the phi_p criterion optimized by criterion="maximin".
+_PHI_P = 50.0
+
+# Relative improvement of phi_p that counts as progress in an ESE loop.
+_ESE_TOL = 1e-3
+
+# Fraction of the phi_p sum below which a swap recomputes the sum.
+_CANCELLATION = 1 / 16
+
+# Number of values drawn at a time when a float32 design is filled in place.
+_DRAW_BLOCK = 2**20
+
 
 def lhs(  # noqa: PLR0912, PLR0913, PLR0917
     n: int,
@@ -44,6 +59,9 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
     random_state: int | np.random.RandomState | None = None,
     correlation_matrix: np.ndarray = None,
     seed: int | np.random.Generator | None = None,
+    *,
+    dtype: DTypeLike | None = None,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Generate a latin-hypercube design
@@ -63,7 +81,9 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
         given, the design is simply randomized.
     iterations : int
         The number of iterations in the maximin and correlations algorithms
-        (Default: 5).
+        (Default: 5). These are the outer loops of the enhanced stochastic
+        evolutionary algorithm, which optimizes the design by swaps within
+        its columns.
     random_state : np.random.RandomState, int
          Random state (or seed-number) which controls the seed and random draws
          DEPRECATED! It will be removed in a future release.
@@ -72,17 +92,27 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
          Enforce correlation between factors (only used in lhsmu)
     seed : int or np.random.Generator
          Seed or np.random.Generator which controls random draws
+    dtype : {np.float64, np.float32}
+         Floating point type of the design (Default: the dtype of `out`, or
+         np.float64). With np.float32 the design takes half the memory; its
+         points are computed in float64 and rounded without leaving their
+         intervals, and at most 2**24 samples are allowed.
+    out : ndarray
+         Array of shape (samples, n) to write the design into, e.g. a
+         preallocated or memory-mapped buffer. Without a criterion, or with
+         "center", the design is generated in place and no temporary of the
+         full design size is allocated.
 
     Returns
     -------
     H : 2d-array
         An n-by-samples design matrix that has been normalized so factor values
-        are uniformly spaced between zero and one.
+        are uniformly spaced between zero and one. This is `out` when given.
 
     Raises
     ------
     ValueError
-        If input parameters are invalid.
+        If input parameters are invalid, or `out` does not match the design.
 
     Examples
     --------
@@ -116,20 +146,20 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
     all samples has been maximized::
 
         >>> lhs(3, samples=4, criterion='maximin', seed=42)
-        array([[0.91547913, 0.46335077, 0.05364617],
-               [0.51457569, 0.10917935, 0.94597455],
-               [0.35213216, 0.57034597, 0.30848487],
-               [0.00770446, 0.88925804, 0.57339844]])
+        array([[0.69028493, 0.69651608, 0.21464948],
+               [0.19348901, 0.27354434, 0.49390559],
+               [0.42434201, 0.84269951, 0.98169125],
+               [0.86259648, 0.10971961, 0.53202841]])
 
     A 4-factor design with 5 samples where the samples are as uncorrelated
     as possible (within 10 iterations)::
 
         >>> lhs(4, samples=5, criterion='correlation', iterations=10, seed=42)
-        array([[0.15479121, 0.49007719, 0.68868284, 0.35721286],
-               [0.21883547, 0.39512447, 0.4741596 , 0.64544774],
-               [0.42562273, 0.08777569, 0.35222794, 0.92633288],
-               [0.91091696, 0.76455232, 0.96552623, 0.585353  ],
-               [0.72877302, 0.81276345, 0.17171958, 0.13947361]])
+        array([[0.21883547, 0.76455232, 0.96552623, 0.35721286],
+               [0.91091696, 0.81276345, 0.4741596 , 0.64544774],
+               [0.72877302, 0.08777569, 0.68868284, 0.585353  ],
+               [0.15479121, 0.49007719, 0.35222794, 0.92633288],
+               [0.42562273, 0.39512447, 0.17171958, 0.13947361]])
 
     """
     H = None
@@ -162,6 +192,7 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
 
     if samples is None:
         samples = n
+    buffer = _output_buffer(n, samples, dtype, out)
 
     if criterion is not None:
         if criterion.lower() not in {
@@ -178,7 +209,7 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
             raise ValueError(f'Invalid value for "criterion": {criterion}')
 
     else:
-        H = _lhsclassic(n, samples, random_state)
+        H = _lhsclassic(n, samples, random_state, buffer)
 
     if criterion is None:
         criterion = "center"
@@ -187,7 +218,7 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
 
     if H is None:
         if criterion.lower() in {"center", "c"}:
-            H = _lhscentered(n, samples, random_state)
+            H = _lhscentered(n, samples, random_state, buffer)
         elif criterion.lower() in {"maximin", "m"}:
             H = _lhsmaximin(n, samples, iterations, "maximin", random_state)
         elif criterion.lower() in {"centermaximin", "cm"}:
@@ -200,7 +231,55 @@ def lhs(  # noqa: PLR0912, PLR0913, PLR0917
             # as specified by the paper. M is set to 5
             H = _lhsmu(n, samples, correlation_matrix, random_state, M=5)
 
-    return H
+    if H is not buffer:
+        # Rounding to float32 must not move points out of their intervals.
+        cells = np.clip(np.floor(H * samples), 0, samples - 1)
+        round_into_cells(H, cells, samples, out=buffer)
+    return buffer
+
+
+################################################################################
+
+
+def _output_buffer(
+    n: int, samples: int, dtype: DTypeLike | None, out: np.ndarray | None
+) -> np.ndarray:
+    """
+    Validate `out` and `dtype`, allocating the design array if needed.
+
+    Returns
+    -------
+    ndarray of shape (samples, n)
+        Array the design is written into.
+
+    Raises
+    ------
+    ValueError
+        If the dtype is not np.float32 or np.float64, `samples` exceeds
+        2**24 for np.float32, or `out` has the wrong shape or a dtype other
+        than `dtype`.
+    """
+    if out is None:
+        dtype = np.dtype(np.float64 if dtype is None else dtype)
+    else:
+        if out.shape != (samples, n):
+            raise ValueError(
+                f"out must have shape {(samples, n)}, got {out.shape}"
+            )
+        if dtype is not None and np.dtype(dtype) != out.dtype:
+            raise ValueError(
+                f"out has dtype {out.dtype}, which does not match "
+                f"dtype={np.dtype(dtype)}"
+            )
+        dtype = out.dtype
+    if dtype not in {np.dtype(np.float32), np.dtype(np.float64)}:
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    if dtype == np.float32 and samples > MAX_FLOAT32_SAMPLES:
+        raise ValueError(
+            f"float32 cannot separate more than {MAX_FLOAT32_SAMPLES} "
+            f"samples, got {samples}; use np.float64"
+        )
+    return np.empty((samples, n), dtype=dtype) if out is None else out
 
 
 ################################################################################
@@ -210,25 +289,43 @@ def _lhsclassic(
     n: int,
     samples: int,
     randomstate: np.random.RandomState | np.random.Generator,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     # Generate the intervals
     cut = np.linspace(0, 1, samples + 1)
-
-    # Fill points uniformly in each interval
-    u = (
-        randomstate.rand(samples, n)
-        if isinstance(randomstate, np.random.RandomState)
-        else randomstate.random((samples, n))
-    )
-
     a = cut[:samples]
     b = cut[1 : samples + 1]
+    cells = np.arange(samples)
+    H = np.empty((samples, n)) if out is None else out
+
+    if isinstance(randomstate, np.random.Generator):
+        # Fill points uniformly in each interval and shuffle every column in
+        # place. Generator.permuted draws the same shuffles as one
+        # permutation() call per column, so seeded designs are unchanged.
+        # A float32 design is drawn in float64 blocks of rows and rounded,
+        # which gives the float64 design without a temporary of its size.
+        rows = max(1, _DRAW_BLOCK // n)
+        for start in range(0, samples, rows):
+            stop = min(start + rows, samples)
+            if H.dtype == np.float64:
+                block = randomstate.random(out=H[start:stop])
+            else:
+                block = randomstate.random((stop - start, n))
+            block *= (b - a)[start:stop, None]
+            block += a[start:stop, None]
+            round_into_cells(
+                block, cells[start:stop, None], samples, out=H[start:stop]
+            )
+        return randomstate.permuted(H, axis=0, out=H)
 
-    # Make the random pairings
-    H = np.empty_like(u)
+    # Fill points uniformly in each interval
+    u = randomstate.rand(samples, n)
 
+    # Make the random pairings
     for j in range(n):
-        rdpoints = u[:, j] * (b - a) + a
+        rdpoints = round_into_cells(
+            u[:, j] * (b - a) + a, cells, samples, H.dtype
+        )
         H[:, j] = rdpoints[randomstate.permutation(samples)]
 
     return H
@@ -241,22 +338,26 @@ def _lhscentered(
     n: int,
     samples: int,
     randomstate: np.random.RandomState | np.random.Generator,
+    out: np.ndarray | None = None,
 ) -> np.ndarray:
     # Generate the intervals
     cut = np.linspace(0, 1, samples + 1)
-
-    # Fill points uniformly in each interval
-    u = (
-        randomstate.rand(samples, n)
-        if isinstance(randomstate, np.random.RandomState)
-        else randomstate.random((samples, n))
-    )
     a = cut[:samples]
     b = cut[1 : samples + 1]
     center = (a + b) / 2
+    H = np.empty((samples, n)) if out is None else out
+    center = round_into_cells(center, np.arange(samples), samples, H.dtype)
+
+    if isinstance(randomstate, np.random.Generator):
+        # The uniform draws are unused but keep the random stream of seeded
+        # designs; drawing them into the output avoids a temporary.
+        randomstate.random(dtype=H.dtype, out=H)
+        H[...] = center[:, None]
+        return randomstate.permuted(H, axis=0, out=H)
+
+    randomstate.rand(samples, n)
 
     # Make the random pairings
-    H = np.zeros_like(u)
     for j in range(n):
         H[:, j] = randomstate.permutation(center)
 
@@ -273,21 +374,16 @@ def _lhsmaximin(
     lhstype: str,
     randomstate: np.random.RandomState | np.random.Generator,
 ) -> np.ndarray:
-    maxdist = 0
-
-    # Maximize the minimum distance between points
-    for _ in range(iterations):
-        if lhstype == "maximin":
-            H_candidate = _lhsclassic(n, samples, randomstate)
-        else:
-            H_candidate = _lhscentered(n, samples, randomstate)
-
-        d = spatial.distance.pdist(H_candidate, "euclidean")
-        if maxdist < np.min(d):
-            maxdist = np.min(d)
-            H = H_candidate.copy()
+    if lhstype == "maximin":
+        H = _lhsclassic(n, samples, randomstate)
+    else:
+        H = _lhscentered(n, samples, randomstate)
 
-    return H
+    # Swaps within a column cannot change the distances of fewer than
+    # three points or of a single factor.
+    if samples < 3 or n < 2:
+        return H
+    return _ese(_PhiP(H), iterations, randomstate)
 
 
 ################################################################################
@@ -299,24 +395,321 @@ def _lhscorrelate(
     iterations: int,
     randomstate: np.random.RandomState | np.random.Generator,
 ) -> np.ndarray:
-    mincorr = np.inf
+    H = _lhsclassic(n, samples, randomstate)
+    if samples < 3 or n < 2:
+        return H
+    return _ese(_Correlation(H), iterations, randomstate)
 
-    # Minimize the components correlation coefficients
-    for _ in range(iterations):
-        # Generate a random LHS
-        H_candidate = _lhsclassic(n, samples, randomstate)
-        R = np.corrcoef(H_candidate.T)
-        if np.max(np.abs(R[R != 1])) < mincorr:
-            mincorr = np.max(np.abs(R - np.eye(R.shape[0])))
-            H = H_candidate.copy()
 
-    return H
+################################################################################
+
+
+class _PhiP:
+    """
+    phi_p criterion of a design, cached for swaps within its columns.
+
+    The pairwise squared distances and their phi_p terms are kept, so a
+    swap of rows i and k only updates their two rows of distances.
+    """
+
+    def __init__(self, H: np.ndarray, p: float = _PHI_P) -> None:
+        self.H = H
+        self.p = p
+        D2 = spatial.distance.squareform(
+            spatial.distance.pdist(H, "sqeuclidean")
+        )
+        np.fill_diagonal(D2, np.inf)
+        self.D2 = D2
+        # Distances are scaled by the initial minimum so that no term of
+        # the criterion overflows.
+        self._scale = max(np.min(D2), np.finfo(float).tiny)
+        self.T = self._terms(D2)
+        self.refresh()
+
+    def _terms(self, d2: np.ndarray) -> np.ndarray:
+        """
+        phi_p terms of squared distances.
+
+        Returns
+        -------
+        ndarray
+            Scaled distances to the power -p.
+        """
+        with np.errstate(over="ignore", divide="ignore"):
+            return (d2 / self._scale) ** (-self.p / 2)
+
+    def refresh(self) -> None:
+        """Recompute the criterion from its cached terms."""
+        # T holds both terms of every pair; the criterion counts each once,
+        # as does the change of a swap scored by try_swaps.
+        self.value = (np.sum(self.T) / 2) ** (1 / self.p)
+
+    def try_swaps(self, col: int, i: np.ndarray, k: np.ndarray) -> float:
+        """
+        Score swaps of rows i and k in a column and keep the best one.
+
+        Returns
+        -------
+        float
+            Criterion value after the best swap.
+        """
+        x = self.H[:, col]
+        rows = np.arange(len(i))
+        # Change of the squared distances of row i when it takes the value
+        # of row k in this column; row k changes by the opposite.
+        delta = (x[k, None] - x) ** 2 - (x[i, None] - x) ** 2
+        delta[rows, i] = 0.0
+        delta[rows, k] = 0.0
+        new_i, new_k = self.D2[i] + delta, self.D2[k] - delta
+        T_i, T_k = self._terms(new_i), self._terms(new_k)
+        change = (
+            np.sum(T_i, axis=1)
+            + np.sum(T_k, axis=1)
+            - np.sum(self.T[i], axis=1)
+            - np.sum(self.T[k], axis=1)
+        )
+        j = int(np.argmin(change))
+        value = max(self.value**self.p + change[j], 0.0) ** (1 / self.p)
+        self._best = (col, i[j], k[j], new_i[j], new_k[j], T_i[j], T_k[j])
+        return value
+
+    def swap(self, value: float) -> None:
+        """Apply the best swap of the last `try_swaps` call."""
+        col, ri, rk, new_i, new_k, T_i, T_k = self._best
+        self.H[[ri, rk], col] = self.H[[rk, ri], col]
+        self.D2[ri], self.D2[rk] = new_i, new_k
+        self.D2[:, ri], self.D2[:, rk] = new_i, new_k
+        self.T[ri], self.T[rk] = T_i, T_k
+        self.T[:, ri], self.T[:, rk] = T_i, T_k
+        # A swap removing most of the sum leaves its rounding error behind;
+        # recompute the sum then instead of carrying the error along.
+        if value < self.value * _CANCELLATION ** (1 / self.p):
+            self.refresh()
+        else:
+            self.value = value
+
+
+class _Correlation:
+    """
+    Mean squared correlation between the columns of a design, cached for
+    swaps within its columns.
+
+    Swaps keep the column sums and sums of squares, so swapping rows i and
+    k of column j only changes row and column j of the correlation matrix,
+    by ``(x_kj - x_ij) * (x_i - x_k)`` scaled by the column norms.
+    """
+
+    def __init__(self, H: np.ndarray) -> None:
+        self.H = H
+        self._mean = np.mean(H, axis=0)
+        self._norm = 1 / np.sqrt(np.sum((H - self._mean) ** 2, axis=0))
+        n = H.shape[1]
+        self._pairs = n * (n - 1)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Recompute the correlation matrix of the design."""
+        Xc = self.H - self._mean
+        self.R = (Xc.T @ Xc) * np.outer(self._norm, self._norm)
+        np.fill_diagonal(self.R, 0.0)
+        self.value = np.sum(self.R**2) / self._pairs
+
+    def try_swaps(self, col: int, i: np.ndarray, k: np.ndarray) -> float:
+        """
+        Score swaps of rows i and k in a column and keep the best one.
+
+        Returns
+        -------
+        float
+            Criterion value after the best swap.
+        """
+        H = self.H
+        delta = (H[k, col] - H[i, col])[:, None] * (H[i] - H[k])
+        delta *= self._norm[col] * self._norm
+        delta[:, col] = 0.0
+        new = self.R[col] + delta
+        change = 2 * (np.sum(new**2, axis=1) - np.sum(self.R[col] ** 2))
+        j = int(np.argmin(change))
+        self._best = (col, i[j], k[j], new[j])
+        return self.value + change[j] / self._pairs
+
+    def swap(self, value: float) -> None:
+        """Apply the best swap of the last `try_swaps` call."""
+        col, ri, rk, new = self._best
+        self.H[[ri, rk], col] = self.H[[rk, ri], col]
+        self.R[col] = new
+        self.R[:, col] = new
+        self.value = value
+
+
+def _integers(
+    randomstate: np.random.RandomState | np.random.Generator,
+    high: int,
+    size: int,
+) -> np.ndarray:
+    if isinstance(randomstate, np.random.Generator):
+        return randomstate.integers(high, size=size)
+    return randomstate.randint(high, size=size)
+
+
+def _ese(
+    criterion: _PhiP | _Correlation,
+    outer_loops: int,
+    randomstate: np.random.RandomState | np.random.Generator,
+) -> np.ndarray:
+    """
+    Minimize a criterion of an LHS by swaps within its columns.
+
+    Enhanced stochastic evolutionary (ESE) algorithm of Jin, Chen and
+    Sudjianto (2005). Each inner iteration scores J random swaps in one
+    column and moves to the best of them if it is within a threshold of
+    the current design; the threshold adapts to the acceptance rate of
+    every outer loop.
+
+    Parameters
+    ----------
+    criterion : _PhiP or _Correlation
+        Cached criterion of the initial design, which is modified in
+        place.
+    outer_loops : int
+        Number of outer loops of the algorithm.
+    randomstate : np.random.RandomState or np.random.Generator
+        Source of random swaps.
+
+    Returns
+    -------
+    ndarray of shape (samples, n)
+        Best design found.
+    """
+    samples, n = criterion.H.shape
+    n_pairs = samples * (samples - 1) // 2
+    n_tries = int(np.clip(n_pairs // 5, 1, 50))
+    inner_loops = int(min(2 * n_pairs * n // n_tries, 100))
+
+    best = criterion.H.copy()
+    best_value = criterion.value
+    threshold = 0.005 * criterion.value
+    for _ in range(outer_loops):
+        old_best_value = best_value
+        n_accept = n_improve = 0
+        for it in range(inner_loops):
+            i = _integers(randomstate, samples, n_tries)
+            k = (i + 1 + _integers(randomstate, samples - 1, n_tries)) % samples
+            value = criterion.try_swaps(it % n, i, k)
+            if value - criterion.value > threshold * randomstate.random():
+                continue
+            criterion.swap(value)
+            n_accept += 1
+            if criterion.value < best_value:
+                best[...] = criterion.H
+                best_value = criterion.value
+                n_improve += 1
+        # Resynchronize the cached criterion with the design.
+        criterion.refresh()
+
+        accept_rate = n_accept / inner_loops
+        if best_value < old_best_value * (1 - _ESE_TOL):
+            # Improving process: cool down while moves keep being accepted
+            # without improving the best design, otherwise warm up.
+            if accept_rate >= 0.1 and n_improve < n_accept:
+                threshold *= 0.8
+            elif accept_rate < 0.1:
+                threshold /= 0.8
+        elif accept_rate < 0.1:
+            # Exploration: warm up quickly to leave a local optimum, and
+            # cool down slowly once moves are accepted again.
+            threshold /= 0.7
+        elif accept_rate > 0.8:
+            threshold *= 0.9
+
+    return best
+
+
+################################################################################
+
+
+def _lhsmu_eliminate(points: np.ndarray, n_remove: int) -> np.ndarray:
+    """
+    Remove the points closest to their two nearest neighbours one by one.
+
+    At every step the live point with the smallest average distance to
+    its two nearest live neighbours is removed (the lowest index on ties).
+    A KD-tree finds the neighbours, and a heap keeps the average distance
+    of every live point; after a removal only the points that had it as a
+    neighbour look for a new one.
+
+    Parameters
+    ----------
+    points : ndarray of shape (I, N)
+        Points to thin out.
+    n_remove : int
+        Number of points to remove, less than I.
+
+    Returns
+    -------
+    ndarray of shape (n_remove,)
+        Indices of the removed points, in the order of removal.
+    """
+    n_points = points.shape[0]
+    tree = spatial.cKDTree(points)
+    live = np.ones(n_points, dtype=bool)
+    n_live = n_points
+    neighbours: list[list[int]] = [[] for _ in range(n_points)]
+    dists: list[list[float]] = [[] for _ in range(n_points)]
+    # Live points having each point among their two nearest neighbours.
+    reverse: list[set[int]] = [set() for _ in range(n_points)]
+    heap: list[tuple[float, int]] = []
+
+    def assign(i: int, d: np.ndarray, idx: np.ndarray) -> None:
+        for j in neighbours[i]:
+            reverse[j].discard(i)
+        neighbours[i] = idx.tolist()
+        dists[i] = d.tolist()
+        for j in neighbours[i]:
+            reverse[j].add(i)
+        heapq.heappush(heap, (sum(dists[i]) / len(dists[i]), i))
+
+    def update(i: int) -> None:
+        # Nearest live neighbours of point i. Enough tree neighbours are
+        # queried to expect two live ones, doubling until they are found.
+        want = min(2, n_live - 1)
+        k = 3 + 3 * (n_points - n_live) // n_live
+        while True:
+            k = min(k, n_points)
+            d, idx = tree.query(points[i], k=k)
+            keep = live[idx] & (idx != i)
+            if np.count_nonzero(keep) >= want or k == n_points:
+                break
+            k *= 2
+        assign(i, d[keep][:want], idx[keep][:want])
+
+    d, idx = tree.query(points, k=3)
+    for i in range(n_points):
+        keep = idx[i] != i
+        assign(i, d[i, keep][:2], idx[i, keep][:2])
+
+    index_rm = np.empty(n_remove, dtype=int)
+    for step in range(n_remove):
+        # Skip heap entries of removed points and outdated averages.
+        while True:
+            avg, r = heapq.heappop(heap)
+            if live[r] and avg == sum(dists[r]) / len(dists[r]):
+                break
+        live[r] = False
+        n_live -= 1
+        index_rm[step] = r
+        for j in neighbours[r]:
+            reverse[j].discard(r)
+        if step + 1 < n_remove:
+            for i in list(reverse[r]):
+                update(i)
+    return index_rm
 
 
 ################################################################################
 
 
-def _lhsmu(  # noqa: PLR0914
+def _lhsmu(
     N: int,
     samples: int | None = None,
     corr: np.ndarray = None,
@@ -329,24 +722,7 @@ def _lhsmu(  # noqa: PLR0914
     I = M * samples  # noqa: E741
 
     rdpoints = randomstate.uniform(size=(I, N))
-
-    dist = spatial.distance.cdist(rdpoints, rdpoints, metric="euclidean")
-    D_ij = ma.masked_array(dist, mask=np.identity(I))
-
-    index_rm = np.zeros(I - samples, dtype=int)
-    i = 0
-    while i < I - samples:
-        order = ma.sort(D_ij, axis=1)
-
-        avg_dist = ma.mean(order[:, 0:2], axis=1)
-        min_l = ma.argmin(avg_dist)
-
-        D_ij[min_l, :] = ma.masked
-        D_ij[:, min_l] = ma.masked
-
-        index_rm[i] = min_l
-        i += 1
-
+    index_rm = _lhsmu_eliminate(rdpoints, I - samples)
     rdpoints = np.delete(rdpoints, index_rm, axis=0)
 
     if corr is not None:
@@ -370,10 +746,14 @@ def _lhsmu(  # noqa: PLR0914
         H = np.zeros_like(rdpoints, dtype=float)
         rank = np.argsort(rdpoints, axis=0)
 
-        for l in range(samples):  # noqa: E741
-            low = float(l) / samples
-            high = float(l + 1) / samples
-
-            l_pos = rank == l
-            H[l_pos] = randomstate.uniform(low, high, size=N)
+        # Row l of 'values' is drawn uniformly in [l, l + 1) / samples and
+        # fills the entries where rank == l, in row-major order.
+        low = np.arange(samples) / samples
+        high = np.arange(1, samples + 1) / samples
+        values = low[:, None] + (high - low)[:, None] * randomstate.uniform(
+            size=(samples, N)
+        )
+        rows = np.argsort(rank, axis=0)
+        cols = np.argsort(rows, axis=1, kind="stable")
+        H[np.take_along_axis(rows, cols, axis=1), cols] = values
     return H
@@ -0,0 +1,211 @@
+"""
+Streaming Latin hypercube designs.
+
+`lhs_stream` yields the rows of one Latin hypercube design in blocks, so
+designs far larger than memory can be generated and consumed on the fly.
+Row :math:`i` of factor :math:`j` lies in cell :math:`\\pi_j(i)`, where
+:math:`\\pi_j` is a pseudorandom permutation of :math:`0, \\ldots, N - 1`
+evaluated pointwise: a keyed Feistel network permutes the smallest
+power-of-four domain holding the :math:`N` cells, and cycle walking (applying
+the network again to any output outside the design) restricts it to a
+permutation of the cells. Each block therefore only needs its own row
+indices, and memory is proportional to the block size.
+
+References
+----------
+Black, J., & Rogaway, P. (2002). Ciphers with arbitrary finite domains.
+    *Topics in Cryptology - CT-RSA 2002*, 114-130.
+Luby, M., & Rackoff, C. (1988). How to construct pseudorandom
+    permutations from pseudorandom functions. *SIAM Journal on
+    Computing*, 17(2), 373-386.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from pydoe.utils.cells import MAX_FLOAT32_SAMPLES, round_into_cells
+
+
+__all__ = ["lhs_stream"]
+
+# Number of Feistel rounds of each column permutation.
+_FEISTEL_ROUNDS = 4
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    """
+    SplitMix64 finalizer, used as the Feistel round function.
+
+    Returns
+    -------
+    ndarray of uint64
+        Hashed values.
+    """
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _feistel(x: np.ndarray, keys: np.ndarray, half_bits: int) -> np.ndarray:
+    """
+    Apply one keyed Feistel permutation of [0, 4**half_bits) per column.
+
+    Parameters
+    ----------
+    x : ndarray of uint64, shape (m, n) or (n,)
+        Values to permute; entry j of a row uses the keys ``keys[j]``.
+    keys : ndarray of uint64, shape (n, rounds)
+        Round keys of each column (or entry).
+    half_bits : int
+        Number of bits of each half of a value.
+
+    Returns
+    -------
+    ndarray of uint64, same shape as x
+        Permuted values.
+    """
+    shift = np.uint64(half_bits)
+    mask = np.uint64((1 << half_bits) - 1)
+    left, right = x >> shift, x & mask
+    for r in range(keys.shape[1]):
+        left, right = right, left ^ (_mix(right ^ keys[:, r]) & mask)
+    return (left << shift) | right
+
+
+def _cells(
+    rows: np.ndarray, keys: np.ndarray, half_bits: int, samples: int
+) -> np.ndarray:
+    """
+    Cell index of the given rows in every column.
+
+    Returns
+    -------
+    ndarray of uint64, shape (len(rows), n)
+        Cells of the rows, each column a permutation of ``range(samples)``
+        over all rows.
+    """
+    cells = _feistel(
+        np.repeat(rows[:, None], keys.shape[0], axis=1), keys, half_bits
+    )
+    # Cycle walking: the orbit of a cell under the permutation returns to
+    # [0, samples) before leaving it again, so this is a bijection.
+    outside = cells >= samples
+    while np.any(outside):
+        i, j = np.nonzero(outside)
+        cells[i, j] = _feistel(cells[i, j], keys[j], half_bits)
+        outside[i, j] = cells[i, j] >= samples
+    return cells
+
+
+def lhs_stream(
+    n: int,
+    samples: int,
+    block_size: int = 65536,
+    seed: int | np.random.Generator | None = None,
+    *,
+    dtype: DTypeLike = np.float64,
+) -> Iterator[np.ndarray]:
+    """
+    Generate a Latin hypercube design in blocks of rows.
+
+    The concatenated blocks form a single Latin hypercube design: each of
+    the `samples` intervals of every factor holds exactly one point, which
+    is placed uniformly at random within its interval. Only one block is
+    held in memory at a time.
+
+    Parameters
+    ----------
+    n : int
+        Number of factors, must be at least 1.
+    samples : int
+        Total number of rows of the design, must be at least 1.
+    block_size : int, optional
+        Number of rows of each block (default is 65536). The last block
+        may be shorter.
+    seed : int or numpy.random.Generator, optional
+        Seed or generator for reproducibility. A seed gives the same
+        design for any `block_size`.
+    dtype : {np.float64, np.float32}, optional
+        Floating point type of the blocks (default is np.float64). The
+        points are computed in float64 and rounded to float32 without
+        leaving their interval, so the design stays Latin; float32 allows
+        at most 2**24 samples.
+
+    Returns
+    -------
+    iterator of ndarray
+        Iterator over the blocks, arrays of shape (block_rows, n) in
+        :math:`[0, 1)` whose concatenation is the design.
+
+    Raises
+    ------
+    ValueError
+        If `n`, `samples` or `block_size` is less than 1, the dtype is
+        not np.float32 or np.float64, or `samples` exceeds 2**24 for
+        np.float32.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> blocks = list(lhs_stream(2, samples=10, block_size=4, seed=0))
+    >>> [block.shape for block in blocks]
+    [(4, 2), (4, 2), (2, 2)]
+    >>> design = np.vstack(blocks)
+    >>> np.sort(np.floor(design * 10), axis=0)[:, 0].astype(int).tolist()
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    """
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be at least 1, got {block_size}")
+    dtype = np.dtype(dtype)
+    if dtype not in {np.dtype(np.float32), np.dtype(np.float64)}:
+        raise ValueError(f"dtype must be float32 or float64, got {dtype}")
+    if dtype == np.float32 and samples > MAX_FLOAT32_SAMPLES:
+        raise ValueError(
+            f"float32 cannot separate more than {MAX_FLOAT32_SAMPLES} "
+            f"samples, got {samples}; use np.float64"
+        )
+
+    rng = np.random.default_rng(seed)
+    half_bits = max(1, ((samples - 1).bit_length() + 1) // 2)
+    keys = rng.integers(
+        0, 2**64, size=(n, _FEISTEL_ROUNDS), dtype=np.uint64, endpoint=False
+    )
+    return _blocks(n, samples, block_size, rng, keys, half_bits, dtype)
+
+
+def _blocks(  # noqa: PLR0913, PLR0917
+    n: int,
+    samples: int,
+    block_size: int,
+    rng: np.random.Generator,
+    keys: np.ndarray,
+    half_bits: int,
+    dtype: np.dtype,
+) -> Iterator[np.ndarray]:
+    """
+    Yield the blocks of `lhs_stream` once its arguments are validated.
+
+    Yields
+    ------
+    ndarray of shape (block_rows, n)
+        Next rows of the design.
+    """
+    for start in range(0, samples, block_size):
+        stop = min(start + block_size, samples)
+        cells = _cells(
+            np.arange(start, stop, dtype=np.uint64), keys, half_bits, samples
+        )
+        block = rng.random((stop - start, n))
+        block += cells
+        block /= samples
+        # Beyond 2**26 cells, cells + u can round up to the next cell even
+        # in float64.
+        yield round_into_cells(block, cells, samples, dtype)
@@ -25,33 +25,145 @@ from __future__ import annotations
 
 import numpy as np
 
+from pydoe.utils.restarts import run_restarts
+
 
 __all__ = ["maxpro_design"]
 
 
-def _maxpro_criterion(design: np.ndarray) -> float:
-    """Compute the MaxPro criterion for a design.
+class _MaxPro:
+    """
+    MaxPro criterion of a Latin hypercube, cached for swaps within columns.
+
+    The inverse products of squared coordinate differences of all pairs
+    are kept in cell units, where every difference is a nonzero integer.
+    Swapping the cells of rows a and b in column j only rescales the
+    products of rows a and b with the other rows, by the ratio of their
+    new and old squared differences in that column, so a swap is scored
+    and applied in O(n) without forming the (n, n, d) difference tensor.
+    """
+
+    def __init__(self, cells: np.ndarray) -> None:
+        self.cells = cells
+        n_points = cells.shape[0]
+        prod = np.ones((n_points, n_points))
+        for col in cells.T.astype(float):
+            prod *= (col[:, None] - col) ** 2
+        np.fill_diagonal(prod, np.inf)
+        self.Q = 1.0 / prod
+
+    def _ratios(
+        self, cols: np.ndarray, a: np.ndarray, b: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Factors rescaling the inverse products of rows a and b in a swap.
+
+        Returns
+        -------
+        ratio_a, ratio_b : ndarray of shape (len(cols), n)
+            Factors of the rows of a and b, one for the pair (a, b).
+        """
+        x = self.cells[:, cols].T.astype(float)
+        rows = np.arange(len(cols))
+        x_a, x_b = x[rows, a][:, None], x[rows, b][:, None]
+        old_a, old_b = x_a - x, x_b - x
+        # The zero differences of a row to itself only meet the zero
+        # diagonal of Q; the pair (a, b) keeps its squared difference.
+        old_a[rows, a] = old_b[rows, b] = 1.0
+        ratio_a, ratio_b = (old_a / old_b) ** 2, (old_b / old_a) ** 2
+        ratio_a[rows, b] = ratio_b[rows, a] = 1.0
+        return ratio_a, ratio_b
+
+    def try_swaps(
+        self, cols: np.ndarray, a: np.ndarray, b: np.ndarray
+    ) -> np.ndarray:
+        """
+        Change of the criterion for swaps of rows a and b in columns cols.
+
+        Returns
+        -------
+        ndarray of shape (len(cols),)
+            Change of the criterion, in cell units, for each swap.
+        """
+        ratio_a, ratio_b = self._ratios(cols, a, b)
+        return np.sum(self.Q[a] * (ratio_a - 1.0), axis=1) + np.sum(
+            self.Q[b] * (ratio_b - 1.0), axis=1
+        )
+
+    def swap(self, col: int, a: int, b: int) -> None:
+        """Swap the cells of rows a and b in a column."""
+        ratio_a, ratio_b = self._ratios(
+            np.array([col]), np.array([a]), np.array([b])
+        )
+        self.Q[a] *= ratio_a[0]
+        self.Q[b] *= ratio_b[0]
+        self.Q[:, a] = self.Q[a]
+        self.Q[:, b] = self.Q[b]
+        self.cells[[a, b], col] = self.cells[[b, a], col]
+
+
+def _chain(
+    n_points: int,
+    n_factors: int,
+    iterations: int,
+    batch_size: int,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, float, np.ndarray]:
+    """
+    Run one coordinate-exchange search from a random Latin hypercube.
 
     Returns
     -------
-    float
-        The MaxPro criterion value.
+    design : ndarray of shape (n_points, n_factors)
+        Design points at the cell centers.
+    value : float
+        Criterion of the design, :math:`(\\psi / \\binom{n}{2})^{1/p}`.
+    trace : ndarray of shape (iterations,)
+        Criterion after each iteration.
     """
-    diff = design[:, None, :] - design[None, :, :]
-    sq = diff**2
-    prod = np.prod(sq, axis=2)
-    n_points = design.shape[0]
-    iu = np.triu_indices(n_points, k=1)
-    return float(np.sum(1.0 / prod[iu]))
+    cells = np.empty((n_points, n_factors), dtype=int)
+    for j in range(n_factors):
+        cells[:, j] = rng.permutation(n_points)
 
+    maxpro = _MaxPro(cells)
+    # psi in cell units; the reported criterion is scaled back to the unit
+    # cube in its normalized form, which cannot overflow.
+    psi = np.sum(maxpro.Q) / 2
+    pairs = n_points * (n_points - 1) / 2
+    trace = np.full(iterations, psi)
+    # Every permutation of a single factor has the same psi, so a swap can
+    # only be accepted through rounding; the initial design is kept.
+    if n_factors == 1:
+        iterations = 0
+    cols = np.empty(batch_size, dtype=int)
+    a = np.empty(batch_size, dtype=int)
+    b = np.empty(batch_size, dtype=int)
+    for it in range(iterations):
+        for s in range(batch_size):
+            cols[s] = rng.integers(n_factors)
+            a[s], b[s] = rng.choice(n_points, size=2, replace=False)
+        change = maxpro.try_swaps(cols, a, b)
+        best = int(np.argmin(change))
+        if change[best] < 0:
+            maxpro.swap(cols[best], a[best], b[best])
+            psi += change[best]
+        trace[it] = psi
+    trace = n_points**2 * (trace / pairs) ** (1 / n_factors)
+    value = n_points**2 * (psi / pairs) ** (1 / n_factors)
+    return (cells + 0.5) / n_points, float(value), trace
 
-def maxpro_design(
+
+def maxpro_design(  # noqa: PLR0913
     n_points: int,
     n_factors: int,
     *,
     iterations: int = 200,
+    batch_size: int = 1,
+    n_restarts: int = 1,
+    n_jobs: int | None = 1,
     seed: int | np.random.Generator | None = None,
-) -> np.ndarray:
+    return_info: bool = False,
+) -> np.ndarray | tuple[np.ndarray, dict]:
     """
     Generate a maximum projection (MaxPro) design.
 
@@ -61,7 +173,12 @@ def maxpro_design(
     then refined with a coordinate-exchange local search that swaps
     pairs of cell values within a column whenever doing so reduces
     the MaxPro criterion :math:`\\psi`. The Latin hypercube structure
-    is preserved by every swap.
+    is preserved by every swap. With a single factor every Latin
+    hypercube has the same criterion, so the initial one is returned.
+
+    The inverse products of squared coordinate differences of all pairs
+    of points are cached, so a swap is scored and applied in
+    :math:`O(n)` time with :math:`O(n^2)` memory.
 
     Parameters
     ----------
@@ -72,19 +189,40 @@ def maxpro_design(
     iterations : int, optional
         Number of coordinate-exchange iterations to attempt, must be
         non-negative. Default is 200.
+    batch_size : int, optional
+        Number of random swaps scored at each iteration, must be at
+        least 1; the best of them is applied if it reduces the
+        criterion. Default is 1.
+    n_restarts : int, optional
+        Number of independent searches, must be at least 1; the design
+        with the smallest criterion is returned. Default is 1.
+    n_jobs : int or None, optional
+        Number of processes running the searches. 1 (default) runs them
+        in the calling process; None or -1 uses all CPUs. Workers are
+        spawned, so scripts using n_jobs > 1 need an
+        ``if __name__ == "__main__":`` guard.
     seed : int or numpy.random.Generator, optional
-        Seed or generator for reproducibility.
+        Seed or generator for reproducibility. The design does not depend
+        on n_jobs.
+    return_info : bool, optional
+        If True, also return the criterion traces of the searches
+        (default is False). The criterion is reported in the normalized
+        form :math:`(\\psi / \\binom{n}{2})^{1/p}` of Joseph et al.
 
     Returns
     -------
     design : ndarray of shape (n_points, n_factors)
         Design points in :math:`[0, 1)^{\\text{n\\_factors}}`.
+    info : dict
+        Only returned if `return_info` is True; see
+        `pydoe.utils.restarts.run_restarts`.
 
     Raises
     ------
     ValueError
         If ``n_points`` is less than 2, ``n_factors`` is less than 1,
-        or ``iterations`` is negative.
+        ``iterations`` is negative, ``batch_size`` or ``n_restarts`` is
+        less than 1.
 
     Examples
     --------
@@ -106,27 +244,14 @@ def maxpro_design(
         raise ValueError(f"n_factors must be at least 1, got {n_factors}")
     if iterations < 0:
         raise ValueError(f"iterations must be non-negative, got {iterations}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
 
-    rng = np.random.default_rng(seed)
-    cells = np.empty((n_points, n_factors), dtype=int)
-    for j in range(n_factors):
-        cells[:, j] = rng.permutation(n_points)
-
-    design = (cells + 0.5) / n_points
-    psi = _maxpro_criterion(design)
-
-    for _ in range(iterations):
-        j = rng.integers(n_factors)
-        r1, r2 = rng.choice(n_points, size=2, replace=False)
-
-        cells[r1, j], cells[r2, j] = cells[r2, j], cells[r1, j]
-        new_design = (cells + 0.5) / n_points
-        new_psi = _maxpro_criterion(new_design)
-
-        if new_psi < psi:
-            design = new_design
-            psi = new_psi
-        else:
-            cells[r1, j], cells[r2, j] = cells[r2, j], cells[r1, j]
-
-    return design
+    design, info = run_restarts(
+        _chain,
+        (n_points, n_factors, iterations, batch_size),
+        n_restarts=n_restarts,
+        n_jobs=n_jobs,
+        seed=seed,
+    )
+    return (design, info) if return_info else design
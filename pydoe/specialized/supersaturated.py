@@ -26,16 +26,52 @@ from __future__ import annotations
 
 import numpy as np
 
+from pydoe.utils.restarts import run_restarts
+
 
 __all__ = ["supersaturated_design"]
 
 
-def supersaturated_design(
+def _chain(
+    n_factors: int, n_runs: int, iterations: int, rng: np.random.Generator
+) -> tuple[np.ndarray | None, float, np.ndarray]:
+    """
+    Draw random designs and keep the one with the smallest E(s^2).
+
+    Returns
+    -------
+    design : ndarray of shape (n_runs, n_factors) or None
+        Best design drawn, None if no design was drawn.
+    value : float
+        E(s^2) of the design.
+    trace : ndarray of shape (iterations,)
+        Smallest E(s^2) after each draw.
+    """
+    best = None
+    best_es2 = np.inf
+    trace = np.empty(iterations)
+    for it in range(iterations):
+        X = rng.choice([-1.0, 1.0], size=(n_runs, n_factors))
+        XtX = X.T @ X
+        off_diag = XtX - np.diag(np.diag(XtX))
+        es2 = np.sum(off_diag**2) / (n_factors * (n_factors - 1))
+        if es2 < best_es2:
+            best_es2 = es2
+            best = X
+        trace[it] = best_es2
+    return best, best_es2, trace
+
+
+def supersaturated_design(  # noqa: PLR0913
     n_factors: int,
     n_runs: int,
     iterations: int = 1000,
     seed: int | np.random.Generator | None = None,
-) -> np.ndarray:
+    *,
+    n_restarts: int = 1,
+    n_jobs: int | None = 1,
+    return_info: bool = False,
+) -> np.ndarray | tuple[np.ndarray, dict]:
     r"""
     Generate a two-level supersaturated design via random search.
 
@@ -61,18 +97,34 @@ def supersaturated_design(
         Number of random candidate designs to evaluate. Defaults to
         1000.
     seed : int or numpy.random.Generator, optional
-        Seed or generator for reproducibility.
+        Seed or generator for reproducibility. The design does not depend
+        on n_jobs.
+    n_restarts : int, optional
+        Number of independent searches of ``iterations`` candidates each,
+        must be at least 1. Default is 1.
+    n_jobs : int or None, optional
+        Number of processes running the searches. 1 (default) runs them
+        in the calling process; None or -1 uses all CPUs. Workers are
+        spawned, so scripts using n_jobs > 1 need an
+        ``if __name__ == "__main__":`` guard.
+    return_info : bool, optional
+        If True, also return the :math:`E(s^2)` traces of the searches
+        (default is False).
 
     Returns
     -------
-    ndarray of shape (n_runs, n_factors)
+    design : ndarray of shape (n_runs, n_factors)
         Design matrix with coded levels -1 and 1, with the smallest
         observed :math:`E(s^2)` among the evaluated candidates.
+    info : dict
+        Only returned if `return_info` is True; see
+        `pydoe.utils.restarts.run_restarts`.
 
     Raises
     ------
     ValueError
-        If ``n_runs < 2`` or ``n_factors <= n_runs``.
+        If ``n_runs < 2``, ``n_factors <= n_runs``, or
+        ``n_restarts < 1``.
 
     Examples
     --------
@@ -90,16 +142,11 @@ def supersaturated_design(
             f"({n_runs}) for a supersaturated design"
         )
 
-    rng = np.random.default_rng(seed)
-    best = None
-    best_es2 = np.inf
-    for _ in range(iterations):
-        X = rng.choice([-1.0, 1.0], size=(n_runs, n_factors))
-        XtX = X.T @ X
-        off_diag = XtX - np.diag(np.diag(XtX))
-        es2 = np.sum(off_diag**2) / (n_factors * (n_factors - 1))
-        if es2 < best_es2:
-            best_es2 = es2
-            best = X
-
-    return best
+    design, info = run_restarts(
+        _chain,
+        (n_factors, n_runs, iterations),
+        n_restarts=n_restarts,
+        n_jobs=n_jobs,
+        seed=seed,
+    )
+    return (design, info) if return_info else design
@@ -0,0 +1,69 @@
+"""
+Rounding of stratified points into their intervals.
+
+A Latin hypercube with N samples places one point in each interval
+:math:`[c / N, (c + 1) / N)` of every factor. Computing such a point as
+:math:`(c + u) / N`, or storing it in float32, rounds to nearest and can
+move it onto the start of the next interval, or onto 1.0 in the last
+one. The designs clip their points to the first and last values of the
+dtype inside the interval, which exist while the intervals are wider
+than the spacing of the dtype.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+
+__all__ = ["MAX_FLOAT32_SAMPLES", "round_into_cells"]
+
+# Largest number of samples whose intervals all hold a float32 value: the
+# spacing of float32 in [0.5, 1) is 2**-24.
+MAX_FLOAT32_SAMPLES = 2**24
+
+
+def round_into_cells(
+    points: np.ndarray,
+    cells: np.ndarray,
+    samples: int,
+    dtype: DTypeLike | None = None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Round points to a dtype without leaving their intervals.
+
+    Parameters
+    ----------
+    points : ndarray
+        Points in :math:`[0, 1]`, usually float64.
+    cells : ndarray
+        Interval index of each point, broadcastable to `points`.
+    samples : int
+        Number of intervals of :math:`[0, 1)`.
+    dtype : {np.float64, np.float32}, optional
+        Floating point type of the result (default is the dtype of
+        `points`, or of `out` when given).
+    out : ndarray, optional
+        Array of the shape of `points` to write the result into; it may
+        be `points` itself.
+
+    Returns
+    -------
+    ndarray of the shape of points
+        Points of the dtype in ``[cells / samples, (cells + 1) / samples)``,
+        rounded to nearest unless that leaves the interval. This is `out`
+        when given.
+    """
+    if dtype is None:
+        dtype = points.dtype if out is None else out.dtype
+    dtype = np.dtype(dtype)
+    start = cells / samples
+    stop = (cells + 1) / samples
+    low = np.asarray(start.astype(dtype))
+    below = low < start
+    low[below] = np.nextafter(low[below], dtype.type(1))
+    high = np.asarray(stop.astype(dtype))
+    above = high >= stop
+    high[above] = np.nextafter(high[above], dtype.type(0))
+    return np.clip(points.astype(dtype, copy=False), low, high, out=out)
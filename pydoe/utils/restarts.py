@@ -0,0 +1,93 @@
+"""
+Independent restarts of the stochastic design searches.
+
+The randomized searches of the space-filling and screening designs end in
+a design that depends on their random stream, so they can run several
+independent chains and keep the best design. The chains run in the
+process pool of `pydoe.optimal.multistart`.
+
+The first chain uses the generator of the seed itself, so a single chain
+reproduces the design of a search without restarts; every other chain
+gets a generator spawned from the seed's `SeedSequence` before any work
+is dispatched, so the result does not depend on the number of workers.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+from pydoe.optimal.multistart import run_starts
+
+
+__all__ = ["run_restarts"]
+
+
+def _run_chain(_cset: None, chain: Callable, *args: object) -> tuple:
+    # run_starts passes a candidate set first, which chains do not use.
+    return chain(*args)
+
+
+def run_restarts(  # noqa: PLR0913
+    chain: Callable,
+    args: tuple,
+    *,
+    n_restarts: int = 1,
+    n_jobs: int | None = 1,
+    seed: int | np.random.Generator | None = None,
+    maximize: bool = False,
+) -> tuple[np.ndarray, dict]:
+    """
+    Run independent chains of a randomized search and keep the best.
+
+    Parameters
+    ----------
+    chain : callable
+        Module-level function called as ``chain(*args, rng)``, returning
+        the design, its criterion value and an array with the criterion
+        after each iteration.
+    args : tuple
+        Arguments of every chain before the random generator.
+    n_restarts : int, optional
+        Number of chains, must be at least 1 (default is 1).
+    n_jobs : int or None, optional
+        Number of processes running the chains. 1 (default) runs them in
+        the calling process; None or -1 uses all CPUs.
+    seed : int or numpy.random.Generator, optional
+        Seed or generator of the first chain, from which the generators
+        of the others are spawned.
+    maximize : bool, optional
+        Whether larger criterion values are better (default is False).
+
+    Returns
+    -------
+    design : ndarray
+        Design of the best chain; ties go to the first chain.
+    info : dict
+        Dictionary with:
+        - 'n_restarts': number of chains
+        - 'values': criterion value reached by each chain
+        - 'best_restart': index of the chain that gave the design
+        - 'traces': criterion after each iteration, one array per chain
+
+    Raises
+    ------
+    ValueError
+        If n_restarts is less than 1 or n_jobs is invalid.
+    """
+    if n_restarts < 1:
+        raise ValueError(f"n_restarts must be at least 1, got {n_restarts}")
+    rng = np.random.default_rng(seed)
+    rngs = [rng, *rng.spawn(n_restarts - 1)]
+    tasks = [(chain, *args, chain_rng) for chain_rng in rngs]
+    results = run_starts(_run_chain, tasks, n_jobs=n_jobs)
+    values = [float(value) for _, value, _ in results]
+    best = int(np.argmax(values) if maximize else np.argmin(values))
+    info = {
+        "n_restarts": n_restarts,
+        "values": values,
+        "best_restart": best,
+        "traces": [trace for _, _, trace in results],
+    }
+    return results[best][0], info
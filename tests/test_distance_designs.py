@@ -1,7 +1,7 @@
 import unittest
 
 import numpy as np
-from scipy.spatial.distance import pdist
+from scipy.spatial.distance import cdist, pdist
 
 from pydoe import maximin_design, minimax_design
 
@@ -47,6 +47,44 @@ class TestMaximinDesign(unittest.TestCase):
         with self.assertRaises(ValueError):
             maximin_design(5, 2, iterations=-1)
 
+    def test_acceptance_rules(self):
+        random_min_dist = pdist(maximin_design(20, 3, iterations=0, seed=5))
+        for acceptance in ["greedy", "annealing", "threshold"]:
+            with self.subTest(acceptance=acceptance):
+                design = maximin_design(
+                    20, 3, iterations=2000, acceptance=acceptance, seed=5
+                )
+                for j in range(3):
+                    cells = np.floor(design[:, j] * 20).astype(int)
+                    np.testing.assert_array_equal(np.sort(cells), np.arange(20))
+                self.assertGreater(pdist(design).min(), random_min_dist.min())
+
+    def test_restarts(self):
+        single = maximin_design(8, 3, iterations=100, seed=6)
+        design, info = maximin_design(
+            8, 3, iterations=100, n_restarts=3, seed=6, return_info=True
+        )
+        self.assertEqual(info["n_restarts"], 3)
+        self.assertEqual([len(t) for t in info["traces"]], [100, 100, 100])
+        best = info["best_restart"]
+        self.assertEqual(info["values"][best], max(info["values"]))
+        self.assertAlmostEqual(pdist(design).min(), info["values"][best])
+        self.assertGreaterEqual(pdist(design).min(), pdist(single).min())
+        pooled = maximin_design(
+            8, 3, iterations=100, n_restarts=3, n_jobs=2, seed=6
+        )
+        np.testing.assert_array_equal(pooled, design)
+
+    def test_invalid_n_restarts_raises(self):
+        with self.assertRaises(ValueError):
+            maximin_design(5, 2, n_restarts=0)
+
+    def test_invalid_acceptance_raises(self):
+        with self.assertRaises(ValueError):
+            maximin_design(5, 2, acceptance="tabu")
+        with self.assertRaises(ValueError):
+            maximin_design(5, 2, acceptance="annealing", temperature=0.0)
+
 
 class TestMinimaxDesign(unittest.TestCase):
     def test_shape(self):
@@ -67,6 +105,21 @@ class TestMinimaxDesign(unittest.TestCase):
         design2 = minimax_design(5, 2, n_candidates=100, seed=42)
         np.testing.assert_array_equal(design1, design2)
 
+    def test_search_reduces_covering_radius(self):
+        candidates = np.random.default_rng(3).random((2000, 3))
+
+        def radius(design):
+            return cdist(candidates, design).min(axis=1).max()
+
+        start = minimax_design(10, 3, n_candidates=2000, iterations=0, seed=3)
+        design = minimax_design(10, 3, n_candidates=2000, seed=3)
+        self.assertTrue(np.all(np.isin(design, candidates)))
+        self.assertLess(radius(design), radius(start))
+
+    def test_all_candidates_selected(self):
+        design = minimax_design(5, 2, n_candidates=5, iterations=10, seed=4)
+        self.assertEqual(np.unique(design, axis=0).shape[0], 5)
+
     def test_invalid_n_points_raises(self):
         with self.assertRaises(ValueError):
             minimax_design(0, 2)
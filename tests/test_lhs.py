@@ -1,11 +1,17 @@
 import unittest
 
 import numpy as np
+from scipy.spatial.distance import pdist
 
 from pydoe import lhs
+from pydoe.space_filling.stochastic.lhs import (
+    _PHI_P,  # noqa: PLC2701
+    _Correlation,  # noqa: PLC2701
+    _PhiP,  # noqa: PLC2701
+)
 
 
-class TestLhs(unittest.TestCase):
+class TestLhs(unittest.TestCase):  # noqa: PLR0904
     def test_lhs_vanilla_deprecated(self):
         expected = [
             [0.12484671, 0.95539205, 0.24399798],
@@ -37,10 +43,10 @@ class TestLhs(unittest.TestCase):
 
     def test_lhs_maximin_deprecated(self):
         expected = [
-            [0.69754389, 0.2997106, 0.96250964],
-            [0.10585037, 0.09872038, 0.73157522],
-            [0.25351996, 0.65148999, 0.07337204],
-            [0.91276926, 0.97873992, 0.42783549],
+            [0.09363503, 0.75514612, 0.28899863],
+            [0.92701814, 0.71654404, 0.65027875],
+            [0.39966462, 0.28900466, 0.99247746],
+            [0.5145209, 0.23767858, 0.18299849],
         ]
         with self.assertWarns(DeprecationWarning):
             actual = lhs(3, samples=4, criterion="maximin", random_state=42)
@@ -48,11 +54,11 @@ class TestLhs(unittest.TestCase):
 
     def test_lhs_correlation_deprecated(self):
         expected = [
-            [0.4846803, 0.74226839, 0.23305339, 0.97000772],
-            [0.98526018, 0.11735023, 0.75803511, 0.20312728],
-            [0.10793843, 0.2592547, 0.98299194, 0.72119199],
-            [0.25519984, 0.4789763, 0.19305106, 0.12140685],
-            [0.63976848, 0.93021541, 0.45869763, 0.40281596],
+            [0.07490802, 0.2311989, 0.14639879, 0.59398197],
+            [0.86084845, 0.19014286, 0.63636499, 0.37323523],
+            [0.23120373, 0.54161452, 0.886389, 0.6366809],
+            [0.76648853, 0.64246782, 0.21161672, 0.85824583],
+            [0.520223, 0.90495129, 0.4041169, 0.1197317],
         ]
         with self.assertWarns(DeprecationWarning):
             actual = lhs(
@@ -64,6 +70,17 @@ class TestLhs(unittest.TestCase):
             )
             np.testing.assert_allclose(actual, expected)
 
+    def test_lhs_correlation_improves_random_design(self):
+        actual = lhs(10, samples=40, criterion="correlation", seed=2)
+        cells = np.sort(np.floor(actual * 40), axis=0)
+        np.testing.assert_array_equal(
+            cells, np.tile(np.arange(40.0)[:, None], (1, 10))
+        )
+        R = np.corrcoef(actual.T) - np.eye(10)
+        R_random = np.corrcoef(lhs(10, samples=40, seed=2).T) - np.eye(10)
+        self.assertLess(np.max(np.abs(R)), 0.1)
+        self.assertLess(np.max(np.abs(R)), np.max(np.abs(R_random)))
+
     def test_lhs_lhsmu_deprecated(self):
         expected = [
             [0.78593953, 0.00628584, 0.12728208, 0.96073442],
@@ -104,21 +121,60 @@ class TestLhs(unittest.TestCase):
 
     def test_lhs_maximin(self):
         expected = [
-            [0.91547913, 0.46335077, 0.05364617],
-            [0.51457569, 0.10917935, 0.94597455],
-            [0.35213216, 0.57034597, 0.30848487],
-            [0.00770446, 0.88925804, 0.57339844],
+            [0.69028493, 0.69651608, 0.21464948],
+            [0.19348901, 0.27354434, 0.49390559],
+            [0.42434201, 0.84269951, 0.98169125],
+            [0.86259648, 0.10971961, 0.53202841],
         ]
         actual = lhs(3, samples=4, criterion="maximin", seed=42)
         np.testing.assert_allclose(actual, expected, atol=1e-6)
 
+    def test_lhs_maximin_improves_random_design(self):
+        for criterion in ["maximin", "centermaximin"]:
+            with self.subTest(criterion=criterion):
+                actual = lhs(4, samples=60, criterion=criterion, seed=3)
+                cells = np.sort(np.floor(actual * 60), axis=0)
+                np.testing.assert_array_equal(
+                    cells, np.tile(np.arange(60.0)[:, None], (1, 4))
+                )
+                random = lhs(4, samples=60, criterion="center", seed=3)
+                self.assertGreater(pdist(actual).min(), pdist(random).min())
+
+    def test_phi_p_cache_follows_swaps(self):
+        H = lhs(3, samples=12, criterion="center", seed=0)
+        criterion = _PhiP(H.copy())
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            i = rng.integers(12, size=5)
+            k = (i + 1 + rng.integers(11, size=5)) % 12
+            value = criterion.try_swaps(int(rng.integers(3)), i, k)
+            criterion.swap(value)
+            # The criterion is scaled by the initial minimum distance.
+            fresh = np.sum(pdist(criterion.H) ** -_PHI_P) ** (1 / _PHI_P)
+            np.testing.assert_allclose(
+                criterion.value / np.sqrt(criterion._scale), fresh, rtol=1e-5
+            )
+
+    def test_correlation_cache_follows_swaps(self):
+        H = lhs(4, samples=12, criterion="center", seed=0)
+        criterion = _Correlation(H.copy())
+        rng = np.random.default_rng(2)
+        for _ in range(200):
+            i = rng.integers(12, size=5)
+            k = (i + 1 + rng.integers(11, size=5)) % 12
+            value = criterion.try_swaps(int(rng.integers(4)), i, k)
+            criterion.swap(value)
+            R = np.corrcoef(criterion.H, rowvar=False)
+            fresh = np.sum(np.triu(R, k=1) ** 2) / 6
+            np.testing.assert_allclose(criterion.value, fresh, atol=1e-12)
+
     def test_lhs_correlation(self):
         expected = [
-            [0.15479121, 0.49007719, 0.68868284, 0.35721286],
-            [0.21883547, 0.39512447, 0.4741596, 0.64544774],
-            [0.42562273, 0.08777569, 0.35222794, 0.92633288],
-            [0.91091696, 0.76455232, 0.96552623, 0.585353],
-            [0.72877302, 0.81276345, 0.17171958, 0.13947361],
+            [0.21883547, 0.76455232, 0.96552623, 0.35721286],
+            [0.91091696, 0.81276345, 0.4741596, 0.64544774],
+            [0.72877302, 0.08777569, 0.68868284, 0.585353],
+            [0.15479121, 0.49007719, 0.35222794, 0.92633288],
+            [0.42562273, 0.39512447, 0.17171958, 0.13947361],
         ]
         actual = lhs(
             4, samples=5, criterion="correlation", iterations=10, seed=42
@@ -135,3 +191,74 @@ class TestLhs(unittest.TestCase):
         ]
         actual = lhs(4, samples=5, criterion="lhsmu", seed=42)
         np.testing.assert_allclose(actual, expected)
+
+    def test_lhs_out(self):
+        out = np.empty((6, 4))
+        actual = lhs(4, samples=6, seed=42, out=out)
+        self.assertIs(actual, out)
+        np.testing.assert_array_equal(out, lhs(4, samples=6, seed=42))
+        out = np.empty((5, 2))
+        lhs(2, samples=5, criterion="maximin", seed=42, out=out)
+        np.testing.assert_array_equal(
+            out, lhs(2, samples=5, criterion="maximin", seed=42)
+        )
+
+    def test_lhs_float32(self):
+        for criterion in [None, "center"]:
+            with self.subTest(criterion=criterion):
+                actual = lhs(
+                    3, samples=8, criterion=criterion, seed=1, dtype=np.float32
+                )
+                self.assertEqual(actual.dtype, np.float32)
+                # One point in each of the 8 intervals of every factor
+                cells = np.sort(np.floor(actual * 8), axis=0)
+                np.testing.assert_array_equal(
+                    cells, np.tile(np.arange(8.0)[:, None], (1, 3))
+                )
+
+    def test_lhs_float32_is_latin_hypercube(self):
+        # Rounding to float32 moved points of these seeds onto the next
+        # interval, or onto 1.0.
+        samples = 3000
+        for criterion, iterations in [
+            (None, None),
+            ("center", None),
+            ("maximin", 1),
+            ("correlation", None),
+            ("lhsmu", None),
+        ]:
+            for seed in (3, 9, 14):
+                with self.subTest(criterion=criterion, seed=seed):
+                    actual = lhs(
+                        4,
+                        samples=samples,
+                        criterion=criterion,
+                        iterations=iterations,
+                        seed=seed,
+                        dtype=np.float32,
+                    )
+                    self.assertTrue(bool(np.all(actual < 1.0)))
+                    cells = np.floor(actual.astype(np.float64) * samples)
+                    np.testing.assert_array_equal(
+                        np.sort(cells, axis=0),
+                        np.tile(np.arange(samples)[:, None], (1, 4)),
+                    )
+
+    def test_lhs_float32_sample_limit(self):
+        with self.assertRaises(ValueError):
+            lhs(1, samples=2**24 + 1, dtype=np.float32)
+
+    def test_lhs_invalid_buffer(self):
+        with self.assertRaises(ValueError):
+            lhs(3, samples=4, out=np.empty((3, 4)))
+        with self.assertRaises(ValueError):
+            lhs(3, samples=4, dtype=np.float32, out=np.empty((4, 3)))
+        with self.assertRaises(ValueError):
+            lhs(3, samples=4, dtype=int)
+
+    def test_lhs_lhsmu_is_latin_hypercube(self):
+        actual = lhs(3, samples=200, criterion="lhsmu", seed=7)
+        cells = np.sort(np.floor(actual * 200), axis=0)
+        np.testing.assert_array_equal(
+            cells, np.tile(np.arange(200.0)[:, None], (1, 3))
+        )
@@ -0,0 +1,101 @@
+import unittest
+from fractions import Fraction
+
+import numpy as np
+
+from pydoe import lhs_stream
+
+
+class TestLhsStream(unittest.TestCase):
+    def test_block_shapes(self):
+        blocks = list(lhs_stream(3, 10, block_size=4, seed=0))
+        self.assertEqual(
+            [block.shape for block in blocks], [(4, 3), (4, 3), (2, 3)]
+        )
+
+    def test_full_design_is_latin_hypercube(self):
+        for samples in [1, 2, 7, 64, 1000]:
+            with self.subTest(samples=samples):
+                design = np.vstack(
+                    list(lhs_stream(3, samples, block_size=5, seed=samples))
+                )
+                self.assertTrue(bool(np.all(design >= 0.0)))
+                self.assertTrue(bool(np.all(design < 1.0)))
+                for j in range(3):
+                    cells = np.floor(design[:, j] * samples).astype(int)
+                    np.testing.assert_array_equal(
+                        np.sort(cells), np.arange(samples)
+                    )
+
+    def test_independent_of_block_size(self):
+        small = np.vstack(list(lhs_stream(4, 100, block_size=7, seed=1)))
+        large = np.vstack(list(lhs_stream(4, 100, block_size=100, seed=1)))
+        np.testing.assert_array_equal(small, large)
+
+    def test_columns_are_shuffled(self):
+        design = np.vstack(list(lhs_stream(2, 1000, block_size=300, seed=2)))
+        corr = np.corrcoef(np.column_stack([design, np.arange(1000)]).T)
+        self.assertLess(np.max(np.abs(corr[np.triu_indices(3, 1)])), 0.1)
+
+    def test_float32(self):
+        design = np.vstack(
+            list(lhs_stream(2, 50, block_size=20, seed=3, dtype=np.float32))
+        )
+        self.assertEqual(design.dtype, np.float32)
+        reference = np.vstack(list(lhs_stream(2, 50, block_size=20, seed=3)))
+        np.testing.assert_allclose(design, reference, atol=1e-7)
+
+    def test_float32_stays_latin(self):
+        # Rounding to nearest moves points of narrow intervals onto the
+        # next one, and points near 1 onto 1.0.
+        samples = 10**6
+        design = np.vstack(
+            list(lhs_stream(1, samples, block_size=2**18, seed=5, dtype="f4"))
+        )
+        self.assertTrue(bool(np.all(design < 1.0)))
+        cells = np.floor(design[:, 0].astype(np.float64) * samples)
+        np.testing.assert_array_equal(
+            np.sort(cells.astype(int)), np.arange(samples)
+        )
+
+    def test_float64_stays_latin_near_cell_ends(self):
+        class _NearOne(np.random.Generator):
+            def random(self, size=None, dtype=np.float64, out=None):
+                return np.full(size, 1 - 2**-28)
+
+        class _Zero(np.random.Generator):
+            def random(self, size=None, dtype=np.float64, out=None):
+                return np.zeros(size)
+
+        # Large cells, where cell + u rounds up to cell + 1.
+        samples = 10**8
+        design = next(
+            lhs_stream(2, samples, 1000, _NearOne(np.random.PCG64(0)))
+        )
+        starts = next(lhs_stream(2, samples, 1000, _Zero(np.random.PCG64(0))))
+        cells = np.rint(starts * samples).astype(int)
+        self.assertTrue(bool(np.all(design < 1.0)))
+        # floor(x * samples) itself rounds at this size; compare exactly.
+        for x, cell in zip(design.ravel(), cells.ravel(), strict=True):
+            self.assertLess(
+                Fraction(float(x)), Fraction(int(cell) + 1, samples)
+            )
+            self.assertGreaterEqual(
+                Fraction(float(x)), Fraction(int(cell), samples)
+            )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            lhs_stream(0, 10)
+        with self.assertRaises(ValueError):
+            lhs_stream(2, 0)
+        with self.assertRaises(ValueError):
+            lhs_stream(2, 10, block_size=0)
+        with self.assertRaises(ValueError):
+            lhs_stream(2, 10, dtype=int)
+        with self.assertRaises(ValueError):
+            lhs_stream(2, 2**24 + 1, dtype=np.float32)
+
+
+if __name__ == "__main__":
+    unittest.main()
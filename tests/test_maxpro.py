@@ -37,6 +37,35 @@ class TestMaxproDesign(unittest.TestCase):
         design_opt = maxpro_design(n_points, n_factors, iterations=200, seed=0)
         self.assertLessEqual(_psi(design_opt), _psi(design_0))
 
+    def test_batch_improves_criterion(self):
+        design_0 = maxpro_design(10, 4, iterations=0, seed=3)
+        design_opt = maxpro_design(10, 4, iterations=100, batch_size=5, seed=3)
+        self.assertLess(_psi(design_opt), _psi(design_0))
+        for j in range(design_opt.shape[1]):
+            cells = np.floor(design_opt[:, j] * 10).astype(int)
+            np.testing.assert_array_equal(np.sort(cells), np.arange(10))
+
+    def test_restarts(self):
+        single = maxpro_design(8, 3, iterations=100, seed=7)
+        design, info = maxpro_design(
+            8, 3, iterations=100, n_restarts=3, seed=7, return_info=True
+        )
+        best = info["best_restart"]
+        self.assertEqual(info["values"][best], min(info["values"]))
+        for trace in info["traces"]:
+            self.assertEqual(len(trace), 100)
+            self.assertTrue(np.all(np.diff(trace) <= 0))
+        self.assertLessEqual(_psi(design), _psi(single))
+
+    def test_single_factor_keeps_initial_design(self):
+        # Every permutation of one factor has the same criterion.
+        design, info = maxpro_design(
+            7, 1, iterations=300, seed=2, return_info=True
+        )
+        cells = np.random.default_rng(2).permutation(7)
+        np.testing.assert_allclose(design[:, 0], (cells + 0.5) / 7)
+        self.assertEqual(np.ptp(info["traces"][0]), 0.0)
+
     def test_reproducible_with_seed(self):
         design1 = maxpro_design(5, 2, iterations=50, seed=42)
         design2 = maxpro_design(5, 2, iterations=50, seed=42)
@@ -54,6 +83,10 @@ class TestMaxproDesign(unittest.TestCase):
         with self.assertRaises(ValueError):
             maxpro_design(5, 2, iterations=-1)
 
+    def test_invalid_batch_size_raises(self):
+        with self.assertRaises(ValueError):
+            maxpro_design(5, 2, batch_size=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,11 @@ def _max_abs_corr(design):
     return float(np.max(np.abs(corr[mask])))
 
 
+def _sum_sq_corr(design):
+    corr = np.corrcoef(design, rowvar=False)
+    return float(np.sum(np.triu(corr, k=1) ** 2))
+
+
 class TestNearlyOrthogonalLhs(unittest.TestCase):
     def test_shape(self):
         design = nearly_orthogonal_lhs(8, 3, iterations=50, seed=0)
@@ -41,6 +46,30 @@ class TestNearlyOrthogonalLhs(unittest.TestCase):
             _max_abs_corr(design_optimized), _max_abs_corr(design_initial)
         )
 
+    def test_sum_squares_criterion(self):
+        design_initial = nearly_orthogonal_lhs(16, 6, iterations=0, seed=4)
+        design_optimized = nearly_orthogonal_lhs(
+            16, 6, iterations=500, criterion="sum_squares", seed=4
+        )
+        self.assertLess(
+            _sum_sq_corr(design_optimized), _sum_sq_corr(design_initial)
+        )
+
+    def test_restarts(self):
+        single = nearly_orthogonal_lhs(10, 4, iterations=100, seed=5)
+        best, info = nearly_orthogonal_lhs(
+            10, 4, iterations=100, n_restarts=3, seed=5, return_info=True
+        )
+        self.assertLessEqual(_max_abs_corr(best), _max_abs_corr(single))
+        self.assertAlmostEqual(
+            _max_abs_corr(best), info["values"][info["best_restart"]]
+        )
+        self.assertEqual(len(info["traces"]), 3)
+        pooled = nearly_orthogonal_lhs(
+            10, 4, iterations=100, n_restarts=3, n_jobs=2, seed=5
+        )
+        np.testing.assert_array_equal(pooled, best)
+
     def test_single_factor(self):
         n_points = 6
         design = nearly_orthogonal_lhs(n_points, 1, seed=3)
@@ -65,6 +94,14 @@ class TestNearlyOrthogonalLhs(unittest.TestCase):
         with self.assertRaises(ValueError):
             nearly_orthogonal_lhs(5, 2, iterations=-1)
 
+    def test_invalid_criterion_raises(self):
+        with self.assertRaises(ValueError):
+            nearly_orthogonal_lhs(5, 2, criterion="mean")
+
+    def test_invalid_n_restarts_raises(self):
+        with self.assertRaises(ValueError):
+            nearly_orthogonal_lhs(5, 2, n_restarts=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,31 +1,43 @@
+import itertools
 import unittest
 
 import numpy as np
 
 from pydoe import (
+    CandidateSet,
+    PolynomialModel,
     a_efficiency,
     a_optimality,
+    approximate_design,
+    blocked_design,
     build_design_matrix,
     build_uniform_moment_matrix,
     c_optimality,
+    coordinate_exchange,
     criterion_value,
+    criterion_value_batch,
     d_efficiency,
     d_optimality,
     detmax,
     e_optimality,
+    efficient_rounding,
     fedorov,
     g_optimality,
     generate_candidate_set,
     i_optimality,
     information_matrix,
+    iter_candidate_set,
     modified_fedorov,
     optimal_design,
     s_optimality,
     sequential_dykstra,
     simple_exchange_wynn_mitchell,
+    split_plot_design,
     t_optimality,
     v_optimality,
 )
+from pydoe.optimal.criterion import regularized_inv
+from pydoe.optimal.updates import BlockedInformationState, InformationState
 
 
 class TestOptimalDesign(unittest.TestCase):  # noqa: PLR0904
@@ -184,6 +196,45 @@ class TestOptimalDesign(unittest.TestCase):  # noqa: PLR0904
         actual = a_efficiency(X)
         self.assertAlmostEqual(actual, expected)
 
+    def test_log_d_optimality(self):
+        M = np.array([[2.0, 0.5], [0.5, 1.0]])
+        self.assertAlmostEqual(
+            d_optimality(M, log=True), np.log(np.linalg.det(M))
+        )
+        self.assertEqual(d_optimality(np.zeros((2, 2)), log=True), -np.inf)
+
+    def test_large_model_criteria_do_not_underflow(self):
+        X = np.random.default_rng(0).uniform(-0.01, 0.01, size=(400, 120))
+        M = information_matrix(X)
+        self.assertEqual(d_optimality(M), 0.0)
+        self.assertTrue(np.isfinite(d_optimality(M, log=True)))
+        self.assertGreater(d_efficiency(X), 0.0)
+        self.assertAlmostEqual(
+            d_efficiency(100 * X) / 1e4, d_efficiency(X), places=8
+        )
+
+    def test_regularized_inv(self):
+        M = np.array([[4.0, 1.0, 0.5], [1.0, 3.0, 0.2], [0.5, 0.2, 2.0]])
+        np.testing.assert_allclose(regularized_inv(M), np.linalg.inv(M))
+        singular = np.array([[1.0, 1.0], [1.0, 1.0]])
+        np.testing.assert_allclose(
+            regularized_inv(singular),
+            np.linalg.inv(singular + 1e-8 * np.eye(2)),
+        )
+        nonsymmetric = np.array([[2.0, 1.0], [0.0, 3.0]])
+        np.testing.assert_allclose(
+            regularized_inv(nonsymmetric), np.linalg.inv(nonsymmetric)
+        )
+
+    def test_exchange_on_small_region(self):
+        # det(M) underflows to 0 on this region, so the search compares
+        # log-determinants.
+        candidates = generate_candidate_set(
+            n_factors=5, n_levels=3, bounds=(-0.01, 0.01)
+        )
+        design = fedorov(candidates, 30, 2, "D", 0.0, 20)
+        self.assertGreater(d_efficiency(build_design_matrix(design, 2)), 0.0)
+
     def test_sequential_dykstra_algorithm(self):
         design = sequential_dykstra(
             self.candidates_2d, n_points=6, degree=2, criterion="D", alpha=0.01
@@ -1016,5 +1067,1006 @@ class TestOptimalDesign(unittest.TestCase):  # noqa: PLR0904
             )
 
 
+class TestInformationState(unittest.TestCase):
+    def setUp(self):
+        candidates = generate_candidate_set(n_factors=2, n_levels=5)
+        self.X0 = build_design_matrix(candidates, degree=2)
+        self.M_moment = build_uniform_moment_matrix(self.X0)
+        self.X = self.X0[[0, 4, 12, 20, 24, 2, 10, 14]]
+
+    def _exact_swap_values(self, criterion, alpha):
+        values = np.empty((self.X.shape[0], self.X0.shape[0]))
+        for i in range(self.X.shape[0]):
+            for j in range(self.X0.shape[0]):
+                trial = self.X.copy()
+                trial[i] = self.X0[j]
+                values[i, j] = criterion_value(
+                    trial, criterion, self.X0, alpha, self.M_moment
+                )
+        return values
+
+    def test_swap_values_match_exact_evaluation(self):
+        for criterion in ["D", "A", "I", "C", "V"]:
+            for alpha in [0.0, 0.05]:
+                with self.subTest(criterion=criterion, alpha=alpha):
+                    state = InformationState(
+                        self.X, criterion, self.X0, alpha, self.M_moment
+                    )
+                    self.assertTrue(state.uses_updates)
+                    expected = self._exact_swap_values(criterion, alpha)
+                    actual = state.swap_values(
+                        np.arange(self.X.shape[0]), self.X0
+                    )
+                    finite = np.isfinite(actual)
+                    np.testing.assert_allclose(
+                        actual[finite], expected[finite], rtol=1e-8, atol=1e-10
+                    )
+
+    def test_swap_updates_inverse_and_log_determinant(self):
+        state = InformationState(self.X, "A", self.X0, 0.01, self.M_moment)
+        for row, j in [(0, 6), (3, 18), (5, 7), (0, 1)]:
+            state.swap(row, self.X0[j])
+        H = state.X.T @ state.X + 0.01 * (self.X0.T @ self.X0) / len(self.X0)
+        np.testing.assert_allclose(state.H, H, atol=1e-12)
+        np.testing.assert_allclose(state.H_inv, np.linalg.inv(H), atol=1e-10)
+        self.assertAlmostEqual(state.logdet, np.linalg.slogdet(H)[1])
+
+    def test_add_and_drop_values_match_exact_evaluation(self):
+        for criterion in ["D", "A", "I", "C", "V"]:
+            with self.subTest(criterion=criterion):
+                state = InformationState(
+                    self.X, criterion, self.X0, 0.05, self.M_moment
+                )
+                expected_add = [
+                    criterion_value(
+                        np.vstack([self.X, y]),
+                        criterion,
+                        self.X0,
+                        0.05,
+                        self.M_moment,
+                    )
+                    for y in self.X0
+                ]
+                expected_drop = [
+                    criterion_value(
+                        np.delete(self.X, i, axis=0),
+                        criterion,
+                        self.X0,
+                        0.05,
+                        self.M_moment,
+                    )
+                    for i in range(self.X.shape[0])
+                ]
+                np.testing.assert_allclose(
+                    state.add_values(self.X0), expected_add, rtol=1e-8
+                )
+                np.testing.assert_allclose(
+                    state.drop_values(), expected_drop, rtol=1e-8
+                )
+
+    def test_add_and_drop_update_state(self):
+        state = InformationState(self.X, "D", self.X0, 0.0, self.M_moment)
+        state.add(self.X0[6])
+        state.drop(2)
+        expected = np.delete(np.vstack([self.X, self.X0[6]]), 2, axis=0)
+        np.testing.assert_allclose(state.X, expected)
+        np.testing.assert_allclose(
+            state.H_inv, np.linalg.inv(expected.T @ expected), atol=1e-10
+        )
+
+    def test_sequential_start_is_nonsingular(self):
+        candidates = generate_candidate_set(n_factors=3, n_levels=3)
+        for criterion in ["D", "A", "I"]:
+            with self.subTest(criterion=criterion):
+                design = sequential_dykstra(candidates, 10, 2, criterion)
+                X = build_design_matrix(design, degree=2)
+                self.assertEqual(np.linalg.matrix_rank(X), X.shape[1])
+                self.assertEqual(len(np.unique(design, axis=0)), 10)
+
+    def test_log_det_values(self):
+        state = InformationState(self.X, "D", self.X0, 0.0, log_det=True)
+        plain = InformationState(self.X, "D", self.X0, 0.0)
+        self.assertAlmostEqual(state.value(), np.log(plain.value()))
+        rows = np.arange(self.X.shape[0])
+        with np.errstate(divide="ignore"):
+            expected = np.log(plain.swap_values(rows, self.X0))
+        np.testing.assert_allclose(
+            state.swap_values(rows, self.X0), expected, atol=1e-10
+        )
+
+    def test_g_optimality_updates(self):
+        for alpha, screen in itertools.product([0.0, 0.05], [None, 3]):
+            with self.subTest(alpha=alpha, g_screen=screen):
+                state = InformationState(
+                    self.X, "G", self.X0, alpha, g_screen=screen
+                )
+                self.assertTrue(state.uses_updates)
+                expected = self._exact_swap_values("G", alpha)
+                actual = state.swap_values(np.arange(self.X.shape[0]), self.X0)
+                finite = np.isfinite(actual)
+                np.testing.assert_allclose(
+                    actual[finite], expected[finite], rtol=1e-8
+                )
+                # Screening only skips swaps that cannot be the best.
+                self.assertAlmostEqual(np.max(actual), np.max(expected))
+                expected_add = [
+                    criterion_value(np.vstack([self.X, y]), "G", self.X0, alpha)
+                    for y in self.X0
+                ]
+                np.testing.assert_allclose(
+                    state.add_values(self.X0), expected_add, rtol=1e-8
+                )
+
+    def test_g_variances_follow_updates(self):
+        state = InformationState(self.X, "G", self.X0, 0.0)
+        for row, j in [(0, 6), (3, 18), (5, 7)]:
+            state.swap(row, self.X0[j])
+        state.add(self.X0[11])
+        state.drop(1)
+        self.assertAlmostEqual(
+            state.value(), criterion_value(state.X, "G", self.X0)
+        )
+        variances = np.einsum(
+            "ij,jk,ik->i", self.X0, np.linalg.inv(state.H), self.X0
+        )
+        np.testing.assert_allclose(state._var, variances, atol=1e-10)
+
+    def test_unsupported_criterion_uses_exact_values(self):
+        state = InformationState(self.X, "E", self.X0, 0.01, self.M_moment)
+        self.assertFalse(state.uses_updates)
+        np.testing.assert_allclose(
+            state.swap_values(np.arange(self.X.shape[0]), self.X0),
+            self._exact_swap_values("E", 0.01),
+        )
+
+    def test_singular_design_uses_exact_values(self):
+        state = InformationState(self.X[:3], "D", self.X0, 0.0, self.M_moment)
+        self.assertFalse(state.uses_updates)
+
+
+class TestIndexBasedDesigns(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(n_factors=2, n_levels=3)
+        self.algorithms = [
+            sequential_dykstra,
+            simple_exchange_wynn_mitchell,
+            fedorov,
+            modified_fedorov,
+            detmax,
+        ]
+
+    def test_designs_without_replacement_have_no_replicates(self):
+        for algorithm in self.algorithms:
+            for criterion in ["D", "C", "V", "G"]:
+                with self.subTest(
+                    algorithm=algorithm.__name__, criterion=criterion
+                ):
+                    design = algorithm(self.candidates, 8, 2, criterion, 0.05)
+                    self.assertEqual(len(np.unique(design, axis=0)), 8)
+
+    def test_replacement_allows_replicated_runs(self):
+        for algorithm in self.algorithms:
+            with self.subTest(algorithm=algorithm.__name__):
+                design = algorithm(self.candidates, 12, 1, replacement=True)
+                self.assertEqual(design.shape, (12, 2))
+                self.assertLess(len(np.unique(design, axis=0)), 12)
+                for row in design:
+                    self.assertTrue(
+                        np.any(np.all(self.candidates == row, axis=1))
+                    )
+
+    def test_too_many_points_without_replacement(self):
+        with self.assertRaises(ValueError):
+            sequential_dykstra(self.candidates, 10, 1)
+        _, info = optimal_design(
+            self.candidates, 10, 1, method="fedorov", replacement=True
+        )
+        self.assertEqual(info["n_runs"], 10)
+
+    def test_duplicate_candidates_are_distinct(self):
+        candidates = np.vstack([self.candidates, self.candidates[:2]])
+        design = fedorov(candidates, 11, 1)
+        self.assertEqual(design.shape, (11, 2))
+        self.assertEqual(len(np.unique(design, axis=0)), 9)
+
+
+class TestCoordinateExchange(unittest.TestCase):
+    def test_discrete_region_matches_exchange_quality(self):
+        candidates = generate_candidate_set(n_factors=3, n_levels=3)
+        reference = d_efficiency(
+            build_design_matrix(detmax(candidates, 12, 2), degree=2)
+        )
+        design = coordinate_exchange(3, 12, 2, levels=3, seed=0)
+        self.assertEqual(design.shape, (12, 3))
+        self.assertTrue(np.all(np.isin(design, [-1.0, 0.0, 1.0])))
+        X = build_design_matrix(design, degree=2)
+        self.assertGreater(d_efficiency(X), 0.95 * reference)
+
+    def test_continuous_and_mixed_factors_respect_bounds(self):
+        design = coordinate_exchange(
+            3,
+            10,
+            2,
+            "I",
+            bounds=[(0, 1), (-2, 2), (5, 10)],
+            levels=[None, None, [5, 7.5, 10]],
+            seed=1,
+        )
+        self.assertTrue(np.all((design[:, 0] >= 0) & (design[:, 0] <= 1)))
+        self.assertTrue(np.all((design[:, 1] >= -2) & (design[:, 1] <= 2)))
+        self.assertTrue(np.all(np.isin(design[:, 2], [5, 7.5, 10])))
+
+    def test_many_factors(self):
+        design = coordinate_exchange(30, 32, 1, levels=2, max_iter=5, seed=2)
+        X = build_design_matrix(design, degree=1)
+        self.assertEqual(design.shape, (32, 30))
+        self.assertGreater(d_efficiency(X), 80.0)
+
+    def test_determinant_underflow(self):
+        # On this small region det(M) of the quadratic model is far below
+        # the smallest double, so the search must work with log det(M).
+        reference = coordinate_exchange(8, 50, 2, levels=3, max_iter=3, seed=3)
+        design = coordinate_exchange(
+            8, 50, 2, bounds=(-0.001, 0.001), levels=3, max_iter=3, seed=3
+        )
+        self.assertEqual(
+            np.linalg.det(
+                information_matrix(build_design_matrix(design, degree=2))
+            ),
+            0.0,
+        )
+        self.assertGreater(
+            d_efficiency(build_design_matrix(1000 * design, degree=2)),
+            0.95 * d_efficiency(build_design_matrix(reference, degree=2)),
+        )
+
+    def test_seed_reproducibility(self):
+        first = coordinate_exchange(4, 8, 1, "A", seed=5)
+        np.testing.assert_array_equal(
+            first, coordinate_exchange(4, 8, 1, "A", seed=5)
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            coordinate_exchange(3, 10, 2, "G")
+        with self.assertRaises(ValueError):
+            coordinate_exchange(3, 10, 2, n_grid=1)
+        with self.assertRaises(ValueError):
+            coordinate_exchange(3, 10, 2, levels=[3, 3])
+
+    def test_region_moment_matrix_matches_candidate_grid(self):
+        candidates = generate_candidate_set(3, bounds=(0, 2), n_levels=4)
+        design, info = optimal_design(
+            candidates, 24, 3, "I", "coordinate_exchange", seed=0
+        )
+        X0 = build_design_matrix(candidates, degree=3)
+        expected = criterion_value(build_design_matrix(design, 3), "I", X0)
+        self.assertAlmostEqual(info["score"], expected)
+
+    def test_optimal_design_coordinate_exchange(self):
+        design, info = optimal_design(
+            None, 10, 2, "D", "coordinate_exchange", n_factors=3, seed=0
+        )
+        self.assertEqual(design.shape, (10, 3))
+        self.assertEqual(info["method"], "coordinate_exchange")
+        self.assertGreater(info["score"], 0.0)
+
+        candidates = generate_candidate_set(n_factors=2, n_levels=5)
+        design, info = optimal_design(
+            candidates, 8, 2, "I", "coordinate_exchange", seed=0
+        )
+        self.assertTrue(np.all(np.isin(design, candidates[:, 0])))
+        self.assertLess(info["score"], 0.0)
+
+    def test_optimal_design_coordinate_exchange_errors(self):
+        with self.assertRaises(ValueError):
+            optimal_design(None, 10, 2, method="coordinate_exchange")
+        with self.assertRaises(ValueError):
+            optimal_design(None, 10, 2, method="coordinate_exchange", alpha=0.1)
+
+
+class TestCandidateSet(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(n_factors=2, n_levels=5)
+        self.cset = CandidateSet(self.candidates, degree=2)
+
+    def tearDown(self):
+        CandidateSet.clear_cache()
+
+    def test_precomputed_matrices(self):
+        X0 = build_design_matrix(self.candidates, degree=2)
+        np.testing.assert_array_equal(self.cset.points, self.candidates)
+        np.testing.assert_array_equal(self.cset.X0, X0)
+        np.testing.assert_allclose(
+            self.cset.M_moment, build_uniform_moment_matrix(X0)
+        )
+        np.testing.assert_allclose(self.cset.H0, X0.T @ X0 / len(X0))
+        self.assertEqual(len(self.cset), len(self.candidates))
+        self.assertFalse(self.cset.X0.flags.writeable)
+
+    def test_criterion_value_accepts_candidate_set(self):
+        X = build_design_matrix(self.candidates[::3], degree=2)
+        X0 = self.cset.X0
+        for criterion in ["D", "A", "I", "G", "V"]:
+            with self.subTest(criterion=criterion):
+                self.assertAlmostEqual(
+                    criterion_value(X, criterion, self.cset, 0.05),
+                    criterion_value(X, criterion, X0, 0.05),
+                )
+
+    def test_algorithms_accept_candidate_set(self):
+        for algorithm in [
+            sequential_dykstra,
+            simple_exchange_wynn_mitchell,
+            fedorov,
+            modified_fedorov,
+            detmax,
+        ]:
+            with self.subTest(algorithm=algorithm.__name__):
+                np.testing.assert_array_equal(
+                    algorithm(self.cset, 8, 2, "A", 0.01),
+                    algorithm(self.candidates, 8, 2, "A", 0.01),
+                )
+
+    def test_optimal_design_accepts_candidate_set(self):
+        design, info = optimal_design(self.cset, 8, 2, method="fedorov")
+        expected, expected_info = optimal_design(
+            self.candidates, 8, 2, method="fedorov"
+        )
+        np.testing.assert_array_equal(design, expected)
+        self.assertEqual(info, expected_info)
+
+    def test_degree_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            optimal_design(self.cset, 8, degree=1)
+
+    def test_cached_returns_shared_instance(self):
+        first = CandidateSet.cached(self.candidates, 2)
+        self.assertIs(CandidateSet.cached(self.candidates.copy(), 2), first)
+        self.assertIsNot(CandidateSet.cached(self.candidates, 1), first)
+        self.assertIsNot(CandidateSet.cached(self.candidates + 1, 2), first)
+
+    def test_cache_is_bounded(self):
+        size = CandidateSet.cache_size
+        try:
+            CandidateSet.cache_size = 2
+            first = CandidateSet.cached(self.candidates, 1)
+            CandidateSet.cached(self.candidates, 2)
+            CandidateSet.cached(self.candidates, 3)
+            self.assertIsNot(CandidateSet.cached(self.candidates, 1), first)
+        finally:
+            CandidateSet.cache_size = size
+
+
+class TestMultiStart(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(3, n_levels=5)
+
+    def test_single_start_is_deterministic_greedy_start(self):
+        design, info = optimal_design(self.candidates, 12, 2, method="fedorov")
+        self.assertEqual(info["n_starts"], 1)
+        self.assertEqual(info["start_scores"], [info["score"]])
+        self.assertEqual(info["best_start"], 0)
+        np.testing.assert_array_equal(
+            design, fedorov(self.candidates, 12, 2, "D", 0.0, 200)
+        )
+
+    def test_best_start_is_kept(self):
+        for method in ("sequential", "fedorov", "detmax"):
+            with self.subTest(method=method):
+                _, single = optimal_design(
+                    self.candidates, 12, 2, method=method
+                )
+                _, info = optimal_design(
+                    self.candidates, 12, 2, method=method, n_starts=4, seed=0
+                )
+                self.assertEqual(len(info["start_scores"]), 4)
+                self.assertEqual(info["start_scores"][0], single["score"])
+                self.assertEqual(info["score"], max(info["start_scores"]))
+                self.assertGreaterEqual(info["score"], single["score"])
+
+    def test_result_does_not_depend_on_n_jobs(self):
+        kwargs = {"method": "modified_fedorov", "n_starts": 4, "seed": 7}
+        design, info = optimal_design(self.candidates, 12, 2, **kwargs)
+        pooled, pooled_info = optimal_design(
+            self.candidates, 12, 2, n_jobs=2, **kwargs
+        )
+        np.testing.assert_array_equal(design, pooled)
+        self.assertEqual(info, pooled_info)
+
+    def test_coordinate_exchange_starts(self):
+        kwargs = {
+            "method": "coordinate_exchange",
+            "n_factors": 3,
+            "n_starts": 3,
+            "seed": 1,
+        }
+        design, info = optimal_design(None, 12, 2, **kwargs)
+        pooled, _ = optimal_design(None, 12, 2, n_jobs=2, **kwargs)
+        np.testing.assert_array_equal(design, pooled)
+        self.assertEqual(len(info["start_scores"]), 3)
+
+    def test_seeded_algorithms_are_reproducible(self):
+        first = detmax(self.candidates, 12, 2, "D", 0.0, 50, seed=3)
+        second = detmax(self.candidates, 12, 2, "D", 0.0, 50, seed=3)
+        np.testing.assert_array_equal(first, second)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            optimal_design(self.candidates, 12, 2, n_starts=0)
+        with self.assertRaises(ValueError):
+            optimal_design(self.candidates, 12, 2, n_starts=2, n_jobs=0)
+
+
+class TestCandidateBlocks(unittest.TestCase):
+    def test_factorial_grid_order(self):
+        bounds = [(-1, 1), (0, 2), (5, 6)]
+        levels = [np.linspace(low, high, 4) for low, high in bounds]
+        np.testing.assert_array_equal(
+            generate_candidate_set(3, bounds=bounds, n_levels=4),
+            np.array(list(itertools.product(*levels))),
+        )
+
+    def test_blocks_stack_to_full_candidate_set(self):
+        full = generate_candidate_set(3, n_levels=4)
+        blocks = list(iter_candidate_set(3, n_levels=4, chunk_size=10))
+        self.assertEqual([len(block) for block in blocks], [10] * 6 + [4])
+        np.testing.assert_array_equal(np.vstack(blocks), full)
+
+    def test_random_blocks_match_candidate_set(self):
+        np.random.seed(0)
+        full = generate_candidate_set(
+            2, bounds=[(0, 1), (2, 5)], grid_type="uniform_random"
+        )
+        np.random.seed(0)
+        blocks = iter_candidate_set(
+            2, bounds=[(0, 1), (2, 5)], grid_type="uniform_random", chunk_size=4
+        )
+        np.testing.assert_array_equal(np.vstack(list(blocks)), full)
+
+    def test_model_matrix_blocks(self):
+        X0 = build_design_matrix(generate_candidate_set(3, n_levels=5), 2)
+        X = X0[::11]
+        M = information_matrix(X)
+        self.assertAlmostEqual(
+            g_optimality(
+                M, iter_candidate_set(3, n_levels=5, chunk_size=7, degree=2)
+            ),
+            g_optimality(M, X0),
+        )
+        np.testing.assert_allclose(
+            build_uniform_moment_matrix(
+                iter_candidate_set(3, n_levels=5, chunk_size=7, degree=2)
+            ),
+            build_uniform_moment_matrix(X0),
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            iter_candidate_set(2, chunk_size=0)
+        with self.assertRaises(ValueError):
+            iter_candidate_set(2, grid_type="sobol")
+        with self.assertRaises(ValueError):
+            iter_candidate_set(2, bounds=[(0, 1)] * 3)
+
+
+class TestPolynomialModel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(-1, 1, size=(1000, 4))
+
+    def test_polynomial_matches_design_matrix(self):
+        for degree in (1, 2, 3, 4):
+            with self.subTest(degree=degree):
+                model = PolynomialModel.polynomial(4, degree)
+                expected = build_design_matrix(self.points, degree)
+                np.testing.assert_array_equal(
+                    model.evaluate(self.points), expected
+                )
+                np.testing.assert_array_equal(
+                    model.evaluate(self.points[:10]), expected[:10]
+                )
+                np.testing.assert_array_equal(
+                    model.evaluate(self.points[3]), expected[3]
+                )
+
+    def test_custom_terms(self):
+        model = PolynomialModel.from_terms(4, [(), (2,), (0, 0, 1), (3, 3)])
+        x = self.points
+        expected = np.column_stack([
+            np.ones(len(x)),
+            x[:, 2],
+            x[:, 0] ** 2 * x[:, 1],
+            x[:, 3] ** 2,
+        ])
+        np.testing.assert_allclose(build_design_matrix(x, model), expected)
+
+    def test_interactions_and_scheffe(self):
+        self.assertEqual(len(PolynomialModel.interactions(4)), 11)
+        self.assertEqual(len(PolynomialModel.interactions(4, order=1)), 5)
+        scheffe = PolynomialModel.scheffe(3, 3)
+        self.assertEqual(len(scheffe), 7)
+        self.assertFalse(np.any(scheffe.exponents > 1))
+        with self.assertRaises(ValueError):
+            PolynomialModel.scheffe(3, 4)
+
+    def test_out_and_dtype(self):
+        model = PolynomialModel.polynomial(4, 2)
+        out = np.empty((1000, len(model)), dtype=np.float32)
+        result = model.evaluate(self.points, out=out)
+        self.assertIs(result, out)
+        np.testing.assert_allclose(
+            out, build_design_matrix(self.points, 2), rtol=1e-6, atol=1e-6
+        )
+        self.assertEqual(
+            model.evaluate(self.points, dtype=np.float32).dtype, np.float32
+        )
+
+    def test_model_as_degree(self):
+        model = PolynomialModel.scheffe(3, 2)
+        mixtures = np.array([
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1],
+            [0.5, 0.5, 0],
+            [0.5, 0, 0.5],
+            [0, 0.5, 0.5],
+            [1 / 3, 1 / 3, 1 / 3],
+        ])
+        design, info = optimal_design(mixtures, 6, model, method="fedorov")
+        self.assertEqual(design.shape, (6, 3))
+        self.assertEqual(info["p_columns"], 6)
+        self.assertIs(
+            CandidateSet.cached(mixtures, model),
+            CandidateSet.cached(mixtures, PolynomialModel.scheffe(3, 2)),
+        )
+        design, _ = optimal_design(
+            None,
+            8,
+            PolynomialModel.interactions(3),
+            method="coordinate_exchange",
+            n_factors=3,
+            seed=0,
+        )
+        self.assertEqual(design.shape, (8, 3))
+
+    def test_invalid_models(self):
+        with self.assertRaises(ValueError):
+            PolynomialModel([[0, 1], [0, 1]])
+        with self.assertRaises(ValueError):
+            PolynomialModel([[0, -1]])
+        with self.assertRaises(ValueError):
+            PolynomialModel.from_terms(2, [(2,)])
+        with self.assertRaises(ValueError):
+            build_design_matrix(self.points, PolynomialModel.polynomial(3, 2))
+
+
+class TestCriterionValueBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        candidates = generate_candidate_set(n_factors=3, n_levels=3)
+        self.cset = CandidateSet(candidates, 2)
+        X0 = self.cset.X0
+        self.X_stack = np.array([
+            X0[rng.choice(len(X0), 12, replace=False)] for _ in range(20)
+        ])
+
+    def test_matches_criterion_value(self):
+        cases = [(None, 0.0), (self.cset.X0, 0.1), (self.cset, 0.0)]
+        for criterion in "DAICEGVS":
+            for X0, alpha in cases:
+                if criterion == "I" and X0 is None:
+                    continue
+                with self.subTest(criterion=criterion, alpha=alpha):
+                    expected = [
+                        criterion_value(X, criterion, X0, alpha)
+                        for X in self.X_stack
+                    ]
+                    np.testing.assert_allclose(
+                        criterion_value_batch(
+                            self.X_stack, criterion, X0, alpha
+                        ),
+                        expected,
+                        rtol=1e-8,
+                        atol=1e-12,
+                    )
+
+    def test_singular_designs_are_regularized(self):
+        X_stack = self.X_stack.copy()
+        X_stack[3] = X_stack[3, [0] * 12]
+        expected = [criterion_value(X, "A") for X in X_stack]
+        np.testing.assert_allclose(
+            criterion_value_batch(X_stack, "A"), expected, rtol=1e-8
+        )
+
+    def test_keyword_arguments(self):
+        c = np.arange(10.0)
+        points = self.cset.X0[:5]
+        np.testing.assert_allclose(
+            criterion_value_batch(self.X_stack, "C", c_vector=c),
+            [criterion_value(X, "C", c_vector=c) for X in self.X_stack],
+        )
+        np.testing.assert_allclose(
+            criterion_value_batch(self.X_stack, "V", test_points=points),
+            [criterion_value(X, "V", test_points=points) for X in self.X_stack],
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            criterion_value_batch(self.X_stack[0], "D")
+        with self.assertRaises(ValueError):
+            criterion_value_batch(self.X_stack, "T")
+        with self.assertRaises(ValueError):
+            criterion_value_batch(self.X_stack, "I")
+
+
+class TestApproximateDesign(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(n_factors=3, n_levels=5)
+
+    def test_quadratic_line(self):
+        # The D-optimal quadratic design on [-1, 1] puts 1/3 on -1, 0, 1.
+        candidates = np.linspace(-1, 1, 21).reshape(-1, 1)
+        weights, info = approximate_design(candidates, degree=2)
+        self.assertTrue(info["converged"])
+        expected = np.zeros(21)
+        expected[[0, 10, 20]] = 1 / 3
+        np.testing.assert_allclose(weights, expected, atol=1e-4)
+
+    def test_multiplicative_converges(self):
+        for criterion in "DAI":
+            with self.subTest(criterion=criterion):
+                weights, info = approximate_design(
+                    self.candidates, 2, criterion, tol=1e-4
+                )
+                self.assertTrue(info["converged"])
+                self.assertGreaterEqual(info["efficiency_bound"], 1 - 1e-4)
+                self.assertAlmostEqual(weights.sum(), 1.0)
+                self.assertTrue(np.all(weights >= 0))
+                np.testing.assert_array_equal(
+                    info["support"], np.flatnonzero(weights)
+                )
+
+    def test_vertex_direction_improves(self):
+        cset = CandidateSet(self.candidates, 2)
+        for criterion in "DA":
+            with self.subTest(criterion=criterion):
+                _, start = approximate_design(
+                    cset, 2, criterion, "vertex_direction", max_iter=0
+                )
+                _, info = approximate_design(
+                    cset, 2, criterion, "vertex_direction", max_iter=200
+                )
+                self.assertGreater(
+                    info["efficiency_bound"], start["efficiency_bound"]
+                )
+
+    def test_optimal_design_approximate(self):
+        design, info = optimal_design(
+            self.candidates, 15, 2, method="approximate"
+        )
+        self.assertEqual(design.shape, (15, 3))
+        _, greedy_info = optimal_design(
+            self.candidates, 15, 2, method="sequential"
+        )
+        # Rounding loses a little efficiency relative to exchange searches.
+        self.assertGreater(info["D_eff"], 0.9 * greedy_info["D_eff"])
+        with self.assertRaises(ValueError):
+            optimal_design(
+                self.candidates, 15, 2, method="approximate", alpha=0.5
+            )
+
+    def test_efficient_rounding(self):
+        np.testing.assert_array_equal(
+            efficient_rounding(np.array([0.5, 0.3, 0.2]), 7), [3, 2, 2]
+        )
+        rng = np.random.default_rng(0)
+        for n in (1, 5, 13, 40):
+            weights = rng.dirichlet(np.ones(10))
+            if n < 10:
+                # The support must be truncated without a model to span.
+                with self.assertWarns(UserWarning):
+                    counts = efficient_rounding(weights, n)
+            else:
+                counts = efficient_rounding(weights, n)
+            self.assertEqual(counts.sum(), n)
+            self.assertTrue(np.all(counts >= 0))
+
+    def test_rounding_keeps_model_spanned(self):
+        # The optimal weights have 27 support points for p = 10 parameters.
+        candidates = generate_candidate_set(n_factors=3, n_levels=4)
+        for n in range(10, 16):
+            with self.subTest(n=n):
+                design, info = optimal_design(
+                    candidates, n, 2, method="approximate"
+                )
+                X = build_design_matrix(design, 2)
+                self.assertEqual(np.linalg.matrix_rank(X), 10)
+                self.assertGreater(info["D_eff"], 0.0)
+
+    def test_deletion_keeps_optimal_support(self):
+        # D-optimal supports: -1, 0, 1 for a quadratic on a line, the full
+        # 3 x 3 grid for a quadratic in two factors, and the first four of
+        # five points for a cubic, where a relative gap dropped 0.71.
+        cases = (
+            (np.linspace(-1, 1, 21).reshape(-1, 1), 2, [0, 10, 20]),
+            (generate_candidate_set(n_factors=2, n_levels=3), 2, range(9)),
+            (np.array([[-0.32], [0.71], [0.48], [0.9], [0.68]]), 3, range(4)),
+        )
+        for candidates, degree, support in cases:
+            for max_iter in range(1, 60):
+                weights, _ = approximate_design(
+                    candidates, degree, max_iter=max_iter
+                )
+                self.assertTrue(np.all(weights[list(support)] > 0))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            approximate_design(self.candidates, 2, "E")
+        with self.assertRaises(ValueError):
+            approximate_design(self.candidates, 2, method="newton")
+        with self.assertRaises(ValueError):
+            approximate_design(self.candidates[:3], 2)
+        with self.assertRaises(ValueError):
+            efficient_rounding(np.zeros(3), 4)
+        with self.assertRaises(ValueError):
+            efficient_rounding(np.ones(3), 0)
+
+
+class TestSearchControls(unittest.TestCase):
+    def setUp(self):
+        candidates = generate_candidate_set(n_factors=4, n_levels=5)
+        self.cset = CandidateSet(candidates, 2)
+        self.methods = (fedorov, modified_fedorov, detmax)
+
+    def test_defaults_unchanged(self):
+        for method in self.methods:
+            with self.subTest(method=method.__name__):
+                np.testing.assert_array_equal(
+                    method(self.cset, 20, 2),
+                    method(self.cset, 20, 2, first_improvement=False),
+                )
+
+    def test_options_give_valid_designs(self):
+        options = (
+            {"first_improvement": True},
+            {"max_candidates": 50, "seed": 1},
+            {"tol_relative": 1e-2},
+            {"time_budget": 10.0},
+        )
+        full = d_efficiency(build_design_matrix(fedorov(self.cset, 20, 2), 2))
+        for method, kwargs in itertools.product(self.methods, options):
+            with self.subTest(method=method.__name__, **kwargs):
+                design = method(self.cset, 20, 2, **kwargs)
+                self.assertEqual(design.shape, (20, 4))
+                self.assertEqual(len(np.unique(design, axis=0)), 20)
+                X = build_design_matrix(design, 2)
+                self.assertGreater(d_efficiency(X), 0.8 * full)
+
+    def test_subsampling_reproducible(self):
+        a = fedorov(self.cset, 20, 2, max_candidates=40, seed=3)
+        b = fedorov(self.cset, 20, 2, max_candidates=40, seed=3)
+        np.testing.assert_array_equal(a, b)
+
+    def test_callback_cancels(self):
+        for method in self.methods:
+            with self.subTest(method=method.__name__):
+                calls = []
+
+                def callback(progress, calls=calls):
+                    calls.append(progress)
+                    return True
+
+                method(self.cset, 20, 2, callback=callback)
+                self.assertEqual(len(calls), 1)
+                self.assertEqual(calls[0]["iteration"], 1)
+                self.assertIn("value", calls[0])
+                self.assertGreaterEqual(calls[0]["elapsed"], 0.0)
+
+    def test_time_budget(self):
+        # The budget expires during the greedy start, so the search stops
+        # at its first check.
+        design = fedorov(self.cset, 20, 2, time_budget=1e-9)
+        greedy = sequential_dykstra(self.cset, 20, 2)
+        np.testing.assert_array_equal(design, greedy)
+
+    def test_optimal_design_options(self):
+        design, _ = optimal_design(
+            self.cset, 20, 2, method="detmax", tol_relative=1e-3, n_starts=2
+        )
+        self.assertEqual(design.shape, (20, 4))
+        with self.assertRaises(ValueError):
+            optimal_design(self.cset, 20, 2, time_budget=1.0)
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"time_budget": 0.0},
+            {"tol_relative": -1.0},
+            {"max_candidates": 0},
+        ):
+            with self.subTest(**kwargs), self.assertRaises(ValueError):
+                fedorov(self.cset, 20, 2, **kwargs)
+
+
+class TestBlockedDesigns(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(n_factors=3, n_levels=3)
+        self.X0 = build_design_matrix(self.candidates, 2)
+        self.M_moment = build_uniform_moment_matrix(self.X0)
+
+    def _gls_information(self, X, blocks, eta):
+        Z = np.eye(blocks.max() + 1)[blocks]
+        if eta is None:
+            V_inv = np.eye(len(X)) - Z @ np.linalg.pinv(Z)
+        else:
+            V_inv = np.linalg.inv(np.eye(len(X)) + eta * Z @ Z.T)
+        return X.T @ V_inv @ X
+
+    def test_state_matches_gls(self):
+        rng = np.random.default_rng(0)
+        blocks = np.repeat(np.arange(4), [5, 5, 4, 6])
+        idx = rng.choice(len(self.X0), 20)
+        for eta, cols in ((None, slice(1, None)), (1.5, slice(None))):
+            X0 = self.X0[:, cols]
+            M_moment = self.M_moment[cols, cols]
+            for criterion in "DI":
+                with self.subTest(eta=eta, criterion=criterion):
+                    state = BlockedInformationState(
+                        X0[idx], blocks, criterion, M_moment, variance_ratio=eta
+                    )
+                    np.testing.assert_allclose(
+                        state.H, self._gls_information(X0[idx], blocks, eta)
+                    )
+                    values = state.swap_values(7, X0)
+                    for j in (0, 5, 13):
+                        X = X0[idx].copy()
+                        X[7] = X0[j]
+                        H = self._gls_information(X, blocks, eta) / len(X)
+                        if criterion == "D":
+                            expected = np.linalg.slogdet(H)[1]
+                        else:
+                            expected = -np.trace(M_moment @ np.linalg.inv(H))
+                        self.assertAlmostEqual(values[j], expected, places=8)
+
+    def test_state_swaps_without_drift(self):
+        rng = np.random.default_rng(1)
+        blocks = np.repeat(np.arange(3), 6)
+        X0 = self.X0[:, 1:]
+        idx = rng.choice(len(X0), 18)
+        state = BlockedInformationState(
+            X0[idx], blocks, "I", self.M_moment[1:, 1:]
+        )
+        for _ in range(40):
+            state.swap(int(rng.integers(18)), X0[rng.integers(len(X0))])
+        fresh = BlockedInformationState(
+            state.X, blocks, "I", self.M_moment[1:, 1:]
+        )
+        self.assertAlmostEqual(state.value(), fresh.value(), places=8)
+
+    def test_blocked_design(self):
+        for effects, criterion in itertools.product(("fixed", "random"), "DI"):
+            with self.subTest(effects=effects, criterion=criterion):
+                design, blocks = blocked_design(
+                    self.candidates,
+                    [6, 6, 5],
+                    2,
+                    criterion,
+                    block_effects=effects,
+                )
+                self.assertEqual(design.shape, (17, 3))
+                np.testing.assert_array_equal(np.bincount(blocks), [6, 6, 5])
+
+    def test_blocked_beats_post_hoc_blocking(self):
+        design, blocks = blocked_design(self.candidates, [6, 6, 6], 2)
+        blocked = BlockedInformationState(
+            build_design_matrix(design, 2)[:, 1:], blocks
+        )
+        unblocked, _ = optimal_design(self.candidates, 18, 2, method="detmax")
+        post_hoc = BlockedInformationState(
+            build_design_matrix(unblocked, 2)[:, 1:], np.repeat([0, 1, 2], 6)
+        )
+        self.assertGreater(blocked.value(), post_hoc.value())
+
+    def test_split_plot_design(self):
+        for criterion in "DI":
+            with self.subTest(criterion=criterion):
+                design, plots = split_plot_design(
+                    self.candidates, 6, 3, 2, [0], criterion, seed=0
+                )
+                self.assertEqual(design.shape, (18, 3))
+                for w in range(6):
+                    self.assertEqual(len(np.unique(design[plots == w, 0])), 1)
+                X = build_design_matrix(design, 2)
+                self.assertGreater(np.linalg.matrix_rank(X), 9)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            blocked_design(self.candidates, [6, 6], 2, "A")
+        with self.assertRaises(ValueError):
+            blocked_design(self.candidates, [6, 0], 2)
+        with self.assertRaises(ValueError):
+            blocked_design(self.candidates, [6, 6], 2, block_effects="mixed")
+        with self.assertRaises(ValueError):
+            split_plot_design(self.candidates, 6, 3, 2, [3])
+        with self.assertRaises(ValueError):
+            split_plot_design(self.candidates, 0, 3, 2, [0])
+
+
+class TestFixedPoints(unittest.TestCase):
+    def setUp(self):
+        self.candidates = generate_candidate_set(n_factors=3, n_levels=3)
+        self.cset = CandidateSet(self.candidates, 2)
+        self.fixed = self.candidates[[0, 4, 8, 13]]
+
+    def test_state_includes_fixed_rows(self):
+        rng = np.random.default_rng(0)
+        X0 = self.cset.X0
+        F = build_design_matrix(self.fixed, 2)
+        for criterion in "DAICV":
+            with self.subTest(criterion=criterion):
+                idx = rng.choice(len(X0), 10, replace=False)
+                state = InformationState(
+                    X0[idx], criterion, self.cset, 0.1, fixed=F
+                )
+                self.assertEqual(state.n, 14)
+                X = np.vstack([F, X0[idx]])
+                self.assertAlmostEqual(
+                    state.value(),
+                    criterion_value(X, criterion, self.cset, 0.1),
+                    places=8,
+                )
+                X[7] = X0[5]
+                self.assertAlmostEqual(
+                    state.swap_values(3, X0[5:6])[0, 0],
+                    criterion_value(X, criterion, self.cset, 0.1),
+                    places=8,
+                )
+
+    def test_algorithms_keep_fixed_points(self):
+        algorithms = (
+            sequential_dykstra,
+            simple_exchange_wynn_mitchell,
+            fedorov,
+            modified_fedorov,
+            detmax,
+        )
+        for algorithm in algorithms:
+            with self.subTest(algorithm=algorithm.__name__):
+                design = algorithm(self.cset, 14, 2, fixed_points=self.fixed)
+                self.assertEqual(design.shape, (14, 3))
+                np.testing.assert_array_equal(design[:4], self.fixed)
+        design = coordinate_exchange(
+            3, 14, 2, levels=3, seed=0, fixed_points=self.fixed
+        )
+        np.testing.assert_array_equal(design[:4], self.fixed)
+
+    def test_augmentation_improves_on_fixed_runs(self):
+        design, info = optimal_design(
+            self.cset, 14, 2, method="detmax", fixed_points=self.fixed
+        )
+        np.testing.assert_array_equal(design[:4], self.fixed)
+        self.assertGreater(info["D_eff"], 0.0)
+        # Augmenting a good design should not do worse than its start.
+        base, _ = optimal_design(self.cset, 10, 2, method="detmax")
+        augmented, _ = optimal_design(
+            self.cset, 14, 2, method="fedorov", fixed_points=base
+        )
+        np.testing.assert_array_equal(augmented[:10], base)
+        self.assertGreater(
+            d_optimality(information_matrix(build_design_matrix(augmented, 2))),
+            0.0,
+        )
+
+    def test_invalid_fixed_points(self):
+        with self.assertRaises(ValueError):
+            fedorov(self.cset, 4, 2, fixed_points=self.fixed)
+        with self.assertRaises(ValueError):
+            fedorov(self.cset, 10, 2, fixed_points=self.fixed[:, :2])
+        with self.assertRaises(ValueError):
+            optimal_design(
+                self.cset, 10, 2, method="approximate", fixed_points=self.fixed
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -57,6 +57,21 @@ class TestSupersaturatedDesign(unittest.TestCase):
         d2 = supersaturated_design(8, 4, iterations=50, seed=42)
         np.testing.assert_array_equal(d1, d2)
 
+    def test_restarts(self):
+        design, info = supersaturated_design(
+            8, 4, iterations=50, n_restarts=2, seed=3, return_info=True
+        )
+        trace = info["traces"][info["best_restart"]]
+        self.assertEqual(trace[-1], min(info["values"]))
+        self.assertTrue(np.all(np.diff(trace) <= 0))
+        XtX = design.T @ design
+        es2 = (np.sum(XtX**2) - np.sum(np.diag(XtX) ** 2)) / (8 * 7)
+        self.assertAlmostEqual(es2, trace[-1])
+        pooled = supersaturated_design(
+            8, 4, iterations=50, n_restarts=2, n_jobs=2, seed=3
+        )
+        np.testing.assert_array_equal(pooled, design)
+
     def test_raises_n_runs_too_small(self):
         with self.assertRaises(ValueError):
             supersaturated_design(8, 1)